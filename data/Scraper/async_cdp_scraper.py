@@ -0,0 +1,606 @@
+"""
+Async Chrome DevTools Protocol Scraper for Pokhara Google Reviews
+=================================================================
+An asyncio alternative to GoogleMapsSeleniumScraper. It talks to one Chrome
+over the DevTools protocol (CDP) and scrapes many places concurrently, each in
+its own tab and browser context, with an asyncio.Semaphore capping how many
+run at once (config.ASYNC_CDP_CONCURRENCY).
+
+It runs the same in-page scripts as the Selenium scraper (page_scripts.py)
+and writes through the same output sink, so the CSV schema is identical.
+It also shares the Selenium scraper's state store: the job journal (so
+--resume works), the per-place high-water marks of incremental runs and the
+dedupe index. File and database writes run on one I/O thread, off the event
+loop.
+
+Offline testing: serve captured Maps pages with local_maps_server.py and pass
+--base-url http://127.0.0.1:8765/maps.
+
+Usage:
+    python async_cdp_scraper.py [--concurrency 4] [--base-url URL] [--debugger-url ws://...] [--resume]
+
+Author: AI Assistant
+Date: 2026-01-17
+"""
+
+import argparse
+import asyncio
+import functools
+import itertools
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import quote
+
+import websockets
+
+try:
+    import config
+except ImportError:
+    # If running from within Scraper directory
+    import sys
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    import config
+
+from browser_pool import find_chrome_binary
+from output_sink import make_sink
+from page_scripts import (CARD_KEYS_SCRIPT, COUNT_SEEN_CARDS_SCRIPT, EXPAND_MORE_SCRIPT,
+                          EXTRACT_REVIEWS_SCRIPT, FIND_SCROLL_CONTAINER_SCRIPT, FIRST_CARD_REPLACED_SCRIPT,
+                          MARK_FIRST_CARD_SCRIPT, PROBE_SELECTORS_SCRIPT, SCROLL_AND_WAIT_SCRIPT)
+from retry_policy import ERROR_SELECTOR_MISSING, PlaceFailure, classify_error
+from reviews import build_review, drop_known_reviews, parse_rating, review_fingerprint
+from scroll_controller import AdaptiveScrollController
+from selector_registry import SelectorRegistry
+from state_store import ScrapeStateStore, JOB_DONE, JOB_FAILED, JOB_RUNNING
+
+
+class CDPError(Exception):
+    """Error returned by a CDP command"""
+
+
+class ElementHandle:
+    """A page element kept between script calls (a CDP remote object id)"""
+
+    def __init__(self, object_id):
+        self.object_id = object_id
+
+
+# =============================================================================
+# CDP CONNECTION
+# =============================================================================
+
+class CDPConnection:
+    """One websocket to the browser, multiplexing flattened target sessions"""
+
+    def __init__(self, ws_url):
+        self.ws_url = ws_url
+        self.ws = None
+        self._ids = itertools.count(1)
+        self._pending = {}
+        # sessionId -> callable(method, params) receiving that session's events
+        self._event_handlers = {}
+        self._reader = None
+
+    async def connect(self):
+        # Review payloads and page_source-sized results can be large
+        self.ws = await websockets.connect(self.ws_url, max_size=None)
+        self._reader = asyncio.create_task(self._read_loop())
+
+    async def _read_loop(self):
+        """Route command responses to the coroutine waiting for them, and events to their session"""
+        try:
+            async for raw in self.ws:
+                message = json.loads(raw)
+                if 'id' not in message:
+                    handler = self._event_handlers.get(message.get('sessionId'))
+                    if handler:
+                        handler(message.get('method'), message.get('params', {}))
+                    continue
+                future = self._pending.pop(message['id'], None)
+                if future is None or future.done():
+                    continue
+                if 'error' in message:
+                    future.set_exception(CDPError(message['error'].get('message', message['error'])))
+                else:
+                    future.set_result(message.get('result', {}))
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(CDPError("DevTools connection closed"))
+            self._pending.clear()
+
+    async def send(self, method, params=None, session_id=None, timeout=30):
+        """Send a CDP command and wait for its result"""
+        message_id = next(self._ids)
+        message = {'id': message_id, 'method': method, 'params': params or {}}
+        if session_id:
+            message['sessionId'] = session_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message_id] = future
+        try:
+            await self.ws.send(json.dumps(message))
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            # A timed-out command would otherwise stay pending for good
+            self._pending.pop(message_id, None)
+
+    async def close(self):
+        if self.ws:
+            await self.ws.close()
+        if self._reader:
+            await self._reader
+
+
+class CDPTab:
+    """A page target attached through a flattened session"""
+
+    def __init__(self, conn, target_id, session_id, context_id):
+        self.conn = conn
+        self.target_id = target_id
+        self.session_id = session_id
+        self.context_id = context_id
+        # Seconds spent in wait_for, like the Selenium ReadinessWaiter timings
+        self.wait_seconds = 0.0
+        # Bytes and responses received, from Network.loadingFinished events
+        self.page_bytes = 0
+        self.page_requests = 0
+
+    @classmethod
+    async def open(cls, conn):
+        """Open a blank tab in a fresh browser context and attach to it"""
+        context = await conn.send('Target.createBrowserContext', {'disposeOnDetach': True})
+        context_id = context['browserContextId']
+        target = await conn.send('Target.createTarget',
+                                 {'url': 'about:blank', 'browserContextId': context_id})
+        attached = await conn.send('Target.attachToTarget',
+                                   {'targetId': target['targetId'], 'flatten': True})
+        tab = cls(conn, target['targetId'], attached['sessionId'], context_id)
+        conn._event_handlers[tab.session_id] = tab._on_event
+        await tab.send('Page.enable')
+        await tab.send('Runtime.enable')
+        await tab.send('Network.enable')
+        return tab
+
+    def _on_event(self, method, params):
+        if method == 'Network.loadingFinished':
+            # Bytes received for the response, also for cross-origin ones
+            self.page_bytes += int(params.get('encodedDataLength', 0))
+            self.page_requests += 1
+
+    async def send(self, method, params=None, timeout=30):
+        return await self.conn.send(method, params, session_id=self.session_id, timeout=timeout)
+
+    async def navigate(self, url):
+        await self.send('Page.navigate', {'url': url})
+
+    async def run_script(self, script, *args):
+        """Run a Selenium-style script (uses `return` and `arguments`) and return its value"""
+        result = await self._call(f"function(){{{script}\n}}", args)
+        return result.get('value')
+
+    async def run_async_script(self, script, *args):
+        """Run a Selenium-style async script, which passes its result to the last argument"""
+        declaration = ("function(){var args = Array.prototype.slice.call(arguments);"
+                       "return new Promise(function(done){"
+                       f"(function(){{{script}\n}}).apply(null, args.concat([done]));}});}}")
+        result = await self._call(declaration, args)
+        return result.get('value')
+
+    async def find_element(self, script, *args):
+        """Run a script returning an element; returns an ElementHandle, or None for null"""
+        result = await self._call(f"function(){{{script}\n}}", args, by_value=False)
+        return ElementHandle(result['objectId']) if result.get('objectId') else None
+
+    async def _call(self, declaration, args, by_value=True):
+        """Call a JS function with args (JSON values or ElementHandles); returns the RemoteObject"""
+        handles = [arg for arg in args if isinstance(arg, ElementHandle)]
+        if handles:
+            # Element handles can only be passed by Runtime.callFunctionOn
+            result = await self.send('Runtime.callFunctionOn', {
+                'functionDeclaration': declaration,
+                'objectId': handles[0].object_id,
+                'arguments': [{'objectId': arg.object_id} if isinstance(arg, ElementHandle) else {'value': arg}
+                              for arg in args],
+                'returnByValue': by_value,
+                'awaitPromise': True,
+            })
+        else:
+            result = await self.send('Runtime.evaluate', {
+                'expression': f"({declaration}).apply(null, {json.dumps(list(args))})",
+                'returnByValue': by_value,
+                'awaitPromise': True,
+            })
+        if 'exceptionDetails' in result:
+            raise CDPError(result['exceptionDetails'].get('text', 'script error'))
+        return result.get('result', {})
+
+    async def wait_for(self, script, *args, timeout=10, poll_interval=None):
+        """Poll a script until it returns a truthy value; returns it, or False on timeout"""
+        if poll_interval is None:
+            poll_interval = getattr(config, 'WEB_SCRAPE_POLL_INTERVAL', 0.1)
+        start = time.monotonic()
+        deadline = start + timeout
+        try:
+            while True:
+                try:
+                    value = await self.run_script(script, *args)
+                except CDPError:
+                    value = None  # Page still navigating
+                if value:
+                    return value
+                if time.monotonic() >= deadline:
+                    return False
+                await asyncio.sleep(poll_interval)
+        finally:
+            self.wait_seconds += time.monotonic() - start
+
+    async def close(self):
+        self.conn._event_handlers.pop(self.session_id, None)
+        try:
+            await self.conn.send('Target.closeTarget', {'targetId': self.target_id})
+            await self.conn.send('Target.disposeBrowserContext', {'browserContextId': self.context_id})
+        except CDPError:
+            pass
+
+
+# =============================================================================
+# SCRAPER
+# =============================================================================
+
+# Small readiness probes evaluated inside the page
+ANY_PRESENT_SCRIPT = """
+for (var i = 0; i < arguments[0].length; i++) {
+    if (document.querySelector(arguments[0][i])) return true;
+}
+return false;
+"""
+# Number of cards matching arguments[1] once there are more than arguments[0], else 0
+COUNT_ABOVE_SCRIPT = "var n = document.querySelectorAll(arguments[1]).length; return n > arguments[0] ? n : 0;"
+
+
+class AsyncMapsScraper:
+    """Concurrent CDP scraper with the same output as GoogleMapsSeleniumScraper"""
+
+    def __init__(self, output_dir='pokhara_reviews', concurrency=None, base_url=None,
+                 debugger_url=None, chrome_binary=None):
+        self.output_dir = output_dir
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.concurrency = concurrency or getattr(config, 'ASYNC_CDP_CONCURRENCY', 4)
+        self.base_url = (base_url or config.MAPS_BASE_URL).rstrip('/')
+        # ws:// URL of an already running browser; otherwise Chrome is launched
+        self.debugger_url = debugger_url
+        self.chrome_binary = chrome_binary or getattr(config, 'CHROME_BINARY', None)
+        self.timeouts = dict(getattr(config, 'WEB_SCRAPE_WAIT_TIMEOUTS', {}))
+        self.all_reviews = []
+        self.places_data = []
+        # Job journal, high-water marks and dedupe index (see state_store.py)
+        self.state = ScrapeStateStore.for_output_dir(self.output_dir)
+        self.sink = make_sink(self.output_dir, state=self.state)
+        # Sink and state writes run here, one at a time and off the event loop
+        self._io = ThreadPoolExecutor(max_workers=1)
+        # Learned selector order, shared by all tabs (kept in memory)
+        self.selectors = SelectorRegistry()
+        self._chrome = None
+        self._profile_dir = None
+
+    # ------------------------------------------------------------------ browser
+
+    def _launch_chrome(self):
+        """Start Chrome with remote debugging and return its browser ws:// URL"""
+        binary = self.chrome_binary or find_chrome_binary()
+
+        self._profile_dir = tempfile.mkdtemp(prefix='pokhara_cdp_')
+        args = [binary, '--remote-debugging-port=0', f'--user-data-dir={self._profile_dir}',
+                '--no-first-run', '--no-default-browser-check']
+        args += [opt for opt in getattr(config, 'CHROME_OPTIONS', []) if opt != '--start-maximized']
+        self._chrome = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        # Chrome writes the chosen port and browser path once it is listening
+        port_file = os.path.join(self._profile_dir, 'DevToolsActivePort')
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if os.path.exists(port_file):
+                with open(port_file) as f:
+                    lines = f.read().split()
+                if len(lines) >= 2:
+                    return f"ws://127.0.0.1:{lines[0]}{lines[1]}"
+            time.sleep(0.1)
+        raise RuntimeError("Chrome did not open a DevTools port in time")
+
+    def _stop_chrome(self):
+        if self._chrome:
+            self._chrome.terminate()
+            try:
+                self._chrome.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._chrome.kill()
+            self._chrome = None
+        if self._profile_dir:
+            shutil.rmtree(self._profile_dir, ignore_errors=True)
+            self._profile_dir = None
+
+    # ------------------------------------------------------------------ steps
+
+    def _timeout(self, step):
+        return self.timeouts.get(step, 10)
+
+    async def _offload(self, func, *args, **kwargs):
+        """Run a blocking sink or state call on the I/O thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io, functools.partial(func, *args, **kwargs))
+
+    async def _open_reviews(self, tab, name):
+        """Search for a place and open its reviews; True once cards are loaded"""
+        query = quote(f"{name} Pokhara")
+        await tab.navigate(f"{self.base_url}/search/{query}?hl=en")
+
+        if not await tab.wait_for(ANY_PRESENT_SCRIPT, ["a.hfpxzc", "h1.DUwDvf"],
+                                  timeout=self._timeout('search_results')):
+            print(f"⚠ [{name}] Search results did not appear in time")
+
+        clicked = await tab.run_script(
+            "var r = document.querySelector('a.hfpxzc'); if (r) { r.click(); return true; } return false;")
+        if clicked:
+            await tab.wait_for(ANY_PRESENT_SCRIPT, ["div[role='tablist'] button"],
+                               timeout=self._timeout('place_details'))
+
+        # If the clicked tab shows no reviews, try the remaining selectors
+        clicked = []
+        while True:
+            selector = await self._click_first(tab, 'review_tab', exclude=clicked)
+            if selector is None:
+                break
+            clicked.append(selector)
+            loaded = bool(await tab.wait_for(COUNT_ABOVE_SCRIPT, 0, config.REVIEW_SELECTORS['card'],
+                                             timeout=self._timeout('reviews_loaded')))
+            self.selectors.report('review_tab', selector, loaded)
+            if loaded:
+                return True
+            print(f"⚠ [{name}] Reviews did not load for selector '{selector}'")
+        if not clicked:
+            # Captured pages and some layouts show the reviews without a tab
+            return bool(await tab.run_script(COUNT_ABOVE_SCRIPT, 0, config.REVIEW_SELECTORS['card']))
+        return False
+
+    async def _click_first(self, tab, group, exclude=()):
+        """Probe a selector group in one call and click its best match (see selector_registry.py)"""
+        candidates = [selector for selector in self.selectors.order(group) if selector not in exclude]
+        if not candidates:
+            return None
+        result = await tab.run_script(PROBE_SELECTORS_SCRIPT, candidates)
+        return self.selectors.record_probe(group, candidates, result)
+
+    async def _sort_newest(self, tab):
+        """Click Sort, then the 'Newest' menu item"""
+        selector = await self._click_first(tab, 'sort_button')
+        if selector is None:
+            return False
+        menu_open = await tab.wait_for(ANY_PRESENT_SCRIPT, ["div[role='menuitemradio']"],
+                                       timeout=self._timeout('sort_menu'))
+        self.selectors.report('sort_button', selector, bool(menu_open))
+        if not menu_open:
+            return False
+        # Wait for the re-sorted list to replace the current first card
+        card = config.REVIEW_SELECTORS['card']
+        await tab.run_script(MARK_FIRST_CARD_SCRIPT, card)
+        await tab.run_script(
+            "var items = document.querySelectorAll(\"div[role='menuitemradio']\");"
+            "if (items.length >= 2) { items[1].click(); return true; } return false;")
+        return bool(await tab.wait_for(FIRST_CARD_REPLACED_SCRIPT, card,
+                                       timeout=self._timeout('sort_applied')))
+
+    async def _scroll(self, tab, max_reviews, stop_fingerprint=None):
+        """Scroll until max_reviews cards are loaded or the list stops growing.
+
+        Like GoogleMapsSeleniumScraper.scroll_reviews: the pane is looked up
+        once and each scroll and wait for new cards is one script call, paced
+        by AdaptiveScrollController. With stop_fingerprint, stops as soon as
+        that review is loaded and returns True.
+        """
+        card = config.REVIEW_SELECTORS['card']
+        controller = AdaptiveScrollController(max_reviews)
+        pane = await tab.find_element(FIND_SCROLL_CONTAINER_SCRIPT, card)
+        last_count = await tab.run_script(COUNT_SEEN_CARDS_SCRIPT, pane, card) or 0
+        checked = 0
+        refound = False
+        while True:
+            if stop_fingerprint:
+                # Only the cards loaded since the previous check are read
+                keys = await tab.run_script(CARD_KEYS_SCRIPT, config.REVIEW_SELECTORS, checked, pane) or []
+                if any(review_fingerprint(name, text) == stop_fingerprint for name, text in keys):
+                    return True
+                checked += len(keys)
+
+            wait = controller.wait
+            try:
+                _, count, first_new_ms = await tab.run_async_script(
+                    SCROLL_AND_WAIT_SCRIPT, pane, card, last_count,
+                    int(wait * 1000), controller.tuning['settle_ms'])
+            except CDPError:
+                if pane is None or refound:
+                    raise
+                # Maps re-rendered the pane; look it up again
+                pane = await tab.find_element(FIND_SCROLL_CONTAINER_SCRIPT, card)
+                refound = True
+                continue
+            refound = False
+            latency = first_new_ms / 1000 if first_new_ms >= 0 else wait
+            tab.wait_seconds += latency
+            controller.record(count - last_count, latency)
+            last_count = count
+            if controller.done(count):
+                return False
+
+    async def scrape_place(self, conn, name, category):
+        """Scrape one place in its own tab; returns (reviews, place_row) or None"""
+        tab = await CDPTab.open(conn)
+        try:
+            if getattr(config, 'WEB_SCRAPE_BLOCK_RESOURCES', False):
+                await tab.send('Network.setBlockedURLs', {'urls': config.WEB_SCRAPE_BLOCKED_URLS})
+            start = time.perf_counter()
+            if not await self._open_reviews(tab, name):
+                print(f"❌ Failed to find reviews for {name}")
+                return None
+
+            place_row = {
+                'name': name,
+                'category': category,
+                'query': f"{name} Pokhara",
+                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'page_ready_seconds': round(time.perf_counter() - start, 3)
+            }
+            sorted_newest = await self._sort_newest(tab)
+            # The high-water mark is only meaningful when reviews are newest-first
+            incremental = sorted_newest and getattr(config, 'WEB_SCRAPE_INCREMENTAL', True)
+            stop_fingerprint = (await self._offload(self.state.get_high_water_mark, category, name)
+                                if incremental else None)
+            await self._scroll(tab, config.WEB_SCRAPE_MAX_REVIEWS, stop_fingerprint)
+            await tab.run_script(EXPAND_MORE_SCRIPT)
+
+            cards = await tab.run_script(EXTRACT_REVIEWS_SCRIPT, config.REVIEW_SELECTORS) or []
+            extraction_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            reviews = [
+                build_review(name, category,
+                             reviewer if reviewer is not None else "Anonymous",
+                             parse_rating(rating_aria),
+                             date if date is not None else "Unknown",
+                             text if text is not None else "",
+                             extraction_date)
+                for reviewer, rating_aria, date, text in cards
+            ]
+            if stop_fingerprint:
+                reviews = drop_known_reviews(reviews, stop_fingerprint)
+            if incremental and reviews:
+                # Saved by _commit_place once these reviews are on disk
+                place_row['_high_water_mark'] = review_fingerprint(reviews[0]['reviewer_name'],
+                                                                   reviews[0]['review_text'])
+            place_row['page_bytes'], place_row['page_requests'] = tab.page_bytes, tab.page_requests
+            place_row['wait_seconds'] = round(tab.wait_seconds, 3)
+            print(f"Extracted {len(reviews)} {'new ' if stop_fingerprint else ''}reviews for {name}")
+            return reviews, place_row
+        finally:
+            await tab.close()
+
+    # ------------------------------------------------------------------ run
+
+    async def run(self, places):
+        """Scrape every (category -> names) place with bounded concurrency"""
+        ws_url = self.debugger_url or self._launch_chrome()
+        conn = CDPConnection(ws_url)
+        await conn.connect()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def bounded(index, category, name):
+            async with semaphore:
+                await self._offload(self.state.mark_job, category, name, JOB_RUNNING)
+                try:
+                    result = await self.scrape_place(conn, name, category)
+                    error = None if result else PlaceFailure(ERROR_SELECTOR_MISSING, "reviews not found")
+                except Exception as e:
+                    print(f"⚠ Error scraping {name}: {e}")
+                    result, error = None, e
+                if error is not None:
+                    await self._offload(self.state.mark_job, category, name, JOB_FAILED,
+                                        error=f"{classify_error(error)}: {str(error).strip()}")
+                return index, result
+
+        tasks = [bounded(i, category, name)
+                 for i, (category, name) in enumerate(
+                     (c, n) for c, names in places.items() for n in names)]
+        print(f"Scraping {len(tasks)} places over CDP, {self.concurrency} at a time...")
+        try:
+            results = {}
+            for finished in asyncio.as_completed(tasks):
+                index, result = await finished
+                if result:
+                    results[index] = result
+                    # Append as places finish, like the Selenium interim saves
+                    await self._offload(self._commit_place, *result)
+        finally:
+            await conn.close()
+            if not self.debugger_url:
+                self._stop_chrome()
+
+        # Keep config order in memory as well as on disk
+        for index in sorted(results):
+            reviews, place_row = results[index]
+            self.all_reviews.extend(reviews)
+            self.places_data.append(place_row)
+
+    def _commit_place(self, reviews, place_row):
+        """Write a place's reviews and row, then move its high-water mark and journal it done"""
+        high_water_mark = place_row.pop('_high_water_mark', None)
+        self.sink.write_reviews(reviews)
+        self.sink.write_places([place_row])
+        if high_water_mark:
+            self.state.set_high_water_mark(place_row['category'], place_row['name'], high_water_mark)
+        self.state.mark_job(place_row['category'], place_row['name'], JOB_DONE, place_row=place_row)
+
+    def _places_to_scrape(self, resume):
+        """Return the config places still to do (all of them unless resuming)"""
+        if not resume:
+            self.state.reset_jobs(config.SPECIFIC_PLACES)
+            self.sink.reset()
+            return config.SPECIFIC_PLACES
+
+        jobs = self.state.get_jobs()
+        pending = {}
+        for category, names in config.SPECIFIC_PLACES.items():
+            for name in names:
+                job = jobs.get((category, name))
+                if not job or job['status'] != JOB_DONE:
+                    pending.setdefault(category, []).append(name)
+        remaining = sum(len(names) for names in pending.values())
+        print(f"Resuming: {remaining} places left to scrape")
+        return pending
+
+    def scrape_all_from_config(self, resume=False):
+        """Scrape config.SPECIFIC_PLACES and write the final CSVs.
+
+        With resume=True, places the job journal marks as done are skipped.
+        """
+        places = self._places_to_scrape(resume)
+        try:
+            asyncio.run(self.run(places))
+        except KeyboardInterrupt:
+            print("\n\n⚠ SCRAPING INTERRUPTED BY USER (Ctrl+C)")
+        finally:
+            place_order = [(category, name)
+                           for category, names in config.SPECIFIC_PLACES.items()
+                           for name in names]
+            self.sink.compact(place_order=place_order)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape Google Maps reviews concurrently over CDP")
+    parser.add_argument('--output-dir', default=config.OUTPUT_DIRECTORY)
+    parser.add_argument('--concurrency', type=int, default=None,
+                        help="Places scraped at once (default: config.ASYNC_CDP_CONCURRENCY)")
+    parser.add_argument('--base-url', default=None,
+                        help="Maps base URL, e.g. a local_maps_server.py instance")
+    parser.add_argument('--debugger-url', default=None,
+                        help="ws:// URL of an already running Chrome instead of launching one")
+    parser.add_argument('--resume', action='store_true',
+                        help="Skip places finished by the previous run and retry failed/pending ones")
+    args = parser.parse_args()
+
+    print("="*80)
+    print("POKHARA GOOGLE REVIEWS ASYNC CDP SCRAPER")
+    print("="*80)
+
+    scraper = AsyncMapsScraper(output_dir=args.output_dir, concurrency=args.concurrency,
+                               base_url=args.base_url, debugger_url=args.debugger_url)
+    scraper.scrape_all_from_config(resume=args.resume)
+
+    print("\n✅ SCRAPING PROCESS COMPLETED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Code-Switch Detection Benchmark
+===============================
+Scales a review CSV (by default the 3k-row pokhara_reviews_interim.csv) up to
+N rows and compares the per-review is_code_switched() loop with the batch
+classify_code_switched(). Both results are checked to be identical.
+
+Usage:
+    python benchmark_code_switch.py [--csv path] [--rows 1000000]
+
+Author: AI Assistant
+Date: 2026-01-16
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from code_switch import classify_code_switched, is_code_switched
+
+DEFAULT_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           '..', 'output_reviews', 'pokhara_reviews_interim.csv')
+
+
+def run_benchmark(csv_path, rows, unique=True):
+    """Time per-review vs batch classification on `rows` texts"""
+    base = pd.read_csv(csv_path, encoding='utf-8-sig')['review_text']
+    repeats = -(-rows // len(base))
+    texts = pd.concat([base] * repeats, ignore_index=True).iloc[:rows]
+    if unique:
+        # A trailing number token makes every text distinct without changing
+        # its classification, so the batch path cannot win by deduplication
+        texts = pd.Series([f"{t} {i}" if isinstance(t, str) else t for i, t in enumerate(texts)],
+                          dtype=object)
+    print(f"Benchmarking {len(texts):,} reviews (from {len(base):,} rows in {os.path.basename(csv_path)})")
+
+    start = time.perf_counter()
+    per_review = np.array([is_code_switched(t) if isinstance(t, str) else False for t in texts])
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = classify_code_switched(texts)
+    batch_seconds = time.perf_counter() - start
+
+    assert (per_review == batch).all(), "batch classifier disagrees with is_code_switched"
+    print(f"per-review loop : {loop_seconds:7.2f} s ({len(texts) / loop_seconds:,.0f} reviews/s)")
+    print(f"batch classifier: {batch_seconds:7.2f} s ({len(texts) / batch_seconds:,.0f} reviews/s)")
+    print(f"speed-up        : {loop_seconds / batch_seconds:.1f}x, "
+          f"{int(batch.sum()):,} code-switched, results identical")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark code-switch detection")
+    parser.add_argument('--csv', default=DEFAULT_CSV, help="Review CSV to scale up")
+    parser.add_argument('--rows', type=int, default=1_000_000, help="Number of reviews to classify")
+    parser.add_argument('--keep-duplicates', action='store_true',
+                        help="Use the repeated texts as-is (archives with many re-scraped reviews)")
+    args = parser.parse_args()
+    run_benchmark(args.csv, args.rows, unique=not args.keep_duplicates)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Extraction Benchmark for the Pokhara Google Reviews Scraper
+===========================================================
+Loads a saved Google Maps page (e.g. debug_page_source.html) into Chrome and
+compares the bulk single-script extractor with the per-element fallback.
+Every WebDriver command is counted, so the output shows round trips and wall
+time for both paths.
+
+Usage:
+    python benchmark_extraction.py path/to/debug_page_source.html [--repeat 5]
+
+Author: AI Assistant
+Date: 2026-01-12
+"""
+
+import argparse
+import pathlib
+import tempfile
+import time
+
+from pokhara_google_reviews_scraper import GoogleMapsSeleniumScraper
+
+
+def count_round_trips(driver):
+    """Wrap driver.execute so every WebDriver HTTP command is counted"""
+    counter = {'calls': 0}
+    original_execute = driver.execute
+
+    def counting_execute(driver_command, params=None):
+        counter['calls'] += 1
+        return original_execute(driver_command, params)
+
+    # WebElements call back into their parent driver, so this sees them too
+    driver.execute = counting_execute
+    return counter
+
+
+def run_benchmark(html_path, repeat=5):
+    """Benchmark both extraction paths against one saved page"""
+    # The scraper keeps its state database in output_dir; use a throwaway one
+    # so nothing is written next to the saved page
+    with tempfile.TemporaryDirectory(prefix='pokhara_benchmark_') as output_dir:
+        scraper = GoogleMapsSeleniumScraper(output_dir=output_dir)
+        try:
+            _benchmark_paths(scraper, html_path, repeat)
+        finally:
+            scraper.state.close()
+
+
+def _benchmark_paths(scraper, html_path, repeat):
+    scraper.setup_driver()
+    try:
+        scraper.driver.get(pathlib.Path(html_path).resolve().as_uri())
+        counter = count_round_trips(scraper.driver)
+
+        paths = [
+            ('bulk script', scraper.extract_visible_reviews),
+            ('per-element', scraper.extract_visible_reviews_per_element),
+        ]
+        for label, extract in paths:
+            counter['calls'] = 0
+            start = time.perf_counter()
+            for _ in range(repeat):
+                reviews = extract('benchmark', 'benchmark')
+            elapsed = (time.perf_counter() - start) / repeat
+            calls = counter['calls'] / repeat
+            print(f"{label:12s}: {len(reviews):4d} reviews | "
+                  f"{calls:7.1f} round trips | {elapsed * 1000:8.1f} ms per extraction")
+    finally:
+        scraper.driver.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark review extraction round trips")
+    parser.add_argument('html', help="Saved Maps page, e.g. debug_page_source.html")
+    parser.add_argument('--repeat', type=int, default=5, help="Extractions per path")
+    args = parser.parse_args()
+    run_benchmark(args.html, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
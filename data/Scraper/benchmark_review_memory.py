@@ -0,0 +1,136 @@
+"""
+Review Memory Benchmark
+=======================
+Compares the memory needed to hold N scraped reviews as:
+  dicts    - one dict per review, as self.all_reviews used to keep them
+  records  - compact ReviewRecords (slots, interned repeated values)
+  buffer   - ReviewBuffer flushing every REVIEW_FLUSH_SIZE reviews to a sink
+             (the scraper's current behaviour; a null sink is used here)
+
+Rows are built from a review CSV (by default the 3k-row
+pokhara_reviews_interim.csv) with fresh string objects per row, as they
+arrive from the browser.
+
+Usage:
+    python benchmark_review_memory.py [--csv path] [--rows 1000000] [--flush-size 5000]
+
+Author: AI Assistant
+Date: 2026-01-22
+"""
+
+import argparse
+import gc
+import os
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from code_switch import classify_code_switched
+from review_buffer import ReviewBuffer
+from reviews import ReviewRecord
+
+DEFAULT_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           '..', 'output_reviews', 'pokhara_reviews_interim.csv')
+
+# Reviews per extraction call (one extraction timestamp each)
+BATCH_SIZE = 50
+
+
+class NullSink:
+    """Stands in for the output sink; only counts rows"""
+
+    def __init__(self):
+        self.rows = 0
+
+    def write_reviews(self, reviews):
+        self.rows += len(reviews)
+        return len(reviews)
+
+
+def _fresh(value):
+    """A new str object with the same value (as read from the page)"""
+    return value.encode('utf-8').decode('utf-8') if isinstance(value, str) else value
+
+
+def make_batches(base, rows):
+    """Yield lists of review dicts like the scraper's extraction produces"""
+    started = datetime(2026, 1, 1)
+    for start in range(0, rows, BATCH_SIZE):
+        extraction_date = (started + timedelta(seconds=start)).strftime('%Y-%m-%d %H:%M:%S')
+        batch = []
+        for i in range(start, min(start + BATCH_SIZE, rows)):
+            row = base[i % len(base)]
+            batch.append({
+                'place_name': row['place_name'],
+                'category': row['category'],
+                'reviewer_name': _fresh(row['reviewer_name']),
+                'rating': row['rating'],
+                'review_date': _fresh(row['review_date']),
+                'review_text': _fresh(row['review_text']),
+                'is_code_switched': row['is_code_switched'],
+                'extraction_date': extraction_date,
+            })
+        yield batch
+
+
+def measure(label, build):
+    """Run build() under tracemalloc; print retained and peak memory"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    kept = build()
+    seconds = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<8} retained {current / 1e6:>8.1f} MB   peak {peak / 1e6:>8.1f} MB   ({seconds:.1f}s)")
+    del kept
+    gc.collect()
+    return current, peak
+
+
+def run_benchmark(csv_path, rows, flush_size):
+    df = pd.read_csv(csv_path, encoding='utf-8-sig')
+    df['review_text'] = df['review_text'].fillna('')
+    df['is_code_switched'] = classify_code_switched(df['review_text'])
+    # Place and category strings are shared, as they come from config
+    base = df.to_dict('records')
+    print(f"Holding {rows:,} reviews (from {len(base):,} rows in {os.path.basename(csv_path)})")
+
+    def as_dicts():
+        kept = []
+        for batch in make_batches(base, rows):
+            kept.extend(batch)
+        return kept
+
+    def as_records():
+        kept = []
+        for batch in make_batches(base, rows):
+            kept.extend(ReviewRecord.from_row(review) for review in batch)
+        return kept
+
+    def as_buffer():
+        buffer = ReviewBuffer(NullSink(), flush_size=flush_size)
+        for batch in make_batches(base, rows):
+            buffer.add(batch)
+        return buffer
+
+    dicts, _ = measure('dicts', as_dicts)
+    records, _ = measure('records', as_records)
+    buffer, buffer_peak = measure('buffer', as_buffer)
+    print(f"\nRecords use {dicts / records:.1f}x less memory than dicts; "
+          f"the buffer peaks at {buffer_peak / 1e6:.1f} MB whatever the row count")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory of held reviews: dicts vs compact records")
+    parser.add_argument('--csv', default=DEFAULT_CSV, help="Review CSV to scale up")
+    parser.add_argument('--rows', type=int, default=1_000_000, help="Number of reviews")
+    parser.add_argument('--flush-size', type=int, default=5000, help="ReviewBuffer flush size")
+    args = parser.parse_args()
+    run_benchmark(args.csv, args.rows, args.flush_size)
+
+
+if __name__ == "__main__":
+    main()
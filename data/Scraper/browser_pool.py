@@ -0,0 +1,186 @@
+"""
+Warm Browser Pool for the Pokhara Google Reviews Scraper
+========================================================
+Cuts the start-up cost of setup_driver on repeat runs:
+
+* the chromedriver path resolved by ChromeDriverManager is cached on disk, so
+  the hot path never does a network version lookup (setup_driver refreshes
+  it when Chrome has updated and rejects the cached driver);
+* each pool slot gets a persistent Chrome profile (user-data-dir) so the Maps
+  JavaScript and HTTP cache stay warm between runs;
+* browsers are started with a remote-debugging port and left running; the
+  next run attaches to them by debugger address instead of launching Chrome.
+
+Running browsers are recorded per slot in a state file shared by every
+worker; each change re-reads it and rewrites only its own slot.
+
+Any already running Chrome can also be attached with
+config.CHROME_DEBUGGER_ADDRESS (e.g. "127.0.0.1:9222").
+
+Author: AI Assistant
+Date: 2026-01-19
+"""
+
+import json
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import threading
+import time
+import urllib.request
+
+try:
+    import config
+except ImportError:
+    # If running from within Scraper directory
+    import sys
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    import config
+
+CHROME_CANDIDATES = ['google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome']
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'pokhara_scraper')
+
+# Guards the pool state file. Module level because setup_driver creates a new
+# BrowserPool for every session, so a per-instance lock would guard nothing
+_STATE_LOCK = threading.Lock()
+
+
+def find_chrome_binary():
+    """config.CHROME_BINARY, or the first Chrome/Chromium found on PATH"""
+    binary = getattr(config, 'CHROME_BINARY', None)
+    if binary:
+        return binary
+    for name in CHROME_CANDIDATES:
+        path = shutil.which(name)
+        if path:
+            return path
+    raise RuntimeError("Chrome not found; set CHROME_BINARY in config.py")
+
+
+def _cache_dir():
+    path = getattr(config, 'BROWSER_CACHE_DIR', None) or DEFAULT_CACHE_DIR
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def cached_driver_path(refresh=False):
+    """chromedriver path, resolved over the network only when the cache is stale.
+
+    refresh=True ignores the cached path, e.g. after Chrome updated and no
+    longer accepts the cached chromedriver.
+    """
+    cache_file = os.path.join(_cache_dir(), 'chromedriver_path.json')
+    if not refresh and os.path.exists(cache_file):
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            path = json.load(f).get('path')
+        if path and os.path.exists(path):
+            return path
+
+    from webdriver_manager.chrome import ChromeDriverManager
+    path = ChromeDriverManager().install()
+    tmp_file = cache_file + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump({'path': path}, f)
+    os.replace(tmp_file, cache_file)
+    return path
+
+
+def debugger_alive(address, timeout=0.5):
+    """True if a Chrome DevTools endpoint answers at host:port"""
+    try:
+        with urllib.request.urlopen(f"http://{address}/json/version", timeout=timeout) as response:
+            return response.status == 200
+    except Exception:
+        return False
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+class BrowserPool:
+    """Long-lived Chrome instances, one per slot, reused across runs"""
+
+    def __init__(self, root=None):
+        self.root = root or os.path.join(_cache_dir(), 'browsers')
+        os.makedirs(self.root, exist_ok=True)
+        self.state_file = os.path.join(self.root, 'browser_pool.json')
+
+    def _load_state(self):
+        if not os.path.exists(self.state_file):
+            return {}
+        with open(self.state_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _save_state(self, state):
+        tmp_file = f"{self.state_file}.{os.getpid()}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_file, self.state_file)
+
+    def _set_entry(self, slot, entry):
+        """Re-read the state file and replace only slot's entry (None removes it)"""
+        with _STATE_LOCK:
+            state = self._load_state()
+            if entry is None:
+                state.pop(str(slot), None)
+            else:
+                state[str(slot)] = entry
+            self._save_state(state)
+
+    def profile_dir(self, slot):
+        """Persistent user-data-dir of one slot"""
+        return os.path.join(self.root, f"profile_{slot}")
+
+    def acquire(self, slot=0, extra_args=None):
+        """Debugger address of a running browser for slot, launching one if needed"""
+        with _STATE_LOCK:
+            entry = self._load_state().get(str(slot))
+        if entry and debugger_alive(entry['address']):
+            return entry['address']
+
+        port = _free_port()
+        args = [find_chrome_binary(), f'--remote-debugging-port={port}',
+                f'--user-data-dir={self.profile_dir(slot)}',
+                '--no-first-run', '--no-default-browser-check']
+        args += list(extra_args or [])
+        # Own session so the browser outlives this Python process
+        process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                   start_new_session=True)
+        address = f"127.0.0.1:{port}"
+        deadline = time.monotonic() + 30
+        while not debugger_alive(address):
+            if time.monotonic() > deadline or process.poll() is not None:
+                raise RuntimeError(f"Chrome for slot {slot} did not start")
+            time.sleep(0.1)
+
+        # Other workers may have saved their slots while this browser started
+        self._set_entry(slot, {'address': address, 'pid': process.pid})
+        print(f"✓ Started warm browser for slot {slot} at {address}")
+        return address
+
+    def release(self, slot):
+        """Stop one slot's browser; the next acquire() starts a fresh one"""
+        with _STATE_LOCK:
+            entry = self._load_state().get(str(slot))
+        if entry:
+            try:
+                os.kill(entry['pid'], signal.SIGTERM)
+            except OSError:
+                pass
+            self._set_entry(slot, None)
+
+    def shutdown(self):
+        """Stop every pooled browser (profiles are kept)"""
+        with _STATE_LOCK:
+            for slot, entry in self._load_state().items():
+                try:
+                    os.kill(entry['pid'], signal.SIGTERM)
+                except OSError:
+                    pass
+            self._save_state({})
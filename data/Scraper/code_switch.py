@@ -0,0 +1,169 @@
+"""
+Nepali-English Code-Switching Detection
+=======================================
+Shared by the live Selenium scraper and the offline HTML parser.
+
+is_code_switched() classifies one text; classify_code_switched() classifies a
+whole list/Series with numpy passes over the code points of all texts at
+once, and gives identical results. The patterns and keyword set are compiled
+once at import time.
+
+Author: AI Assistant
+Date: 2026-01-13
+"""
+
+import functools
+import itertools
+import re
+import sys
+
+import numpy as np
+import pandas as pd
+
+
+# Common romanized Nepali keywords
+NEPALI_KEYWORDS = frozenset([
+    'ramro', 'dherai', 'kati', 'chha', 'ho', 'ni',
+    'dammi', 'babal', 'thik', 'gardai', 'parne', 'hola',
+    'sarai', 'ekdam', 'yo', 'ta', 'pani', 'ma',
+    'haina', 'huna', 'garne', 'hun', 'kasto'
+])
+
+DEVANAGARI_RE = re.compile(r'[\u0900-\u097F]')
+LATIN_RE = re.compile(r'[a-zA-Z]')
+WORD_RE = re.compile(r'\b\w+\b')
+
+# Unique texts per pass of classify_code_switched; bounds its code point
+# buffers (a few bytes per character) to a few tens of MB
+CHUNK_SIZE = 20000
+
+# Keywords packed one byte per letter into an int, the form the batch
+# classifier compares words in (every keyword is 2-6 ASCII letters)
+KEYWORD_LENGTHS = sorted({len(word) for word in NEPALI_KEYWORDS})
+
+
+def _pack(word):
+    return sum(ord(ch) << (8 * i) for i, ch in enumerate(word))
+
+
+PACKED_KEYWORDS = np.array(sorted(_pack(word) for word in NEPALI_KEYWORDS), dtype=np.int64)
+
+
+def is_code_switched(text):
+    """Detect Nepali-English code-switching (Devanagari mixed or Romanized mixed)"""
+    if not text:
+        return False
+        
+    # Both kinds of code-switching need English (Latin) script
+    if not LATIN_RE.search(text):
+        return False
+    
+    # 1. Devanagari detection
+    if DEVANAGARI_RE.search(text):
+        return True
+        
+    # 2. Romanized Nepali detection (English script + Nepali keywords)
+    # Check if keywords appear in text (whole words only)
+    words = WORD_RE.findall(text.lower())
+    return any(word in NEPALI_KEYWORDS for word in words)
+
+
+@functools.lru_cache(maxsize=None)
+def _char_tables():
+    """(is_word, special): whether each code point is a regex word character
+    (\\w), and the code points whose lower-casing changes a word (İ -> i plus
+    a combining dot, the Kelvin sign -> k). Built once, on first use (~0.5 s).
+    """
+    chars = [chr(code) for code in range(sys.maxunicode + 1)]
+    is_word = np.fromiter((ch.isalnum() or ch == '_' for ch in chars), dtype=bool, count=len(chars))
+    special = []
+    for code in range(0x80, len(chars)):
+        lower = chars[code].lower()
+        if lower != chars[code] and (len(lower) != 1 or lower.isascii() or lower.isalnum() != is_word[code]):
+            special.append(code)
+    return is_word, np.array(special, dtype=np.uint32)
+
+
+def _classify_chunk(texts):
+    """classify_code_switched for a list of str, as a numpy bool array.
+
+    The texts are joined, each followed by a newline (a word boundary, like
+    the start or end of a text), into one array of code points, and every
+    test is a numpy pass over it: Latin and Devanagari ranges, then the words
+    of 2-6 ASCII letters (runs of \\w, as WORD_RE finds them), lower-cased and
+    packed into ints, looked up in PACKED_KEYWORDS. Texts holding a character
+    whose lower-casing changes a word go through is_code_switched instead.
+    """
+    is_word, special = _char_tables()
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+    # Start of each text in the joined string; every text has a separator
+    # after it, so no text's span is empty
+    starts = np.concatenate(([0], np.cumsum(lengths + 1)[:-1]))
+    points = np.frombuffer(('\n'.join(texts) + '\n').encode('utf-32-le', 'surrogatepass'), dtype='<u4')
+
+    def texts_with(flags):
+        return np.logical_or.reduceat(flags, starts)
+
+    folded = points | 0x20
+    ascii_letter = (folded >= 0x61) & (folded <= 0x7A)
+    has_latin = texts_with(ascii_letter)
+    has_devanagari = texts_with((points >= 0x0900) & (points <= 0x097F))
+
+    # Word runs: first and one-past-last character of every maximal run of \w
+    word = is_word[points]
+    before = np.empty_like(word)
+    before[0] = False
+    before[1:] = word[:-1]
+    word_starts = np.flatnonzero(word & ~before)
+    word_lengths = np.flatnonzero(before & ~word) - word_starts
+    lowered = np.where(ascii_letter, folded, 0).astype(np.uint8)
+    has_keyword = np.zeros(len(texts), dtype=bool)
+    for length in KEYWORD_LENGTHS:
+        candidates = word_starts[word_lengths == length]
+        packed = np.zeros(len(candidates), dtype=np.int64)
+        letters = np.ones(len(candidates), dtype=bool)
+        for offset in range(length):
+            letter = lowered[candidates + offset]
+            letters &= letter > 0
+            packed |= letter.astype(np.int64) << (8 * offset)
+        found = candidates[letters & np.isin(packed, PACKED_KEYWORDS)]
+        has_keyword[np.searchsorted(starts, found, side='right') - 1] = True
+
+    result = has_latin & (has_devanagari | has_keyword)
+    for i in np.flatnonzero(texts_with(np.isin(points, special))):
+        result[i] = is_code_switched(texts[i])
+    return result
+
+
+def classify_code_switched(texts):
+    """Vectorised is_code_switched over a list/Series; returns a numpy bool array.
+
+    Missing values (None/NaN) and empty strings are not code-switched.
+    Repeated texts (common across interim/final archives) are classified once,
+    and the unique texts are scanned CHUNK_SIZE at a time (see _classify_chunk).
+    """
+    values = np.asarray(pd.Series(texts, dtype=object)).copy()
+    if not len(values):
+        return np.zeros(0, dtype=bool)
+    values[~np.fromiter(map(isinstance, values, itertools.repeat(str)), dtype=bool, count=len(values))] = ''
+
+    codes, uniques = pd.factorize(values)
+    uniques = list(uniques)
+    result = np.concatenate([_classify_chunk(uniques[i:i + CHUNK_SIZE])
+                             for i in range(0, len(uniques), CHUNK_SIZE)])[codes]
+    # pd.factorize hashes every text holding a lone surrogate (left by a broken
+    # emoji escape) alike; those rows are classified one by one
+    for i in np.flatnonzero(np.asarray(uniques, dtype=object)[codes] != values):
+        result[i] = is_code_switched(values[i])
+    return result
+
+
+def rescore_csv(path, output_path=None, text_column='review_text'):
+    """Recompute is_code_switched for a whole review CSV in one pass"""
+    df = pd.read_csv(path, encoding='utf-8-sig')
+    df['is_code_switched'] = classify_code_switched(df[text_column])
+    output_path = output_path or path
+    df.to_csv(output_path, index=False, encoding='utf-8-sig')
+    print(f"✓ Re-scored {len(df)} reviews in {output_path} "
+          f"({int(df['is_code_switched'].sum())} code-switched)")
+    return df
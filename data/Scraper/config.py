@@ -140,6 +140,18 @@ OUTPUT_DIRECTORY = 'D:\\Research work\\data\\output_reviews'
 # Files will be saved as: pokhara_reviews_YYYYMMDD_HHMMSS.csv
 FILE_TIMESTAMP_FORMAT = '%Y%m%d_%H%M%S'
 
+# Output backend used by the Selenium scraper's save_data:
+#   'csv'     - pokhara_reviews.csv, the _code_switched subset and pokhara_places.csv
+#   'parquet' - pokhara_reviews_parquet/ partitioned by category and extraction
+#               day (needs pyarrow); accumulates across runs
+OUTPUT_BACKEND = 'csv'
+
+# Scraped reviews are held as compact records and written to the output
+# backend after every place, so a crash loses at most the place in progress;
+# a place is only journaled done once written. Within one very large place
+# they are also written whenever this many are pending.
+REVIEW_FLUSH_SIZE = 5000
+
 # Export options
 SAVE_REVIEWS_CSV = True          # Save reviews to CSV
 SAVE_PLACES_CSV = True           # Save places to CSV
@@ -151,6 +163,10 @@ EXPORT_TO_GOOGLE_DRIVE = False   # Auto-export to Google Drive
 # WEB SCRAPING CONFIGURATION (Alternative Method)
 # =============================================================================
 
+# Google Maps base URL. Point it at a local stand-in server
+# (local_maps_server.py) to run the scrapers offline against captured pages.
+MAPS_BASE_URL = 'https://www.google.com/maps'
+
 # Chrome driver settings
 # Chrome driver settings
 CHROME_OPTIONS = [
@@ -162,10 +178,165 @@ CHROME_OPTIONS = [
     # '--lang=en-US'          # Force English language (Commented to match system locale/tem.py)
 ]
 
-# Web scraping delays
-WEB_SCRAPE_DELAY_INITIAL = 3     # Initial page load delay
-WEB_SCRAPE_DELAY_SCROLL = 2      # Delay when scrolling for reviews
+# Browser start-up
+# The chromedriver path is cached under BROWSER_CACHE_DIR so repeat runs skip
+# the webdriver-manager version lookup. With WEB_SCRAPE_WARM_BROWSERS, each
+# pool slot keeps a Chrome running (with a persistent profile) between runs
+# and setup_driver attaches to it instead of launching a new one.
+BROWSER_CACHE_DIR = None            # None = ~/.cache/pokhara_scraper
+WEB_SCRAPE_WARM_BROWSERS = False
+# Attach to an already running Chrome started with --remote-debugging-port,
+# e.g. "127.0.0.1:9222". Takes precedence over the warm pool.
+CHROME_DEBUGGER_ADDRESS = None
+
+# Browser session health
+# Before every place the session is checked and a dead browser/chromedriver
+# is replaced (up to WEB_SCRAPE_RESTART_ATTEMPTS tries) without losing the
+# run. Sessions are also recycled after WEB_SCRAPE_RECYCLE_AFTER_PLACES
+# places to bound Chrome's memory (0 = never). A page load that takes longer
+# than WEB_SCRAPE_PAGE_LOAD_TIMEOUT seconds fails instead of hanging.
+WEB_SCRAPE_RECYCLE_AFTER_PLACES = 25
+WEB_SCRAPE_RESTART_ATTEMPTS = 3
+WEB_SCRAPE_PAGE_LOAD_TIMEOUT = 60
+
+# Resource blocking
+# Map tiles, images, reviewer avatars, fonts and media are never read by the
+# scraper. With WEB_SCRAPE_BLOCK_RESOURCES they are blocked through the
+# DevTools Network.setBlockedURLs command ('*' is a wildcard). Review text
+# comes from the page HTML and the review requests, which are not blocked.
+WEB_SCRAPE_BLOCK_RESOURCES = False
+WEB_SCRAPE_BLOCKED_URLS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.ico',   # Images
+    '*googleusercontent.com/*',                            # Avatars, place photos
+    '*/maps/vt*', '*/maps/vt/*', '*/kh/v=*', '*khms*',     # Map and satellite tiles
+    '*/maps/_/js/*/m=tiles*',
+    '*fonts.gstatic.com/*', '*.woff', '*.woff2', '*.ttf',  # Fonts
+    '*.mp4', '*.webm', '*.m3u8',                           # Media
+]
+
+# Reviews per place
 WEB_SCRAPE_MAX_REVIEWS = 50     # Maximum reviews to scrape per place
+# Per-place targets overriding WEB_SCRAPE_MAX_REVIEWS, e.g. {'Phewa Lake': 3000}
+WEB_SCRAPE_MAX_REVIEWS_BY_PLACE = {}
+
+# Streaming extraction
+# Read review cards while scrolling instead of once at the end, writing each
+# batch to the output right away. With WEB_SCRAPE_PRUNE_HARVESTED, cards are
+# removed from the page once read (all but the last WEB_SCRAPE_PRUNE_KEEP) so
+# Chrome memory stays flat for places with thousands of reviews.
+# Not used in network capture mode.
+WEB_SCRAPE_STREAMING = False
+WEB_SCRAPE_PRUNE_HARVESTED = False
+WEB_SCRAPE_PRUNE_KEEP = 5
+
+# Adaptive scrolling (scroll_controller.py)
+# After each scroll the scraper waits for new review cards (woken by a
+# MutationObserver) for latency_factor x the observed load latency, backing
+# off after scrolls that load nothing and stopping after `patience` of them.
+# Keys left out use the defaults in scroll_controller.DEFAULT_TUNING.
+WEB_SCRAPE_SCROLL_TUNING = {
+    'initial_wait': 2.5,
+    'min_wait': 0.3,
+    'max_wait': 8.0,
+    'backoff': 1.6,
+    'patience': 5,
+}
+
+# CSS selectors for the parts of a Google Maps review card.
+# Shared by the bulk JavaScript extractor and the per-element fallback.
+REVIEW_SELECTORS = {
+    'card': 'div.jftiEf',            # One review card
+    'reviewer_name': 'div.d4r55',    # Reviewer display name
+    'rating': 'span.kvMYJc',         # Star rating (value in aria-label)
+    'review_date': 'span.rsqaWe',    # Relative date, e.g. "a week ago"
+    'review_text': 'span.wiI7pd',    # Review body
+}
+
+# How loaded review cards are read:
+#   'script'      - one injected JavaScript call serialises all cards (default)
+#   'page_source' - one page_source snapshot parsed locally with BeautifulSoup
+WEB_SCRAPE_EXTRACTION_ENGINE = 'script'
+
+# Async CDP engine (async_cdp_scraper.py)
+ASYNC_CDP_CONCURRENCY = 4   # Places scraped at once, each in its own tab/context
+CHROME_BINARY = None        # Path to Chrome/Chromium; None searches PATH
+
+# Network capture mode
+# Parse reviews from the background review requests Maps makes while the panel
+# scrolls (via Chrome's performance log) instead of reading the rendered cards.
+# Gives full review text without clicking "More". Raw payloads are cached in
+# <output_dir>/xhr_cache for offline replay (review_payloads.py). Only payloads
+# requested after the "Newest" sort are parsed, in list order and capped like
+# the DOM path. Falls back to DOM extraction when the sort failed or no
+# payload could be parsed.
+WEB_SCRAPE_CAPTURE_XHR = False
+
+# Readiness waits
+# The scraper waits for the DOM condition each step needs instead of sleeping
+# for a fixed time. These are upper bounds (seconds) per step; a wait returns
+# as soon as its condition holds.
+WEB_SCRAPE_WAIT_TIMEOUTS = {
+    'search_results': 10,   # result list or place header after driver.get
+    'place_details': 8,     # place panel after clicking the first result
+    'reviews_loaded': 20,   # first review cards after opening the Reviews tab
+    'sort_menu': 3,         # sort menu opened
+    'sort_applied': 5,      # menu closed and re-sorted cards rendered
+    'scroll_growth': 2.5,   # review count grew after one scroll
+    'expand_more': 2,       # all "More" buttons expanded
+}
+WEB_SCRAPE_POLL_INTERVAL = 0.1   # How often wait conditions are re-checked
+
+# Incremental scraping
+# After sorting by newest, stop scrolling once the newest review collected by
+# the previous run shows up, so daily refreshes only load new reviews.
+# Per-place state is kept in an SQLite file inside the output directory.
+WEB_SCRAPE_INCREMENTAL = True
+STATE_DB_FILENAME = 'scrape_state.sqlite'
+
+# Place URL cache
+# The Maps URL each place resolves to is kept in the state database, so later
+# runs open the place directly instead of searching for it. A cached URL that
+# no longer opens the place is dropped and the place is searched for again.
+WEB_SCRAPE_CACHE_PLACE_URLS = True
+
+# Run report
+# Per-place and per-phase timings (p50/p95, histograms) written to the output
+# directory at the end of scrape_all_from_config.
+RUN_REPORT_FILENAME = 'run_report.json'
+
+# Parallel scraping
+# Number of independent browser sessions used by scrape_all_from_config.
+# 1 keeps the original single-browser behaviour; each extra session costs
+# roughly one more Chrome instance worth of RAM.
+WEB_SCRAPE_POOL_SIZE = 1
+
+# Scheduling
+# Scrape places in order of expected new reviews per second, estimated from
+# past runs (review rate, time since the last scrape, time per scrape,
+# failures in a row); False keeps config order. With a deadline (minutes of
+# wall clock), places whose usual scrape time no longer fits are left pending
+# for the next --resume run.
+WEB_SCRAPE_PRIORITY_ORDER = True
+WEB_SCRAPE_DEADLINE_MINUTES = None
+
+# Retries and circuit breaker (see retry_policy.py)
+# Failed places are classified (timeout, selector_missing, consent_wall,
+# no_reviews, crash, other) and the kinds in retry_on are retried after an
+# exponential, jittered backoff, on the same browser unless it crashed.
+# A place whose page shows zero reviews (no_reviews) is not worth retrying.
+WEB_SCRAPE_RETRY = {
+    'max_attempts': 3,
+    'base_delay': 2.0,
+    'max_delay': 30.0,
+    'retry_on': ['timeout', 'selector_missing', 'consent_wall', 'crash'],
+}
+# When `threshold` of the last `window` places (all workers) failed, every
+# worker pauses `cooldown` seconds and continues with a fresh browser
+WEB_SCRAPE_CIRCUIT_BREAKER = {
+    'window': 6,
+    'threshold': 4,
+    'cooldown': 120,
+}
 
 # =============================================================================
 # SENTIMENT ANALYSIS CONFIGURATION
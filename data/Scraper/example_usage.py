@@ -551,6 +551,46 @@ def example_export_formats():
     print(f"\n✅ All exports complete! Files saved in: {export_dir}")
 
 
+# =============================================================================
+# EXAMPLE 8: ANALYZE PARQUET OUTPUT
+# =============================================================================
+
+def example_parquet_analysis():
+    """
+    Example 8: Analyze the Parquet dataset (config.OUTPUT_BACKEND = 'parquet')
+    """
+    print("\n" + "="*80)
+    print("EXAMPLE 8: ANALYZE PARQUET OUTPUT")
+    print("="*80)
+    
+    import os
+    from output_sink import read_reviews
+    from config import OUTPUT_DIRECTORY
+    
+    if not os.path.isdir(os.path.join(OUTPUT_DIRECTORY, 'pokhara_reviews_parquet')):
+        print("❌ No Parquet dataset found. Set OUTPUT_BACKEND = 'parquet' and run the scraper.")
+        return
+    
+    # Only the columns used below are read from disk
+    reviews_df = read_reviews(OUTPUT_DIRECTORY,
+                              columns=['place_name', 'category', 'rating', 'is_code_switched'])
+    
+    print(f"Total reviews: {len(reviews_df)}")
+    print(f"Code-switched share: {reviews_df['is_code_switched'].mean():.1%}")
+    
+    category_stats = reviews_df.groupby('category', observed=True).agg({
+        'rating': ['count', 'mean'],
+        'place_name': 'nunique'
+    }).round(2)
+    category_stats.columns = ['Review Count', 'Avg Rating', 'Unique Places']
+    print(category_stats)
+    
+    # Partition pruning: only the hotels partitions are opened
+    hotels_df = read_reviews(OUTPUT_DIRECTORY, columns=['place_name', 'rating'],
+                             categories=['hotels'])
+    print(f"\nHotel reviews: {len(hotels_df)}, average rating {hotels_df['rating'].mean():.2f}")
+
+
 # =============================================================================
 # MAIN EXECUTION
 # =============================================================================
@@ -570,10 +610,11 @@ if __name__ == "__main__":
     print("5. Sentiment analysis")
     print("6. Custom visualizations")
     print("7. Export to different formats")
-    print("8. Run all examples")
+    print("8. Analyze Parquet output")
+    print("9. Run all examples")
     print("0. Exit")
     
-    choice = input("\nEnter your choice (0-8): ").strip()
+    choice = input("\nEnter your choice (0-9): ").strip()
     
     examples = {
         '1': example_basic_usage,
@@ -583,9 +624,10 @@ if __name__ == "__main__":
         '5': example_sentiment_analysis,
         '6': example_custom_visualizations,
         '7': example_export_formats,
+        '8': example_parquet_analysis,
     }
     
-    if choice == '8':
+    if choice == '9':
         # Run all examples
         for example_func in examples.values():
             try:
@@ -0,0 +1,101 @@
+"""
+Local Google Maps Stand-in Server
+=================================
+Serves captured Maps HTML (e.g. debug_page_source.html dumps) so the
+scrapers can be run and tested offline. A request for
+/maps/search/<query> returns <pages_dir>/<slug>.html when it exists, where
+slug is the query lower-cased with non-alphanumerics replaced by "_"
+("Fish Tail Lodge Pokhara" -> fish_tail_lodge_pokhara.html, or
+fish_tail_lodge.html), and the --default page otherwise.
+
+Usage:
+    python local_maps_server.py captured_pages/ --port 8765
+    python async_cdp_scraper.py --base-url http://127.0.0.1:8765/maps
+
+Author: AI Assistant
+Date: 2026-01-17
+"""
+
+import argparse
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlparse
+
+
+def slugify(text):
+    """'Fish Tail Lodge Pokhara' -> 'fish_tail_lodge_pokhara'"""
+    return re.sub(r'[^0-9a-z]+', '_', text.lower()).strip('_')
+
+
+class CapturedPagesHandler(BaseHTTPRequestHandler):
+    """Answers Maps search URLs with captured HTML files"""
+
+    pages_dir = '.'
+    default_page = None
+
+    def _find_page(self, query):
+        slug = slugify(query)
+        candidates = [slug, re.sub(r'_pokhara$', '', slug)]
+        for candidate in candidates:
+            path = os.path.join(self.pages_dir, f"{candidate}.html")
+            if os.path.exists(path):
+                return path
+        return self.default_page
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        match = re.match(r'^/maps/search/(.+?)/?$', path)
+        page = self._find_page(unquote(match.group(1))) if match else None
+        if not page or not os.path.exists(page):
+            self.send_error(404, "No captured page for this URL")
+            return
+
+        with open(page, 'rb') as f:
+            body = f.read()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Keep test output quiet
+        pass
+
+
+def start_server(pages_dir, port=0, default_page=None, host='127.0.0.1'):
+    """Serve pages_dir in a background thread; returns (server, base_url)"""
+    if default_page is None:
+        fallback = os.path.join(pages_dir, 'debug_page_source.html')
+        default_page = fallback if os.path.exists(fallback) else None
+
+    handler = type('Handler', (CapturedPagesHandler,),
+                   {'pages_dir': pages_dir, 'default_page': default_page})
+    server = ThreadingHTTPServer((host, port), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}/maps"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve captured Google Maps pages locally")
+    parser.add_argument('pages_dir', help="Directory with captured .html pages")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--default', default=None,
+                        help="Page served when no file matches the query "
+                             "(default: debug_page_source.html in pages_dir)")
+    args = parser.parse_args()
+
+    server, base_url = start_server(args.pages_dir, port=args.port, default_page=args.default)
+    print(f"✓ Serving captured Maps pages from {args.pages_dir}")
+    print(f"  Base URL: {base_url}  (Ctrl+C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Run Metrics for the Pokhara Google Reviews Scraper
+==================================================
+Times each phase of scraping a place (search, opening the place and its
+reviews tab, sorting, scrolling, expanding, extracting), shows live
+throughput with a tqdm progress bar and writes a JSON run report with
+per-place timings, per-phase p50/p95 and histograms, and the same statistics
+for each readiness wait step (see readiness.py).
+
+One RunMetrics can be shared by the scrapers of a worker pool; phase timings
+are kept per thread until the place is finished.
+
+Author: AI Assistant
+Date: 2026-01-20
+"""
+
+import bisect
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import numpy as np
+from tqdm import tqdm
+
+# Upper bucket edges (seconds) of the per-phase histograms
+HISTOGRAM_EDGES = [0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60]
+
+
+def histogram(values, edges=HISTOGRAM_EDGES):
+    """Count values into the buckets <edges[0], edges[0]-edges[1], ..., >=edges[-1]"""
+    labels = [f"<{edges[0]}"]
+    labels += [f"{lo}-{hi}" for lo, hi in zip(edges, edges[1:])]
+    labels.append(f">={edges[-1]}")
+    counts = [0] * len(labels)
+    for value in values:
+        counts[bisect.bisect_right(edges, value)] += 1
+    return dict(zip(labels, counts))
+
+
+def network_transfer(performance_log):
+    """(bytes, responses) finished in a Chrome performance log.
+
+    Sums encodedDataLength of the Network.loadingFinished events: the bytes
+    actually received for each response, headers included, cross-origin or not.
+    """
+    transferred = responses = 0
+    for entry in performance_log:
+        # Most entries are other events; skip them without parsing
+        if 'Network.loadingFinished' not in entry.get('message', ''):
+            continue
+        try:
+            message = json.loads(entry['message'])['message']
+        except (KeyError, ValueError):
+            continue
+        if message.get('method') == 'Network.loadingFinished':
+            transferred += message.get('params', {}).get('encodedDataLength', 0)
+            responses += 1
+    return int(transferred), responses
+
+
+def describe(values):
+    """count/total/mean/p50/p95/max plus a histogram of a list of seconds"""
+    values = np.asarray(values, dtype=float)
+    return {
+        'count': int(values.size),
+        'total': round(float(values.sum()), 3),
+        'mean': round(float(values.mean()), 3),
+        'p50': round(float(np.percentile(values, 50)), 3),
+        'p95': round(float(np.percentile(values, 95)), 3),
+        'max': round(float(values.max()), 3),
+        'histogram': histogram(values.tolist()),
+    }
+
+
+class RunMetrics:
+    """Phase timings and throughput of one scraping run"""
+
+    def __init__(self):
+        self.places = []
+        self.reviews = 0
+        self.started = None
+        self.progress = None
+        self.lock = threading.Lock()
+        self._local = threading.local()
+
+    def _phases(self):
+        """Phase timings of the place the calling thread is scraping"""
+        if not hasattr(self._local, 'phases'):
+            self._local.phases = {}
+        return self._local.phases
+
+    def _waits(self):
+        """Readiness wait timings of the place the calling thread is scraping"""
+        if not hasattr(self._local, 'waits'):
+            self._local.waits = []
+        return self._local.waits
+
+    def add_waits(self, timings):
+        """Add ReadinessWaiter timings ({'step', 'seconds', 'ready'}) to the current place"""
+        self._waits().extend(timings)
+
+    @contextmanager
+    def phase(self, name):
+        """Time a block as one phase of the current place"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            phases = self._phases()
+            phases[name] = phases.get(name, 0.0) + time.perf_counter() - start
+
+    def start_run(self, total_places):
+        """Start the wall clock and the progress bar"""
+        self.started = time.perf_counter()
+        self.progress = tqdm(total=total_places, unit='place', desc='Scraping')
+
+    def reviews_per_minute(self):
+        if self.started is None:
+            return 0.0
+        minutes = (time.perf_counter() - self.started) / 60
+        return self.reviews / minutes if minutes > 0 else 0.0
+
+    def finish_place(self, name, category, reviews, seconds, ok=True):
+        """Close the current place's phases and update the progress bar"""
+        record = {
+            'name': name,
+            'category': category,
+            'ok': ok,
+            'reviews': reviews,
+            'seconds': round(seconds, 3),
+            'phases': {phase: round(value, 3) for phase, value in self._phases().items()},
+            'waits': self._waits(),
+        }
+        self._local.phases = {}
+        self._local.waits = []
+        with self.lock:
+            self.places.append(record)
+            self.reviews += reviews
+            if self.progress is not None:
+                self.progress.update(1)
+                self.progress.set_postfix(reviews=self.reviews,
+                                          per_min=f"{self.reviews_per_minute():.0f}")
+        return record
+
+    def summary(self):
+        """Aggregate report: totals, per-phase statistics and per-place rows"""
+        with self.lock:
+            places = list(self.places)
+            wall = time.perf_counter() - self.started if self.started is not None else 0.0
+
+        by_phase = {}
+        by_wait = {}
+        for record in places:
+            for phase, seconds in record['phases'].items():
+                by_phase.setdefault(phase, []).append(seconds)
+            for wait in record['waits']:
+                by_wait.setdefault(wait['step'], []).append(wait['seconds'])
+
+        return {
+            'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'totals': {
+                'places': len(places),
+                'failed_places': sum(1 for r in places if not r['ok']),
+                'reviews': sum(r['reviews'] for r in places),
+                'wall_seconds': round(wall, 3),
+                'reviews_per_minute': round(self.reviews_per_minute(), 1),
+            },
+            'place_seconds': describe([r['seconds'] for r in places]) if places else {},
+            'phases': {phase: describe(values) for phase, values in by_phase.items()},
+            'waits': {step: describe(values) for step, values in by_wait.items()},
+            'places': places,
+        }
+
+    def write_report(self, path, extra=None):
+        """Close the progress bar, write the JSON report and print the phase table.
+
+        extra holds more top-level sections for the report (e.g. selector hit rates).
+        """
+        if self.progress is not None:
+            self.progress.close()
+            self.progress = None
+        report = self.summary()
+        report.update(extra or {})
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+        totals = report['totals']
+        print(f"\nRun report: {totals['places']} places, {totals['reviews']} reviews, "
+              f"{totals['reviews_per_minute']} reviews/min")
+        print(f"{'phase':<14}{'count':>7}{'p50':>9}{'p95':>9}{'total':>10}")
+        for phase, stats in sorted(report['phases'].items(), key=lambda item: -item[1]['total']):
+            print(f"{phase:<14}{stats['count']:>7}{stats['p50']:>9.2f}{stats['p95']:>9.2f}{stats['total']:>10.1f}")
+        print(f"✓ Saved run report to {path}")
+        return report
@@ -0,0 +1,120 @@
+"""
+Offline HTML Review Parser for the Pokhara Google Reviews Scraper
+=================================================================
+Extracts reviews from a single page_source snapshot (or a saved
+debug_page_source.html) with BeautifulSoup, using the same card selectors as
+the Selenium path (config.REVIEW_SELECTORS). No browser round trips are
+needed, and saved pages can be re-parsed in bulk across worker processes.
+
+Usage:
+    python offline_parser.py pages/*.html --output reparsed_reviews.csv --workers 4
+
+Author: AI Assistant
+Date: 2026-01-13
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+try:
+    import config
+except ImportError:
+    # If running from within Scraper directory
+    import sys
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    import config
+
+from reviews import build_review, parse_rating
+
+try:
+    import lxml  # noqa: F401  (only checked for availability)
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+
+def _text_of(card, selector):
+    """Visible text of the first match inside a card, or None"""
+    el = card.select_one(selector)
+    return el.get_text().strip() if el else None
+
+
+def parse_reviews_html(html, place_name=None, category='', extraction_date=None):
+    """Extract every review card from one HTML snapshot"""
+    selectors = config.REVIEW_SELECTORS
+    soup = BeautifulSoup(html, HTML_PARSER)
+
+    if place_name is None:
+        # Saved pages still carry the place header
+        header = soup.select_one("h1.DUwDvf")
+        place_name = header.get_text().strip() if header else ''
+    if extraction_date is None:
+        extraction_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    extracted = []
+    for card in soup.select(selectors['card']):
+        name = _text_of(card, selectors['reviewer_name'])
+        rating_el = card.select_one(selectors['rating'])
+        date = _text_of(card, selectors['review_date'])
+        text = _text_of(card, selectors['review_text'])
+
+        extracted.append(build_review(
+            place_name, category,
+            name if name is not None else "Anonymous",
+            parse_rating(rating_el.get('aria-label') if rating_el else None),
+            date if date is not None else "Unknown",
+            text if text is not None else "",
+            extraction_date
+        ))
+    return extracted
+
+
+def parse_html_file(path, place_name=None, category=''):
+    """Parse one saved HTML file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        html = f.read()
+    # Use the file time so re-parsing old dumps keeps their original date
+    extraction_date = datetime.fromtimestamp(os.path.getmtime(path)).strftime('%Y-%m-%d %H:%M:%S')
+    return parse_reviews_html(html, place_name=place_name, category=category,
+                              extraction_date=extraction_date)
+
+
+def parse_saved_pages(paths, workers=None):
+    """Parse many saved pages across worker processes; results keep input order"""
+    if workers == 1 or len(paths) <= 1:
+        results = [parse_html_file(p) for p in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(parse_html_file, paths))
+
+    all_reviews = []
+    for path, reviews in zip(paths, results):
+        print(f"✓ {os.path.basename(path)}: {len(reviews)} reviews")
+        all_reviews.extend(reviews)
+    return all_reviews
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-parse saved Google Maps pages offline")
+    parser.add_argument('pages', nargs='+', help="Saved HTML pages (e.g. debug_page_source.html)")
+    parser.add_argument('--output', default='reparsed_reviews.csv', help="CSV file to write")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    reviews = parse_saved_pages(args.pages, workers=args.workers)
+    if reviews:
+        df = pd.DataFrame(reviews)
+        df = df.drop_duplicates(subset=['place_name', 'reviewer_name', 'review_text'])
+        df.to_csv(args.output, index=False, encoding='utf-8-sig')
+        print(f"✓ Saved {len(df)} reviews to {args.output}")
+    else:
+        print("⚠ No reviews found in the given pages")
+
+
+if __name__ == "__main__":
+    main()
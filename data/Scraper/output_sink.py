@@ -0,0 +1,314 @@
+"""
+Streaming Output Sink for the Pokhara Google Reviews Scraper
+============================================================
+Appends only the new rows of each place to the interim CSVs instead of
+rewriting every file after every place. A persistent index of review hashes
+(in the scrape state database) is checked as rows are written, so the save
+cost stays flat however many reviews have been collected and a review is
+never written twice, even by a later run. At the end of the run compact()
+merges the interim rows into the final CSVs, which keep every earlier run's
+reviews.
+
+Two backends share the same interface (reset / write_reviews / write_places /
+compact) and are chosen with config.OUTPUT_BACKEND:
+  'csv'     - utf-8-sig CSVs, as the scraper has always produced
+  'parquet' - a Parquet dataset partitioned by category and extraction day,
+              with typed columns so analyses can load only what they need
+
+Author: AI Assistant
+Date: 2026-01-15
+"""
+
+import os
+import uuid
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    # Only needed for OUTPUT_BACKEND = 'parquet'
+    pa = None
+    pq = None
+
+try:
+    import config
+except ImportError:
+    # If running from within Scraper directory
+    import sys
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    import config
+
+from reviews import REVIEW_FIELDS, review_key, reviews_to_frame
+from state_store import ScrapeStateStore
+
+REVIEW_COLUMNS = list(REVIEW_FIELDS)
+
+# Same subset save_data has always deduplicated on
+DEDUPE_SUBSET = ['place_name', 'reviewer_name', 'review_text']
+
+
+class DedupeIndex:
+    """Persistent set of review keys (seen_reviews in the scrape state DB).
+
+    Every review is looked up by its 16-byte review_key when it is written,
+    in batched SQLite queries, so deduping costs O(1) per review and never
+    loads the output back. The index is shared by both backends and kept
+    across runs.
+    """
+
+    def __init__(self, state):
+        self.state = state
+
+    def filter_new(self, reviews):
+        """Return (new_rows, new_keys) for reviews whose key was not written before"""
+        keyed = [(review_key(review), review) for review in reviews]
+        known = self.state.known_review_keys(set(key for key, _ in keyed))
+        new_rows = []
+        new_keys = []
+        for key, review in keyed:
+            if key in known:
+                continue
+            # Also drops repeats inside this batch
+            known.add(key)
+            new_keys.append((key, review.get('category'), review.get('place_name')))
+            new_rows.append(review)
+        return new_rows, new_keys
+
+    def commit(self, keys):
+        """Persist keys once their rows are safely on disk.
+
+        Writing keys after the rows means a crash can only cause a duplicate
+        row (removed by compact), never a lost one.
+        """
+        if keys:
+            self.state.add_review_keys(keys)
+
+    def clear(self):
+        """Forget every key"""
+        self.state.clear_review_keys()
+
+
+def _append_csv(df, path):
+    """Append rows to a CSV, writing the header (with BOM) only for a new file"""
+    if os.path.exists(path) and os.path.getsize(path) > 0:
+        # Keep the existing column layout so appended rows line up
+        header = pd.read_csv(path, nrows=0, encoding='utf-8-sig').columns
+        df = df.reindex(columns=header)
+        df.to_csv(path, mode='a', header=False, index=False, encoding='utf-8')
+    else:
+        df.to_csv(path, index=False, encoding='utf-8-sig')
+
+
+def _with_existing(df, path):
+    """Rows already in the CSV at path (if any) followed by the rows of df"""
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return df
+    existing = pd.read_csv(path, encoding='utf-8-sig')
+    return pd.concat([existing, df], ignore_index=True)
+
+
+def _sort_by_place(df, name_column, place_order):
+    """Stable sort of rows by the position of (category, name) in place_order"""
+    rank = {key: i for i, key in enumerate(place_order)}
+    order = [rank.get(key, len(rank)) for key in zip(df['category'], df[name_column])]
+    return df.assign(_order=order).sort_values('_order', kind='stable').drop(columns='_order')
+
+
+class CsvStreamingSink:
+    """Append-only CSV writer with an on-disk dedupe index"""
+
+    def __init__(self, output_dir, suffix='_interim', state=None):
+        self.output_dir = output_dir
+        self.suffix = suffix
+        self.reviews_file = self._path('pokhara_reviews', suffix)
+        self.cs_file = self._path('pokhara_reviews_code_switched', suffix)
+        self.places_file = self._path('pokhara_places', suffix)
+        self.index = DedupeIndex(state or ScrapeStateStore.for_output_dir(output_dir))
+
+    def _path(self, stem, suffix):
+        return os.path.join(self.output_dir, f"{stem}{suffix}.csv")
+
+    def reset(self):
+        """Remove interim files to start a fresh run.
+
+        Rows left in them by an unfinished run are merged into the final CSVs
+        first: the dedupe index already counts them as written, so they would
+        otherwise be lost. The index is kept, so reviews written by earlier
+        runs are not written again (use --forget-seen to clear it).
+        """
+        self.compact()
+        for path in (self.reviews_file, self.cs_file, self.places_file):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def write_reviews(self, reviews):
+        """Append reviews not seen before; returns how many rows were written"""
+        new_rows, new_keys = self.index.filter_new(reviews)
+        if not new_rows:
+            return 0
+
+        df = reviews_to_frame(new_rows)
+        _append_csv(df, self.reviews_file)
+
+        # Code-switched subset (for convenience)
+        cs_df = df[df['is_code_switched'] == True]
+        if not cs_df.empty:
+            _append_csv(cs_df, self.cs_file)
+
+        self.index.commit(new_keys)
+        return len(new_rows)
+
+    def write_places(self, places):
+        """Append place rows"""
+        if places:
+            _append_csv(pd.DataFrame(places), self.places_file)
+
+    def compact(self, final_suffix='', place_order=None):
+        """Merge the interim files into the final CSVs in one pass.
+
+        The final CSVs keep the rows of earlier runs: the dedupe index only
+        lets each run append reviews that are new, so the dataset grows run by
+        run. Place rows are replaced by the newest row per place.
+
+        place_order is an optional list of (category, place_name) pairs; rows
+        are stably sorted by it so the output does not depend on the order in
+        which places finished.
+        """
+        if os.path.exists(self.reviews_file):
+            df = pd.read_csv(self.reviews_file, encoding='utf-8-sig')
+            df = _with_existing(df, self._path('pokhara_reviews', final_suffix))
+            df = df.drop_duplicates(subset=DEDUPE_SUBSET)
+            if place_order:
+                df = _sort_by_place(df, 'place_name', place_order)
+            df.to_csv(self._path('pokhara_reviews', final_suffix), index=False, encoding='utf-8-sig')
+
+            cs_df = df[df['is_code_switched'] == True]
+            if not cs_df.empty:
+                cs_df.to_csv(self._path('pokhara_reviews_code_switched', final_suffix),
+                             index=False, encoding='utf-8-sig')
+
+        if os.path.exists(self.places_file):
+            df_places = pd.read_csv(self.places_file, encoding='utf-8-sig')
+            df_places = _with_existing(df_places, self._path('pokhara_places', final_suffix))
+            df_places = df_places.drop_duplicates(subset=['category', 'name'], keep='last')
+            if place_order:
+                df_places = _sort_by_place(df_places, 'name', place_order)
+            df_places.to_csv(self._path('pokhara_places', final_suffix), index=False, encoding='utf-8-sig')
+
+
+class ParquetSink:
+    """Parquet dataset partitioned by category and extraction day.
+
+    Each write appends new part files, so saves stay incremental. The dataset
+    accumulates across runs (partitions keep runs apart), and the dedupe
+    index keeps it free of duplicates; compact() merges each partition's
+    part files into one.
+    """
+
+    REVIEWS_DIR = 'pokhara_reviews_parquet'
+    PLACES_DIR = 'pokhara_places_parquet'
+
+    def __init__(self, output_dir, state=None):
+        if pa is None:
+            raise ImportError("OUTPUT_BACKEND = 'parquet' needs pyarrow: pip install pyarrow")
+        self.output_dir = output_dir
+        self.reviews_dir = os.path.join(output_dir, self.REVIEWS_DIR)
+        self.places_dir = os.path.join(output_dir, self.PLACES_DIR)
+        self.index = DedupeIndex(state or ScrapeStateStore.for_output_dir(output_dir))
+
+    def reset(self):
+        """Nothing to clear: runs are kept apart by the extraction-day partition"""
+
+    def write_reviews(self, reviews):
+        """Append reviews not seen before as new part files; returns rows written"""
+        new_rows, new_keys = self.index.filter_new(reviews)
+        if not new_rows:
+            return 0
+
+        df = reviews_to_typed_frame(reviews_to_frame(new_rows))
+        pq.write_to_dataset(pa.Table.from_pandas(df, preserve_index=False), self.reviews_dir,
+                            partition_cols=['category', 'extraction_day'],
+                            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet")
+        self.index.commit(new_keys)
+        return len(new_rows)
+
+    def write_places(self, places):
+        """Append place rows as a new part file"""
+        if not places:
+            return
+        os.makedirs(self.places_dir, exist_ok=True)
+        df = pd.DataFrame(places)
+        if 'timestamp' in df:
+            df['timestamp'] = pd.to_datetime(df['timestamp'])
+        df.to_parquet(os.path.join(self.places_dir, f"part-{uuid.uuid4().hex}.parquet"), index=False)
+
+    def compact(self, final_suffix='', place_order=None):
+        """Merge the part files of every partition into one file.
+
+        Row order inside the dataset is not meaningful, so place_order and
+        final_suffix are accepted only for interface compatibility.
+        """
+        if os.path.isdir(self.reviews_dir):
+            for root, _, files in os.walk(self.reviews_dir):
+                parts = [f for f in files if f.endswith('.parquet')]
+                if len(parts) > 1:
+                    self._merge_parts(root, parts, dedupe=True)
+        if os.path.isdir(self.places_dir):
+            parts = [f for f in os.listdir(self.places_dir) if f.endswith('.parquet')]
+            if len(parts) > 1:
+                self._merge_parts(self.places_dir, parts, dedupe=False)
+
+    def _merge_parts(self, directory, parts, dedupe):
+        """Replace several part files in one directory by a single file"""
+        paths = [os.path.join(directory, f) for f in sorted(parts)]
+        table = pa.concat_tables([pq.read_table(p) for p in paths], promote_options='default')
+        if dedupe:
+            # Partition columns live in the path, so the subset never needs them
+            df = table.to_pandas().drop_duplicates(subset=DEDUPE_SUBSET)
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        merged = os.path.join(directory, f"part-{uuid.uuid4().hex}-compacted.parquet")
+        pq.write_table(table, merged)
+        for path in paths:
+            os.remove(path)
+
+
+def reviews_to_typed_frame(df):
+    """Apply the Parquet column types and add the extraction_day partition key"""
+    df = df.reindex(columns=REVIEW_COLUMNS)
+    df['rating'] = pd.to_numeric(df['rating'], errors='coerce').fillna(0).astype('int8')
+    df['is_code_switched'] = df['is_code_switched'].astype(bool)
+    df['extraction_date'] = pd.to_datetime(df['extraction_date'])
+    df['extraction_day'] = df['extraction_date'].dt.strftime('%Y-%m-%d')
+    return df
+
+
+def read_reviews(output_dir, columns=None, categories=None, days=None):
+    """Load reviews from the Parquet dataset, reading only the requested columns.
+
+    categories and days ('YYYY-MM-DD') prune whole partitions before any file
+    is opened.
+    """
+    filters = []
+    if categories:
+        filters.append(('category', 'in', list(categories)))
+    if days:
+        filters.append(('extraction_day', 'in', list(days)))
+    return pd.read_parquet(os.path.join(output_dir, ParquetSink.REVIEWS_DIR),
+                           columns=columns, filters=filters or None)
+
+
+def make_sink(output_dir, backend=None, state=None):
+    """Create the output sink selected by config.OUTPUT_BACKEND.
+
+    state is the ScrapeStateStore holding the dedupe index (opened from
+    output_dir when not given).
+    """
+    if backend is None:
+        backend = getattr(config, 'OUTPUT_BACKEND', 'csv')
+    if backend == 'parquet':
+        return ParquetSink(output_dir, state=state)
+    if backend == 'csv':
+        return CsvStreamingSink(output_dir, state=state)
+    raise ValueError(f"Unknown OUTPUT_BACKEND: {backend!r} (expected 'csv' or 'parquet')")
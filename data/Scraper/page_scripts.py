@@ -0,0 +1,325 @@
+"""
+In-Page JavaScript for the Pokhara Google Reviews Scraper
+=========================================================
+JavaScript snippets injected with driver.execute_script(). Keeping them in one
+place lets every engine (Selenium, offline benchmarks, ...) share the same
+DOM logic and the same review selectors from config.REVIEW_SELECTORS.
+
+Author: AI Assistant
+Date: 2026-01-12
+"""
+
+# Selectors for the Reviews tab of a place. Strings starting with "//" are
+# XPath, everything else is CSS. This is only the initial order: the
+# SelectorRegistry tries whichever matched last for the page's language first.
+REVIEW_TAB_SELECTORS = [
+    "button[aria-label*='समीक्षाहरु']",      # Nepali: Reviews
+    "button[aria-label*='Reviews']",         # English
+    "div[role='tablist'] button:nth-child(2)", # Index based
+    "//button[contains(@aria-label, 'समीक्षा')]", # XPath fallback
+    "//button[contains(@aria-label, 'Reviews')]"  # XPath fallback
+]
+
+# Valid selectors for Sort button (English and Nepali and generic), ordered
+# by the SelectorRegistry like REVIEW_TAB_SELECTORS
+SORT_BUTTON_SELECTORS = [
+    "button[aria-label='Sort reviews']", 
+    "button[aria-label*='क्रमबद्ध']", # Nepali: Sort
+    "button[data-value='Sort']",
+    "//button[contains(@aria-label, 'Sort')]",
+    "//button[contains(@aria-label, 'क्रमबद्ध')]"
+]
+
+# Scroll the reviews pane to the bottom; returns its scrollHeight (0 if no pane)
+SCROLL_REVIEWS_SCRIPT = """
+var scrollableDiv = document.querySelector('div.m6QErb.DxyBCb.kA9KIf.dS8AEf.XiKgde') || 
+                     document.querySelector('div[role="main"]') ||
+                     document.querySelector('div[tabindex="-1"]');
+                     
+// Fallback: Try to find ANY div that is scrollable
+if (!scrollableDiv) {
+    var allDivs = document.getElementsByTagName('div');
+    for (var i = 0; i < allDivs.length; i++) {
+        var div = allDivs[i];
+        if (div.scrollHeight > div.clientHeight && div.clientHeight > 0) {
+            scrollableDiv = div;
+            break;
+        }
+    }
+}
+
+if (scrollableDiv) {
+    scrollableDiv.scrollTop = scrollableDiv.scrollHeight;
+    return scrollableDiv.scrollHeight;
+}
+return 0;
+"""
+
+# Number of review cards on the page; arguments[0] is the card selector
+COUNT_CARDS_SCRIPT = "return document.querySelectorAll(arguments[0]).length;"
+
+# Review count shown in the open place's header: the number in its rating
+# summary, 0 when the panel says "No reviews", null when no place header is
+# loaded or the count cannot be read (blocked, captcha or half-loaded pages)
+PLACE_REVIEW_COUNT_SCRIPT = """
+if (!document.querySelector('h1.DUwDvf')) return null;
+var summary = document.querySelector('div.F7nice');
+if (summary) {
+    var digits = (summary.innerText.match(/\\(([\\d.,\\s]+)\\)/) || [])[1];
+    if (digits) return parseInt(digits.replace(/[^\\d]/g, ''), 10);
+}
+var main = document.querySelector('div[role="main"]');
+if (main && /\\bNo reviews\\b/i.test(main.innerText)) return 0;
+return null;
+"""
+
+# Tag the first review card (selector in arguments[0]) before re-sorting the
+# list; returns false if there is none
+MARK_FIRST_CARD_SCRIPT = """
+var card = document.querySelector(arguments[0]);
+if (!card) return false;
+card.setAttribute('data-before-sort', '1');
+return true;
+"""
+
+# True once the first review card is no longer the one MARK_FIRST_CARD_SCRIPT
+# tagged: the list was re-rendered or another review moved to the top
+FIRST_CARD_REPLACED_SCRIPT = """
+var card = document.querySelector(arguments[0]);
+return !!card && !card.hasAttribute('data-before-sort');
+"""
+
+# Find the scrollable reviews pane once per place; the returned element is
+# kept as a handle for the scroll loop. arguments[0] is the card selector.
+# Walks up from the first card to its scrolling ancestor, then tries the known
+# pane selectors; the full div scan only runs if both fail.
+FIND_SCROLL_CONTAINER_SCRIPT = """
+function scrollable(el) { return el.scrollHeight > el.clientHeight && el.clientHeight > 0; }
+var card = document.querySelector(arguments[0]);
+for (var el = card ? card.parentElement : null; el; el = el.parentElement) {
+    if (scrollable(el)) return el;
+}
+var known = document.querySelector('div.m6QErb.DxyBCb.kA9KIf.dS8AEf.XiKgde') ||
+            document.querySelector('div[role="main"]') ||
+            document.querySelector('div[tabindex="-1"]');
+if (known) return known;
+var allDivs = document.getElementsByTagName('div');
+for (var i = 0; i < allDivs.length; i++) {
+    if (scrollable(allDivs[i])) return allDivs[i];
+}
+return null;
+"""
+
+# Scroll the cached pane (arguments[0], or the page if null) to the bottom and
+# count the cards (arguments[1]) inside it in the same call. Cards removed by
+# HARVEST_CARDS_SCRIPT still count (root.__prunedCards).
+# Returns [scrollHeight, card_count].
+SCROLL_CONTAINER_SCRIPT = """
+var root = arguments[0] || document;
+var pane = arguments[0] || document.scrollingElement;
+pane.scrollTop = pane.scrollHeight;
+return [pane.scrollHeight, root.querySelectorAll(arguments[1]).length + (root.__prunedCards || 0)];
+"""
+
+# Cards seen so far in the pane (arguments[0], or the page if null), pruned
+# ones included. arguments[1] is the card selector.
+COUNT_SEEN_CARDS_SCRIPT = """
+var root = arguments[0] || document;
+return root.querySelectorAll(arguments[1]).length + (root.__prunedCards || 0);
+"""
+
+# Scroll the cached pane and wait (execute_async_script) for more than
+# arguments[2] cards matching arguments[1], all in one round trip.
+# arguments[0] is the pane (or null for the page). A MutationObserver on the
+# pane re-checks on every DOM change instead of polling; once the count has
+# grown it waits until the pane has been quiet for arguments[4] ms so the
+# whole batch is in. Gives up after arguments[3] ms.
+# Calls back with [scrollHeight, card_count, ms_until_first_new_card or -1].
+SCROLL_AND_WAIT_SCRIPT = """
+var pane = arguments[0], cardSelector = arguments[1], lastCount = arguments[2];
+var timeoutMs = arguments[3], settleMs = arguments[4];
+var done = arguments[arguments.length - 1];
+var root = pane || document;
+var scroller = pane || document.scrollingElement;
+var start = performance.now();
+var firstNew = -1, finished = false, observer = null, timer = null, settle = null;
+function count() { return root.querySelectorAll(cardSelector).length + (root.__prunedCards || 0); }
+function finish() {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearTimeout(timer);
+    clearTimeout(settle);
+    done([scroller.scrollHeight, count(), firstNew]);
+}
+function check() {
+    if (count() > lastCount) {
+        if (firstNew < 0) firstNew = Math.round(performance.now() - start);
+        clearTimeout(settle);
+        settle = setTimeout(finish, settleMs);
+    }
+}
+scroller.scrollTop = scroller.scrollHeight;
+observer = new MutationObserver(check);
+observer.observe(pane || document.body, {childList: true, subtree: true});
+timer = setTimeout(finish, timeoutMs);
+check();
+"""
+
+# Expand 'More' buttons in reviews
+EXPAND_MORE_SCRIPT = """
+var buttons = document.querySelectorAll('button.w8B4Bf');
+buttons.forEach(function(btn) {
+    try { btn.click(); } catch(e) {}
+});
+"""
+
+# Probe every selector in arguments[0] (CSS, or XPath when it starts with
+# "//") in one call and click the first one that matches. Returns
+# [index clicked or -1, [matched per selector], page language] for
+# SelectorRegistry (selector_registry.py).
+PROBE_SELECTORS_SCRIPT = """
+var selectors = arguments[0];
+var clicked = -1;
+var present = [];
+for (var i = 0; i < selectors.length; i++) {
+    var el = null;
+    if (selectors[i].indexOf('//') === 0) {
+        el = document.evaluate(selectors[i], document, null,
+                               XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    } else {
+        el = document.querySelector(selectors[i]);
+    }
+    present.push(!!el);
+    if (el && clicked < 0) {
+        el.click();
+        clicked = i;
+    }
+}
+return [clicked, present, document.documentElement.lang || ''];
+"""
+
+# Serialise every loaded review card to plain data in ONE WebDriver round trip.
+# arguments[0] is config.REVIEW_SELECTORS. Returns a list of
+# [reviewer_name, rating_aria_label, review_date, review_text] where missing
+# fields are null, so Python applies the same defaults as the per-element path.
+EXTRACT_REVIEWS_SCRIPT = """
+var sel = arguments[0];
+var cards = document.querySelectorAll(sel.card);
+var out = [];
+function textOf(card, css) {
+    var el = card.querySelector(css);
+    return el ? el.innerText : null;
+}
+for (var i = 0; i < cards.length; i++) {
+    var card = cards[i];
+    var ratingEl = card.querySelector(sel.rating);
+    out.push([
+        textOf(card, sel.reviewer_name),
+        ratingEl ? ratingEl.getAttribute('aria-label') : null,
+        textOf(card, sel.review_date),
+        textOf(card, sel.review_text)
+    ]);
+}
+return out;
+"""
+
+# Bytes and number of requests the current page has transferred so far
+# (navigation document plus every resource/XHR), from resource timings.
+# Cross-origin responses without a Timing-Allow-Origin header report 0 bytes,
+# so this is only a lower bound, used when Chrome's performance log (see
+# metrics.network_transfer) cannot be read. Returns [bytes, requests].
+PAGE_WEIGHT_SCRIPT = """
+var entries = performance.getEntriesByType('navigation')
+    .concat(performance.getEntriesByType('resource'));
+var bytes = 0;
+for (var i = 0; i < entries.length; i++) {
+    bytes += entries[i].transferSize || 0;
+}
+return [bytes, entries.length];
+"""
+
+# Keep every resource timing entry so PAGE_WEIGHT_SCRIPT sees the scroll XHRs
+# (the browser default buffer holds 250)
+RESOURCE_BUFFER_SCRIPT = "performance.setResourceTimingBufferSize(10000);"
+
+# True when Google's cookie consent page (consent.google.com or an inline
+# consent form) is shown instead of Maps
+CONSENT_WALL_SCRIPT = """
+return location.hostname.indexOf('consent.') === 0 ||
+       !!document.querySelector('form[action*="consent"]');
+"""
+
+# Accept the consent page: the last consent form is "Accept all". Returns
+# true if a button was clicked.
+DISMISS_CONSENT_SCRIPT = """
+var forms = document.querySelectorAll('form[action*="consent"]');
+if (!forms.length) return false;
+var button = forms[forms.length - 1].querySelector('button, input[type="submit"]');
+if (!button) return false;
+button.click();
+return true;
+"""
+
+# Streaming harvest, step 1: click "More" on the cards not harvested yet.
+# arguments[0] is the card selector, arguments[1] the pane (or null).
+# Returns the number of buttons clicked; Maps swaps in the full text
+# asynchronously, so the cards are read by a separate HARVEST_CARDS_SCRIPT call.
+EXPAND_FRESH_CARDS_SCRIPT = """
+var root = arguments[1] || document;
+var buttons = root.querySelectorAll(arguments[0] + ':not([data-harvested]) button.w8B4Bf');
+for (var i = 0; i < buttons.length; i++) {
+    try { buttons[i].click(); } catch (e) {}
+}
+return buttons.length;
+"""
+
+# Streaming harvest, step 2: serialise only the cards not harvested before
+# (same row format as EXTRACT_REVIEWS_SCRIPT) and mark them harvested.
+# arguments[0] is config.REVIEW_SELECTORS, arguments[1] the pane (or null). With arguments[2] true, harvested cards
+# are removed from the DOM except the last arguments[3], so the tab's node
+# count stays flat; removed cards are tallied in root.__prunedCards.
+HARVEST_CARDS_SCRIPT = """
+var sel = arguments[0], root = arguments[1] || document;
+var prune = arguments[2], keep = arguments[3];
+var fresh = root.querySelectorAll(sel.card + ':not([data-harvested])');
+var out = [];
+function textOf(card, css) {
+    var el = card.querySelector(css);
+    return el ? el.innerText : null;
+}
+for (var i = 0; i < fresh.length; i++) {
+    var card = fresh[i];
+    var ratingEl = card.querySelector(sel.rating);
+    out.push([
+        textOf(card, sel.reviewer_name),
+        ratingEl ? ratingEl.getAttribute('aria-label') : null,
+        textOf(card, sel.review_date),
+        textOf(card, sel.review_text)
+    ]);
+    card.setAttribute('data-harvested', '1');
+}
+if (prune) {
+    var harvested = root.querySelectorAll(sel.card + '[data-harvested]');
+    var removable = harvested.length - keep;
+    for (var j = 0; j < removable; j++) harvested[j].remove();
+    if (removable > 0) root.__prunedCards = (root.__prunedCards || 0) + removable;
+}
+return out;
+"""
+
+# Reviewer name and text of the cards from index arguments[1] onwards, used to
+# spot an already-scraped review while scrolling. arguments[0] is
+# config.REVIEW_SELECTORS; arguments[2] optionally limits the lookup to the
+# cached reviews pane.
+CARD_KEYS_SCRIPT = """
+var sel = arguments[0];
+var cards = (arguments[2] || document).querySelectorAll(sel.card);
+var out = [];
+for (var i = arguments[1]; i < cards.length; i++) {
+    var nameEl = cards[i].querySelector(sel.reviewer_name);
+    var textEl = cards[i].querySelector(sel.review_text);
+    out.push([nameEl ? nameEl.innerText : 'Anonymous', textEl ? textEl.innerText : '']);
+}
+return out;
+"""
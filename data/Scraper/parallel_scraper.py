@@ -0,0 +1,189 @@
+"""
+Parallel Scraping Pool for the Pokhara Google Reviews Scraper
+=============================================================
+Runs several independent WebDriver sessions side by side. Every worker owns
+its own GoogleMapsSeleniumScraper (and so its own browser) and pulls places
+from a shared queue until the queue is empty.
+
+Place rows are merged back in config order, and the output is compacted in
+config order, so the final CSVs are identical no matter which worker
+finished first.
+
+A worker whose browser cannot start leaves its places to the others; if no
+worker could start one, the places still queued are journaled as failed so
+the next --resume picks them up.
+
+Author: AI Assistant
+Date: 2026-01-12
+"""
+
+import os
+import queue
+import threading
+
+try:
+    import config
+except ImportError:
+    # If running from within Scraper directory
+    import sys
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    import config
+
+from state_store import JOB_FAILED
+
+
+class ScraperPool:
+    """Pool of N browser sessions scraping places from a shared queue"""
+
+    def __init__(self, output_dir, pool_size=None, driver_factory=None, metrics=None,
+                 on_review_batch=None, scheduler=None, breaker=None):
+        self.output_dir = output_dir
+        self.pool_size = pool_size or getattr(config, 'WEB_SCRAPE_POOL_SIZE', 1)
+        # Callable returning a WebDriver; a fake driver can be passed for tests
+        self.driver_factory = driver_factory
+        # RunMetrics shared by every worker's scraper (phase timings, progress)
+        self.metrics = metrics
+        # Receives review batches harvested while scrolling (streaming mode),
+        # called under the pool lock like on_place_done
+        self.on_review_batch = on_review_batch
+        # Shared PlaceScheduler: records every worker's places and holds the
+        # run deadline; places that no longer fit are skipped
+        self.scheduler = scheduler
+        # Shared CircuitBreaker: failures of all workers count together, and
+        # an open breaker pauses and rotates every worker's session
+        self.breaker = breaker
+        self.results = {}
+        self.skipped = []
+        # Places left in the queue because no worker could start a browser
+        self.failed = []
+        # Workers whose browser started or is still starting
+        self.active_workers = 0
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.threads = []
+
+    def _make_scraper(self, worker_id):
+        """Create the per-worker scraper instance"""
+        from pokhara_google_reviews_scraper import GoogleMapsSeleniumScraper
+        return GoogleMapsSeleniumScraper(output_dir=self.output_dir,
+                                         driver_factory=self.driver_factory,
+                                         browser_slot=worker_id,
+                                         metrics=self.metrics)
+
+    def _worker(self, worker_id, tasks, on_place_done):
+        """Pull places from the queue until it is empty or the pool is stopped"""
+        scraper = self._make_scraper(worker_id)
+        if self.on_review_batch:
+            scraper.on_review_batch = self._locked_batch_writer
+        if self.scheduler:
+            scraper.scheduler = self.scheduler
+        if self.breaker:
+            scraper.breaker = self.breaker
+        try:
+            scraper.setup_driver()
+        except Exception as e:
+            print(f"⚠ Worker {worker_id}: could not start browser: {e}")
+            with self.lock:
+                self.active_workers -= 1
+                last = self.active_workers == 0
+            if last:
+                self._fail_queued(scraper, tasks, f"crash: no browser could be started ({e})")
+            return
+
+        try:
+            while not self.stop_event.is_set():
+                try:
+                    index, category, name = tasks.get_nowait()
+                except queue.Empty:
+                    break
+
+                if self.scheduler and not self.scheduler.fits(category, name):
+                    with self.lock:
+                        self.skipped.append(name)
+                    continue
+
+                # Errors are caught and journaled by run_place_job
+                result = scraper.run_place_job(name, category)
+
+                if result:
+                    reviews, place_row = result
+                    with self.lock:
+                        # Reviews go to on_place_done only, so the pool does
+                        # not keep every review in memory
+                        self.results[index] = place_row
+                        if on_place_done:
+                            on_place_done(reviews, place_row)
+        finally:
+            if scraper.driver:
+                try:
+                    scraper.driver.quit()
+                except Exception:
+                    pass
+
+    def _fail_queued(self, scraper, tasks, error):
+        """Journal every place still queued as failed (no worker left to scrape it)"""
+        while True:
+            try:
+                _, category, name = tasks.get_nowait()
+            except queue.Empty:
+                break
+            print(f"❌ {name} not scraped: {error}")
+            scraper.state.mark_job(category, name, JOB_FAILED, error=error)
+            if self.metrics:
+                self.metrics.finish_place(name, category, 0, 0.0, ok=False)
+            with self.lock:
+                self.failed.append(name)
+
+    def _locked_batch_writer(self, batch):
+        with self.lock:
+            self.on_review_batch(batch)
+
+    def run(self, places, on_place_done=None, order=None):
+        """Scrape every (category -> names) entry in places with pool_size workers.
+
+        order is an optional list of (category, name) pairs to hand out the
+        places in (e.g. PlaceScheduler.order); results stay in config order.
+        """
+        indexes = {}
+        for category, names in places.items():
+            for name in names:
+                indexes[(category, name)] = len(indexes)
+        tasks = queue.Queue()
+        for category, name in order or indexes:
+            tasks.put((indexes[(category, name)], category, name))
+        index = len(indexes)
+
+        workers = min(self.pool_size, index) or 1
+        if workers > 1 and self.driver_factory is None and getattr(config, 'CHROME_DEBUGGER_ADDRESS', None):
+            raise ValueError("CHROME_DEBUGGER_ADDRESS attaches every worker to the same browser tab; "
+                             "use WEB_SCRAPE_WARM_BROWSERS or a pool size of 1")
+        print(f"Starting scraper pool with {workers} browser sessions for {index} places...")
+
+        self.threads = []
+        self.active_workers = workers
+        for worker_id in range(workers):
+            t = threading.Thread(target=self._worker,
+                                 args=(worker_id, tasks, on_place_done),
+                                 name=f"scraper-worker-{worker_id}",
+                                 daemon=True)
+            t.start()
+            self.threads.append(t)
+
+        self.wait()
+        return self.merged_results()
+
+    def wait(self):
+        """Block until all workers have exited"""
+        # Join with a timeout so Ctrl+C still reaches the main thread
+        for t in self.threads:
+            while t.is_alive():
+                t.join(timeout=0.5)
+
+    def stop(self):
+        """Ask workers to stop after their current place"""
+        self.stop_event.set()
+
+    def merged_results(self):
+        """Return the scraped place rows in config order"""
+        with self.lock:
+            return [self.results[index] for index in sorted(self.results)]
@@ -0,0 +1,38 @@
+"""
+Place URL Helpers for the Pokhara Google Reviews Scraper
+========================================================
+Once a place has been found through search, the URL Maps shows for its
+reviews view is stored in the state database (see state_store.py), so
+later runs open the place directly instead of searching for it again.
+
+These helpers decide which URLs are worth keeping and pull the place's
+feature ID (0x...:0x...) out of the URL's data parameter.
+
+Author: AI Assistant
+Date: 2026-01-23
+"""
+
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Feature ID of the place inside the data=... part of a place URL
+FEATURE_ID_PATTERN = re.compile(r'!1s(0x[0-9a-f]+:0x[0-9a-f]+)')
+
+
+def is_place_url(url):
+    """True for the URL of a single place (not a search result list)"""
+    return bool(url) and '/maps/place/' in urlsplit(url).path
+
+
+def place_id_from_url(url):
+    """The place's feature ID from its URL, or None"""
+    match = FEATURE_ID_PATTERN.search(url or '')
+    return match.group(1) if match else None
+
+
+def with_language(url, language='en'):
+    """The URL with hl=<language>, replacing any other language"""
+    parts = urlsplit(url)
+    query = [(key, value) for key, value in parse_qsl(parts.query) if key != 'hl']
+    query.append(('hl', language))
+    return urlunsplit(parts._replace(query=urlencode(query)))
@@ -8,12 +8,13 @@ Author: AI Assistant
 Date: 2026-01-01
 """
 
+import argparse
+import base64
 import time
 import re
 import os
 import pandas as pd
 from datetime import datetime
-from tqdm import tqdm
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -22,7 +23,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import SessionNotCreatedException, StaleElementReferenceException
 
 # Import existing configuration
 try:
@@ -33,62 +34,279 @@ except ImportError:
     sys.path.append(os.path.dirname(os.path.abspath(__file__)))
     import config
 
+from browser_pool import BrowserPool, cached_driver_path
+from metrics import RunMetrics, network_transfer
+from code_switch import is_code_switched
+from offline_parser import parse_reviews_html
+from output_sink import make_sink
+from page_scripts import (CARD_KEYS_SCRIPT, CONSENT_WALL_SCRIPT, COUNT_CARDS_SCRIPT, COUNT_SEEN_CARDS_SCRIPT,
+                          DISMISS_CONSENT_SCRIPT, EXPAND_FRESH_CARDS_SCRIPT, EXPAND_MORE_SCRIPT,
+                          EXTRACT_REVIEWS_SCRIPT, FIND_SCROLL_CONTAINER_SCRIPT,
+                          HARVEST_CARDS_SCRIPT, MARK_FIRST_CARD_SCRIPT, PAGE_WEIGHT_SCRIPT,
+                          PLACE_REVIEW_COUNT_SCRIPT, RESOURCE_BUFFER_SCRIPT, SCROLL_AND_WAIT_SCRIPT, SCROLL_CONTAINER_SCRIPT)
+from place_urls import is_place_url, place_id_from_url, with_language
+from review_buffer import ReviewBuffer
+from review_payloads import PayloadCache, parse_review_payload, review_responses
+from reviews import build_review, drop_known_reviews, parse_rating, review_fingerprint
+from retry_policy import (CircuitBreaker, PlaceFailure, RetryPolicy, classify_error,
+                          ERROR_CONSENT_WALL, ERROR_CRASH, ERROR_NO_REVIEWS, ERROR_SELECTOR_MISSING,
+                          ERROR_TIMEOUT)
+from scheduler import PlaceScheduler
+from scroll_controller import AdaptiveScrollController
+from selector_registry import SelectorRegistry
+from state_store import ScrapeStateStore, JOB_DONE, JOB_FAILED, JOB_RUNNING
+from readiness import (ReadinessWaiter, elements_present, elements_absent, count_greater_than, all_of,
+                       first_card_replaced)
+
 class GoogleMapsSeleniumScraper:
     """Scraper using Selenium to extract reviews from Google Maps without API key"""
     
-    def __init__(self, output_dir='pokhara_reviews'):
+    def __init__(self, output_dir='pokhara_reviews', driver_factory=None, browser_slot=0,
+                 metrics=None):
         self.output_dir = output_dir
         os.makedirs(self.output_dir, exist_ok=True)
+        # Optional callable returning a ready WebDriver (used by the worker
+        # pool and to plug in a fake driver instead of Chrome)
+        self.driver_factory = driver_factory
+        # Which warm browser/profile this scraper uses (one per pool worker)
+        self.browser_slot = browser_slot
+        # Phase timings and throughput; shared by all workers of a pool
+        self.metrics = metrics or RunMetrics()
+        # Callable receiving each batch of reviews harvested while scrolling
+        # (streaming mode); set by scrape_all_from_config / the worker pool
+        self.on_review_batch = None
         self.driver = None
-        self.all_reviews = []
+        self.waiter = None
         self.places_data = []
+        # Per-place high-water marks for incremental runs
+        self.state = ScrapeStateStore.for_output_dir(self.output_dir)
+        # Place order and run deadline from past runs' history (scheduler.py)
+        self.scheduler = PlaceScheduler(self.state, target=self.review_target)
+        # Learned order of the Reviews tab / Sort button selectors
+        self.selectors = SelectorRegistry(self.state)
+        # Retries of failed places and a breaker shared by all workers of a pool
+        self.retry_policy = RetryPolicy()
+        self.breaker = CircuitBreaker()
+        self.session_generation = 0
+        # Places scraped on the current browser session (recycled after
+        # WEB_SCRAPE_RECYCLE_AFTER_PLACES)
+        self.places_on_session = 0
+        # Error kind of the last failed attempt to open a place's reviews
+        self.last_failure = None
+        # Append-only output backend (config.OUTPUT_BACKEND)
+        self.sink = make_sink(self.output_dir, state=self.state)
+        # Compact records waiting to be written; flushed after every place
+        self.review_buffer = ReviewBuffer(self.sink)
+        # Parse reviews from Maps' background review requests instead of the DOM
+        self.capture_xhr = getattr(config, 'WEB_SCRAPE_CAPTURE_XHR', False)
+        # Open places from their cached URLs instead of searching (see place_urls.py)
+        self.cache_place_urls = getattr(config, 'WEB_SCRAPE_CACHE_PLACE_URLS', True)
+        self.payload_cache = PayloadCache(os.path.join(self.output_dir, 'xhr_cache')) if self.capture_xhr else None
+        # Bytes and responses the current place has transferred (see page_weight)
+        self.page_bytes = 0
+        self.page_requests = 0
 
     def setup_driver(self):
         """Set up Chrome WebDriver"""
+        self.session_generation = self.breaker.generation
+        self.places_on_session = 0
+        if self.driver_factory is not None:
+            self.driver = self.driver_factory()
+            self.waiter = ReadinessWaiter(self.driver)
+            return
+
+        start = time.perf_counter()
         chrome_options = Options()
-        
-        # Add options from config
-        if hasattr(config, 'CHROME_OPTIONS'):
-            for option in config.CHROME_OPTIONS:
-                chrome_options.add_argument(option)
+
+        # Attach to an already running Chrome: either one given explicitly or
+        # a warm pooled browser kept alive between runs
+        debugger_address = getattr(config, 'CHROME_DEBUGGER_ADDRESS', None)
+        if not debugger_address and getattr(config, 'WEB_SCRAPE_WARM_BROWSERS', False):
+            debugger_address = BrowserPool().acquire(self.browser_slot,
+                                                     extra_args=self._chrome_arguments())
+
+        if debugger_address:
+            # chromedriver rejects launch-only options when attaching
+            chrome_options.debugger_address = debugger_address
         else:
-            # Fallback defaults if config is missing options
-            chrome_options.add_argument('--start-maximized')
-            chrome_options.add_argument('--lang=en-US')
-            
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
+            for option in self._chrome_arguments():
+                chrome_options.add_argument(option)
+            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+            chrome_options.add_experimental_option('useAutomationExtension', False)
+            if getattr(config, 'WEB_SCRAPE_BLOCK_RESOURCES', False):
+                # Also stop images the URL patterns miss (inline backgrounds, new hosts)
+                chrome_options.add_experimental_option(
+                    'prefs', {'profile.managed_default_content_settings.images': 2})
         
         # You can add --headless here if you don't want to see the browser
         # chrome_options.add_argument('--headless')
 
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        print("✓ Chrome WebDriver ready!")
+        # Network events land in the performance log, for the page weight and
+        # for collect_review_payloads
+        chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+        # Cached driver path: no version lookup over the network on repeat runs
+        try:
+            self.driver = webdriver.Chrome(service=Service(cached_driver_path()), options=chrome_options)
+        except SessionNotCreatedException as e:
+            # Usually Chrome updated and no longer matches the cached chromedriver
+            print(f"⚠ Cached chromedriver was rejected ({str(e).strip().splitlines()[0]}), "
+                  f"installing a matching one...")
+            self.driver = webdriver.Chrome(service=Service(cached_driver_path(refresh=True)),
+                                           options=chrome_options)
+        self.driver.set_page_load_timeout(getattr(config, 'WEB_SCRAPE_PAGE_LOAD_TIMEOUT', 60))
+        self.waiter = ReadinessWaiter(self.driver)
+        self.block_resources()
+        attached = f", attached to {debugger_address}" if debugger_address else ""
+        print(f"✓ Chrome WebDriver ready! ({time.perf_counter() - start:.1f}s{attached})")
+
+    def session_alive(self):
+        """Whether the browser session still answers"""
+        if self.driver is None:
+            return False
+        try:
+            self.driver.execute_script("return 1;")
+            return True
+        except Exception:
+            return False
+
+    def restart_driver(self):
+        """Replace the browser session with a fresh one.
+
+        A warm pooled browser is stopped too, so the new session does not
+        inherit its memory. Starting is retried WEB_SCRAPE_RESTART_ATTEMPTS
+        times; scraped data held in memory is not touched.
+        """
+        print("⚠ Restarting browser session...")
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+        self.driver = None
+        if (self.driver_factory is None and not getattr(config, 'CHROME_DEBUGGER_ADDRESS', None)
+                and getattr(config, 'WEB_SCRAPE_WARM_BROWSERS', False)):
+            BrowserPool().release(self.browser_slot)
+
+        attempts = max(1, getattr(config, 'WEB_SCRAPE_RESTART_ATTEMPTS', 3))
+        for attempt in range(1, attempts + 1):
+            try:
+                self.setup_driver()
+                return
+            except Exception as e:
+                print(f"⚠ Could not start browser (attempt {attempt}/{attempts}): {e}")
+                if attempt == attempts:
+                    raise
+                time.sleep(2 * attempt)
+
+    def ensure_session(self):
+        """Health check before a place: recycle an old session, replace a dead one"""
+        recycle_after = getattr(config, 'WEB_SCRAPE_RECYCLE_AFTER_PLACES', 0)
+        if recycle_after and self.places_on_session >= recycle_after:
+            print(f"Recycling browser session after {self.places_on_session} places...")
+            self.restart_driver()
+        elif not self.session_alive():
+            print("⚠ Browser session is not responding")
+            self.restart_driver()
+
+    def failure_kind(self):
+        """Error kind of a place whose reviews could not be opened"""
+        try:
+            if self.driver.execute_script(CONSENT_WALL_SCRIPT):
+                return ERROR_CONSENT_WALL
+        except Exception as e:
+            return classify_error(e)
+        return self.last_failure or ERROR_SELECTOR_MISSING
+
+    def recover(self, kind):
+        """Get the session ready for a retry after a failure of the given kind"""
+        if kind == ERROR_CRASH:
+            self.restart_driver()
+        elif kind == ERROR_CONSENT_WALL:
+            try:
+                if self.driver.execute_script(DISMISS_CONSENT_SCRIPT):
+                    print("✓ Accepted the consent page")
+            except Exception as e:
+                print(f"⚠ Could not dismiss the consent page: {e}")
+
+    def block_resources(self):
+        """Block images, map tiles, media and fonts the scraper never reads"""
+        patterns = getattr(config, 'WEB_SCRAPE_BLOCKED_URLS', [])
+        if not getattr(config, 'WEB_SCRAPE_BLOCK_RESOURCES', False) or not patterns:
+            return
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+            print(f"✓ Blocking {len(patterns)} resource URL patterns")
+        except Exception as e:
+            print(f"⚠ Could not enable resource blocking: {e}")
+
+    def read_performance_log(self):
+        """Drain Chrome's performance log, adding its finished responses to the page weight"""
+        entries = self.driver.get_log('performance')
+        transferred, responses = network_transfer(entries)
+        self.page_bytes += transferred
+        self.page_requests += responses
+        return entries
+
+    def page_weight(self):
+        """(bytes, requests) transferred for the current place so far.
+
+        Counted from the performance log since scrape_place started; if the
+        log cannot be read, the page's resource timings give a lower bound.
+        """
+        try:
+            self.read_performance_log()
+            return self.page_bytes, self.page_requests
+        except Exception:
+            pass
+        try:
+            transferred, requests = self.driver.execute_script(PAGE_WEIGHT_SCRIPT)
+            return int(transferred), int(requests)
+        except Exception:
+            return None, None
+
+    def _chrome_arguments(self):
+        """Command-line switches for a Chrome this scraper launches"""
+        # Add options from config
+        if hasattr(config, 'CHROME_OPTIONS'):
+            arguments = list(config.CHROME_OPTIONS)
+        else:
+            # Fallback defaults if config is missing options
+            arguments = ['--start-maximized', '--lang=en-US']
+        arguments.append('--disable-blink-features=AutomationControlled')
+        return arguments
 
     def search_and_navigate(self, query):
         """Search for a place and navigate to its reviews"""
         print(f"\nSearching for: {query}")
-        self.driver.get(f"https://www.google.com/maps/search/{query}?hl=en")
-        time.sleep(5)
+        with self.metrics.phase('search'):
+            self.driver.get(f"{config.MAPS_BASE_URL}/search/{query}?hl=en")
+            try:
+                self.driver.execute_script(RESOURCE_BUFFER_SCRIPT)
+            except Exception:
+                pass
         
         # Check if we landed on a specific place or a list
         try:
             # Wait for either a result link or the place details header
             print("Waiting for search results...")
-            WebDriverWait(self.driver, 10).until(
-                lambda d: d.find_elements(By.CSS_SELECTOR, "a.hfpxzc") or 
-                          d.find_elements(By.CSS_SELECTOR, "h1.DUwDvf")
-            )
+            with self.metrics.phase('search'):
+                if not self.waiter.wait_for('search_results',
+                                            elements_present("a.hfpxzc", "h1.DUwDvf")):
+                    print("⚠ Search results did not appear in time")
             
             # If we see a list of results (links with class hfpxzc), click the first one
             results = self.driver.find_elements(By.CSS_SELECTOR, "a.hfpxzc")
             if results:
                 print(f"Found {len(results)} results, clicking the first one...")
                 try:
-                    self.driver.execute_script("arguments[0].click();", results[0])
-                    time.sleep(5) # Wait for details to slide in
+                    with self.metrics.phase('open_place'):
+                        self.driver.execute_script("arguments[0].click();", results[0])
+                        # Wait for details to slide in (header plus the tab strip)
+                        self.waiter.wait_for('place_details', all_of(
+                            elements_present("h1.DUwDvf"),
+                            elements_present("div[role='tablist'] button")))
                 except Exception as e:
                     print(f"Could not click result: {e}")
             else:
@@ -97,141 +315,262 @@ class GoogleMapsSeleniumScraper:
         except Exception as e:
             print(f"Search navigation warning: {e}")
 
-        # Try to find the "Reviews" tab
+        return self.open_reviews_tab()
+
+    def open_place(self, name, category, query):
+        """Open a place's reviews, straight from its cached URL when there is one"""
+        self.last_failure = None
+        cached_url = self.state.get_place_url(category, name) if self.cache_place_urls else None
+        if cached_url:
+            if self.navigate_to_place(cached_url):
+                return True
+            print(f"⚠ Cached URL for {name} no longer works, searching again")
+            self.state.forget_place_url(category, name)
+
+        if not self.search_and_navigate(query):
+            return False
+        if self.cache_place_urls:
+            self._remember_place_url(name, category)
+        return True
+
+    def navigate_to_place(self, url):
+        """Open a place from its URL (no search) and navigate to its reviews"""
+        print(f"\nOpening cached place URL: {url}")
+        with self.metrics.phase('open_place'):
+            self.driver.get(with_language(url))
+            try:
+                self.driver.execute_script(RESOURCE_BUFFER_SCRIPT)
+            except Exception:
+                pass
+            if not self.waiter.wait_for('place_details', all_of(
+                    elements_present("h1.DUwDvf"),
+                    elements_present("div[role='tablist'] button"))):
+                return False
+        return self.open_reviews_tab()
+
+    def _remember_place_url(self, name, category):
+        """Cache the URL of the place the search led to"""
         try:
-            # Try multiple selectors for the reviews tab/button
-            # Prioritize Nepali since environment defaults to it
-            review_selectors = [
-                "button[aria-label*='समीक्षाहरु']",      # Nepali: Reviews
-                "button[aria-label*='Reviews']",         # English
-                "div[role='tablist'] button:nth-child(2)", # Index based
-                "//button[contains(@aria-label, 'समीक्षा')]", # XPath fallback
-                "//button[contains(@aria-label, 'Reviews')]"  # XPath fallback
-            ]
-            
-            for selector in review_selectors:
-                try:
-                    if selector.startswith("//"):
-                        reviews_tab = self.driver.find_element(By.XPATH, selector)
-                    else:
-                        reviews_tab = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    reviews_tab.click()
+            url = self.driver.current_url
+        except Exception as e:
+            print(f"⚠ Could not read the URL of {name}: {e}")
+            return
+        if is_place_url(url):
+            self.state.set_place_url(category, name, url, place_id_from_url(url))
+        else:
+            print(f"⚠ Not caching a URL for {name}: {url} is not a place page")
+
+    def open_reviews_tab(self):
+        """Click the Reviews tab of the open place and wait for review cards.
+
+        All tab selectors are probed in one script call, the one that worked
+        last first (see selector_registry.py). If the clicked tab shows no
+        reviews, the remaining selectors are tried.
+        """
+        clicked = []
+        try:
+            with self.metrics.phase('open_reviews'):
+                while True:
+                    selector = self.selectors.click_first(self.driver, 'review_tab', exclude=clicked)
+                    if selector is None:
+                        break
+                    clicked.append(selector)
                     print("✓ Navigated to Reviews tab")
-                    
+
                     # Wait for reviews to load
                     print("Waiting for reviews to appear...")
-                    start_wait = time.time()
-                    while time.time() - start_wait < 20:
-                        if len(self.driver.find_elements(By.CSS_SELECTOR, "div.jftiEf")) > 0:
-                            print("✓ Reviews section loaded!")
-                            time.sleep(2)
-                            return True
-                        time.sleep(1)
+                    loaded = self.waiter.wait_for('reviews_loaded', count_greater_than(config.REVIEW_SELECTORS['card'], 0))
+                    self.selectors.report('review_tab', selector, loaded)
+                    if loaded:
+                        print("✓ Reviews section loaded!")
+                        return True
                     print(f"⚠ Reviews loaded check timed out for selector '{selector}'")
-                    continue # Try next selector
-                except Exception as e:
-                    # print(f"DEBUG: Failed selector {selector}: {e}")
-                    continue
             
             print("⚠ All review selectors failed or reviews did not load.")
+            self.last_failure = self._reviews_failure(clicked)
             return False
-            
-            # If tab not found, maybe it's already visible or under a different selector
-            if len(self.driver.find_elements(By.CSS_SELECTOR, "div.jftiEf")) > 0:
-                print("✓ Reviews already visible")
-                return True
-                
+
         except Exception as e:
             print(f"⚠ Could not navigate to reviews tab: {e}")
             
         return False
 
-    def scroll_reviews(self, max_reviews=50):
-        """Scroll to load reviews up to max_reviews"""
-        print(f"Scrolling to load up to {max_reviews} reviews...")
-        
-        scroll_script = """
-        var scrollableDiv = document.querySelector('div.m6QErb.DxyBCb.kA9KIf.dS8AEf.XiKgde') || 
-                             document.querySelector('div[role="main"]') ||
-                             document.querySelector('div[tabindex="-1"]');
-                             
-        // Fallback: Try to find ANY div that is scrollable
-        if (!scrollableDiv) {
-            var allDivs = document.getElementsByTagName('div');
-            for (var i = 0; i < allDivs.length; i++) {
-                var div = allDivs[i];
-                if (div.scrollHeight > div.clientHeight && div.clientHeight > 0) {
-                    scrollableDiv = div;
-                    break;
-                }
-            }
-        }
+    def _reviews_failure(self, clicked):
+        """Error kind of a place whose reviews did not show up.
 
-        if (scrollableDiv) {
-            scrollableDiv.scrollTop = scrollableDiv.scrollHeight;
-            return scrollableDiv.scrollHeight;
-        }
-        return 0;
+        Only a loaded place header that shows zero reviews means the place has
+        none (not retried). Anything else may be a blocked, captcha or slow
+        page: a tab that was clicked but stayed empty is a timeout, no tab at
+        all a missing selector; both are retried and count for the breaker.
         """
-        
-        count_script = "return document.querySelectorAll('div.jftiEf').length;"
-        
-        no_change_count = 0
-        last_count = 0
-        scroll_num = 0
+        try:
+            count = self.driver.execute_script(PLACE_REVIEW_COUNT_SCRIPT)
+        except Exception:
+            count = None
+        if count == 0:
+            return ERROR_NO_REVIEWS
+        return ERROR_TIMEOUT if clicked else ERROR_SELECTOR_MISSING
+
+    def scroll_reviews(self, max_reviews=50, stop_fingerprint=None):
+        """Scroll to load reviews up to max_reviews.
+
+        The scrollable pane is looked up once and each scroll, count and wait
+        is a single script call. The wait adapts to how fast reviews actually
+        load (see scroll_controller.py). If stop_fingerprint is given (newest
+        review from the previous run), scrolling stops as soon as that review
+        is loaded. Returns True in that case.
+        """
+        print(f"Scrolling to load up to {max_reviews} reviews...")
+        controller = AdaptiveScrollController(max_reviews)
+        container = self._find_scroll_container()
+        last_count = self.driver.execute_script(COUNT_CARDS_SCRIPT, config.REVIEW_SELECTORS['card']) or 0
+        checked = 0
         
         while True:
-            self.driver.execute_script(scroll_script)
-            time.sleep(2)
-            
-            current_count = self.driver.execute_script(count_script)
-            scroll_num += 1
-            
-            if current_count >= max_reviews:
-                print(f"Loaded {current_count} reviews.")
+            if stop_fingerprint:
+                # Only the cards loaded since the previous check are read
+                known, checked = self._find_known_review(stop_fingerprint, checked, container)
+                if known:
+                    print(f"✓ Reached already-scraped reviews after {checked} cards, stopping scroll.")
+                    return True
+
+            try:
+                current_count, latency = self._scroll_and_wait(container, last_count, controller)
+            except StaleElementReferenceException:
+                # Maps re-rendered the pane; look it up again
+                container = self._find_scroll_container()
+                continue
+            controller.record(current_count - last_count, latency)
+            last_count = current_count
+
+            reason = controller.done(current_count)
+            if reason == 'target':
+                print(f"Loaded {current_count} reviews ({controller.stats()}).")
                 break
-                
-            if current_count == last_count:
-                no_change_count += 1
-            else:
-                no_change_count = 0
-                
-            if no_change_count >= 5:
-                print(f"Reached end of reviews or stuck. Loaded {current_count}.")
+            if reason == 'stalled':
+                print(f"Reached end of reviews or stuck. Loaded {current_count} ({controller.stats()}).")
                 break
-                
-            last_count = current_count
-            if scroll_num > 50: # Safety break
+            if reason == 'scroll_limit': # Safety break
+                print(f"⚠ Scroll limit reached. Loaded {current_count} ({controller.stats()}).")
+                break
+
+        return False
+
+    def _find_scroll_container(self):
+        """The scrollable reviews pane as a WebElement, or None to scroll the page"""
+        return self.driver.execute_script(FIND_SCROLL_CONTAINER_SCRIPT, config.REVIEW_SELECTORS['card'])
+
+    def _scroll_and_wait(self, container, last_count, controller):
+        """Scroll once and wait up to the controller's current wait for new cards.
+
+        Returns (card_count, seconds until new cards appeared, or the whole
+        wait if none did).
+        """
+        card = config.REVIEW_SELECTORS['card']
+        wait = controller.wait
+        try:
+            # Script timeout must outlast the in-page timeout
+            self.driver.set_script_timeout(wait + 5)
+            _, count, first_new_ms = self.driver.execute_async_script(
+                SCROLL_AND_WAIT_SCRIPT, container, card, last_count,
+                int(wait * 1000), controller.tuning['settle_ms'])
+            return count, (first_new_ms / 1000 if first_new_ms >= 0 else wait)
+        except StaleElementReferenceException:
+            raise
+        except Exception:
+            # No async script support: scroll+count in one call, then poll for growth
+            start = time.perf_counter()
+            _, count = self.driver.execute_script(SCROLL_CONTAINER_SCRIPT, container, card)
+            if count <= last_count:
+                def grown(driver):
+                    seen = driver.execute_script(COUNT_SEEN_CARDS_SCRIPT, container, card)
+                    return seen if seen > last_count else False
+                count = self.waiter.wait_for('scroll_growth', grown, timeout=wait) or last_count
+            return count, time.perf_counter() - start
+
+    def harvest_reviews(self, place_name, category, max_reviews=50, stop_fingerprint=None):
+        """Streaming alternative to scroll_reviews + extract_visible_reviews.
+
+        Cards are extracted as they load and each batch is passed to
+        on_review_batch straight away. "More" is clicked on the new cards and
+        they are read in the next call, once the full text is in. With
+        WEB_SCRAPE_PRUNE_HARVESTED, harvested cards are removed from the page
+        so Chrome memory stays flat even for thousands of reviews. Returns
+        (reviews, reached_known), at most max_reviews reviews.
+        """
+        print(f"Harvesting up to {max_reviews} reviews while scrolling...")
+        controller = AdaptiveScrollController(max_reviews)
+        container = self._find_scroll_container()
+        prune = getattr(config, 'WEB_SCRAPE_PRUNE_HARVESTED', False)
+        keep = getattr(config, 'WEB_SCRAPE_PRUNE_KEEP', 5)
+        last_count = self.driver.execute_script(COUNT_CARDS_SCRIPT, config.REVIEW_SELECTORS['card']) or 0
+        reviews = []
+        reason = None
+
+        while True:
+            if self.driver.execute_script(EXPAND_FRESH_CARDS_SCRIPT, config.REVIEW_SELECTORS['card'],
+                                          container):
+                self.waiter.wait_for('expand_more', elements_absent("button.w8B4Bf"))
+            cards = self.driver.execute_script(HARVEST_CARDS_SCRIPT, config.REVIEW_SELECTORS,
+                                               container, prune, keep) or []
+            # The last scroll can load past the target
+            cards = cards[:max_reviews - len(reviews)]
+            batch = self._cards_to_reviews(cards, place_name, category)
+            reached_known = False
+            if stop_fingerprint:
+                kept = drop_known_reviews(batch, stop_fingerprint)
+                reached_known = len(kept) < len(batch)
+                batch = kept
+            if batch:
+                reviews.extend(batch)
+                if self.on_review_batch:
+                    self.on_review_batch(batch)
+            if reached_known:
+                print(f"✓ Reached already-scraped reviews after {len(reviews)} new ones, stopping scroll.")
+                return reviews, True
+            if reason or len(reviews) >= max_reviews:
                 break
 
+            try:
+                current_count, latency = self._scroll_and_wait(container, last_count, controller)
+            except StaleElementReferenceException:
+                container = self._find_scroll_container()
+                continue
+            controller.record(current_count - last_count, latency)
+            last_count = current_count
+            # One more pass harvests the cards the last scroll loaded
+            reason = controller.done(current_count)
+
+        if reason == 'stalled':
+            print(f"Reached end of reviews or stuck. Harvested {len(reviews)} ({controller.stats()}).")
+        elif reason == 'scroll_limit':
+            print(f"⚠ Scroll limit reached. Harvested {len(reviews)} ({controller.stats()}).")
+        else:
+            print(f"Harvested {len(reviews)} reviews ({controller.stats()}).")
+        return reviews, False
+
+    def _find_known_review(self, fingerprint, start, container=None):
+        """Look for a review fingerprint among cards loaded since index start.
+
+        Returns (found, next_start); next_start is the card index where the
+        match sits, or the number of cards checked so far.
+        """
+        keys = self.driver.execute_script(CARD_KEYS_SCRIPT, config.REVIEW_SELECTORS, start, container) or []
+        for offset, (name, text) in enumerate(keys):
+            if review_fingerprint(name, text) == fingerprint:
+                return True, start + offset
+        return False, start + len(keys)
+
     def sort_reviews_by_newest(self):
         """Click 'Sort' and select 'Newest' to get all languages"""
         try:
             print("Attempting to sort by Newest...")
-            # Valid selectors for Sort button (English and Nepali and generic)
-            sort_selectors = [
-                "button[aria-label='Sort reviews']", 
-                "button[aria-label*='क्रमबद्ध']", # Nepali: Sort
-                "button[data-value='Sort']",
-                "//button[contains(@aria-label, 'Sort')]",
-                "//button[contains(@aria-label, 'क्रमबद्ध')]"
-            ]
+            # Finds and clicks the button in one call (see selector_registry.py)
+            sort_selector = self.selectors.click_first(self.driver, 'sort_button')
             
-            sort_btn = None
-            for sel in sort_selectors:
-                try:
-                    if sel.startswith("//"):
-                        sort_btn = self.driver.find_element(By.XPATH, sel)
-                    else:
-                        sort_btn = self.driver.find_element(By.CSS_SELECTOR, sel)
-                    if sort_btn:
-                        break
-                except:
-                    continue
-            
-            if sort_btn:
-                self.driver.execute_script("arguments[0].click();", sort_btn)
-                time.sleep(1)
+            if sort_selector:
+                menu_open = self.waiter.wait_for('sort_menu', elements_present("div[role='menuitemradio']"))
+                self.selectors.report('sort_button', sort_selector, bool(menu_open))
                 
                 # Click 'Newest' option (usually the second item in menu)
                 # English: "Newest", Nepali: "नयाँ" or similar
@@ -239,196 +578,475 @@ class GoogleMapsSeleniumScraper:
                 menu_items = self.driver.find_elements(By.CSS_SELECTOR, "div[role='menuitemradio']")
                 if len(menu_items) >= 2:
                     print("Clicking 'Newest' option...")
+                    if self.capture_xhr:
+                        # Drop the relevance-sorted batch; only payloads
+                        # requested after the sort are parsed
+                        self.read_performance_log()
+                    # The cards stay on the page until the re-sorted list
+                    # replaces them, so wait for the tagged first card to go
+                    self.driver.execute_script(MARK_FIRST_CARD_SCRIPT, config.REVIEW_SELECTORS['card'])
                     self.driver.execute_script("arguments[0].click();", menu_items[1]) 
-                    time.sleep(2)
+                    if self.waiter.wait_for('sort_applied', all_of(
+                            elements_absent("div[role='menuitemradio']"),
+                            first_card_replaced(config.REVIEW_SELECTORS['card']))):
+                        return True
+                    # Reviews may not be newest-first, so no high-water mark
+                    print("⚠ Review list did not change after sorting by Newest")
                 else:
                     print("Could not find Newest option in menu")
             else:
                 print("Could not find Sort button")
         except Exception as e:
             print(f"Sort by newest failed: {e}")
+        return False
 
     def expand_more_buttons(self):
         """Expand 'More' buttons in reviews"""
-        expand_script = """
-        var buttons = document.querySelectorAll('button.w8B4Bf');
-        buttons.forEach(function(btn) {
-            try { btn.click(); } catch(e) {}
-        });
-        """
-        self.driver.execute_script(expand_script)
-        time.sleep(1)
+        self.driver.execute_script(EXPAND_MORE_SCRIPT)
+        self.waiter.wait_for('expand_more', elements_absent("button.w8B4Bf"))
 
     def is_code_switched(self, text):
         """Detect Nepali-English code-switching (Devanagari mixed or Romanized mixed)"""
-        if not text:
-            return False
-            
-        text_lower = text.lower()
-        
-        # 1. Devanagari detection
-        has_nepali_script = bool(re.search(r'[\u0900-\u097F]', text))
-        has_english_script = bool(re.search(r'[a-zA-Z]', text))
-        
-        if has_nepali_script and has_english_script:
-            # print(f"DEBUG: Found Devanagari CS: {text[:30]}...")
-            return True
-            
-        # 2. Romanized Nepali detection (English script + Nepali keywords)
-        # Common romanized keywords
-        nepali_keywords = [
-            'ramro', 'dherai', 'kati', 'chha', 'ho', 'ni', 
-            'dammi', 'babal', 'thik', 'gardai', 'parne', 'hola',
-            'sarai', 'ekdam', 'yo', 'ta', 'pani', 'ma', 'gardai',
-            'haina', 'huna', 'garne', 'hun', 'kati', 'kasto'
-        ]
-        
-        # Check if keywords appear in text (whole words only)
-        words = set(re.findall(r'\b\w+\b', text_lower))
-        has_nepali_keyword = any(kw in words for kw in nepali_keywords)
-        
-        if has_english_script and has_nepali_keyword:
-            # print(f"DEBUG: Found Romanized CS: {text[:30]}...")
-            return True
-            
-        return False
+        return is_code_switched(text)
+
+    def parse_rating(self, rating_aria):
+        """Turn a rating aria-label such as '5 stars' into an int (0 if unknown)"""
+        return parse_rating(rating_aria)
+
+    def build_review(self, place_name, category, name, rating, date, text, extraction_date):
+        """Build one output review row"""
+        return build_review(place_name, category, name, rating, date, text, extraction_date)
 
     def extract_visible_reviews(self, place_name, category):
-        """Extract all currently loaded reviews"""
-        review_elements = self.driver.find_elements(By.CSS_SELECTOR, "div.jftiEf")
+        """Extract all currently loaded reviews in a single script call"""
+        if getattr(config, 'WEB_SCRAPE_EXTRACTION_ENGINE', 'script') == 'page_source':
+            # One page_source round trip, parsed locally with BeautifulSoup
+            return parse_reviews_html(self.driver.page_source, place_name, category)
+
+        try:
+            cards = self.driver.execute_script(EXTRACT_REVIEWS_SCRIPT, config.REVIEW_SELECTORS)
+        except Exception as e:
+            print(f"⚠ Bulk extraction failed ({e}), falling back to per-element extraction")
+            cards = None
+
+        if cards is None:
+            return self.extract_visible_reviews_per_element(place_name, category)
+        return self._cards_to_reviews(cards, place_name, category)
+
+    def _cards_to_reviews(self, cards, place_name, category):
+        """Turn [name, rating_aria, date, text] rows from the page into reviews"""
+        extraction_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        extracted = []
+        for name, rating_aria, date, text in cards:
+            extracted.append(self.build_review(
+                place_name, category,
+                name if name is not None else "Anonymous",
+                self.parse_rating(rating_aria),
+                date if date is not None else "Unknown",
+                text if text is not None else "",
+                extraction_date
+            ))
+        return extracted
+
+    def extract_visible_reviews_per_element(self, place_name, category):
+        """Fallback: extract loaded reviews with one find_element call per field"""
+        selectors = config.REVIEW_SELECTORS
+        review_elements = self.driver.find_elements(By.CSS_SELECTOR, selectors['card'])
         extracted = []
         
         for elem in review_elements:
             try:
                 # Reviewer name
                 try:
-                    name = elem.find_element(By.CSS_SELECTOR, "div.d4r55").text
+                    name = elem.find_element(By.CSS_SELECTOR, selectors['reviewer_name']).text
                 except:
                     name = "Anonymous"
                 
                 # Rating
                 try:
-                    rating_elem = elem.find_element(By.CSS_SELECTOR, "span.kvMYJc")
-                    rating_aria = rating_elem.get_attribute("aria-label")
-                    rating_match = re.search(r'(\d+)', rating_aria)
-                    rating = int(rating_match.group(1)) if rating_match else 0
+                    rating_elem = elem.find_element(By.CSS_SELECTOR, selectors['rating'])
+                    rating = self.parse_rating(rating_elem.get_attribute("aria-label"))
                 except:
                     rating = 0
                 
                 # Date
                 try:
-                    date = elem.find_element(By.CSS_SELECTOR, "span.rsqaWe").text
+                    date = elem.find_element(By.CSS_SELECTOR, selectors['review_date']).text
                 except:
                     date = "Unknown"
                 
                 # Review text
                 try:
-                    text = elem.find_element(By.CSS_SELECTOR, "span.wiI7pd").text
+                    text = elem.find_element(By.CSS_SELECTOR, selectors['review_text']).text
                 except:
                     text = ""
                 
-                is_cs = self.is_code_switched(text)
-                
-                extracted.append({
-                    'place_name': place_name,
-                    'category': category,
-                    'reviewer_name': name,
-                    'rating': rating,
-                    'review_date': date,
-                    'review_text': text,
-                    'is_code_switched': is_cs,
-                    'extraction_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                })
+                extracted.append(self.build_review(
+                    place_name, category, name, rating, date, text,
+                    datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                ))
             except Exception as e:
                 continue
         
         return extracted
 
-    def scrape_all_from_config(self):
-        """Iterate through config and scrape everything"""
+    def collect_review_payloads(self, name, category):
+        """Parse reviews from the review XHR responses captured since the sort.
+
+        Batches are parsed in the order they were requested, so the reviews
+        keep their order in the list (newest first), capped at review_target.
+        If any batch cannot be read (still loading, or its body was evicted)
+        nothing is returned and the caller reads the reviews from the page,
+        since the parsed list would have a gap.
+        """
+        extraction_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        reviews = []
+        try:
+            responses = review_responses(self.read_performance_log())
+        except Exception as e:
+            print(f"⚠ Could not read performance log: {e}")
+            return []
+
+        for request_id, url, finished in responses:
+            if not finished:
+                print(f"⚠ Review batch for {name} had not finished loading; reading the page instead")
+                return []
+            try:
+                response = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+            except Exception as e:
+                print(f"⚠ Could not read a review batch for {name} ({e}); reading the page instead")
+                return []
+            body = response.get('body', '')
+            if response.get('base64Encoded'):
+                body = base64.b64decode(body).decode('utf-8', errors='replace')
+            self.payload_cache.save(url, body, name, category)
+            reviews.extend(parse_review_payload(body, url, name, category, extraction_date))
+
+        print(f"Captured {len(responses)} review payloads ({len(reviews)} reviews) for {name}")
+        return reviews[:self.review_target(name)]
+
+    def scrape_place(self, name, category):
+        """Scrape one place; returns (reviews, place_row) or None if it could not be opened"""
+        query = f"{name} Pokhara"
+        try:
+            # Drop log entries left over from the previous place
+            self.driver.get_log('performance')
+        except Exception:
+            pass
+        self.page_bytes = self.page_requests = 0
+        start = time.perf_counter()
+        if not self.open_place(name, category, query):
+            print(f"❌ Failed to find reviews for {name}")
+            self.waiter.pop_timings()
+            return None
+
+        # Get place details if needed (simplified here)
+        place_row = {
+            'name': name,
+            'category': category,
+            'query': query,
+            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            # driver.get until the first review cards rendered
+            'page_ready_seconds': round(time.perf_counter() - start, 3)
+        }
+
+        # Sort by newest to get mixed languages
+        with self.metrics.phase('sort'):
+            sorted_newest = self.sort_reviews_by_newest()
+
+        # The high-water mark is only meaningful when reviews are newest-first
+        incremental = sorted_newest and getattr(config, 'WEB_SCRAPE_INCREMENTAL', True)
+        stop_fingerprint = self.state.get_high_water_mark(category, name) if incremental else None
+
+        if getattr(config, 'WEB_SCRAPE_STREAMING', False) and not self.capture_xhr:
+            # Extract while scrolling; the result is already cut at the known review
+            with self.metrics.phase('scroll'):
+                reviews, reached_known = self.harvest_reviews(
+                    name, category, max_reviews=self.review_target(name),
+                    stop_fingerprint=stop_fingerprint)
+        else:
+            with self.metrics.phase('scroll'):
+                reached_known = self.scroll_reviews(max_reviews=self.review_target(name),
+                                                    stop_fingerprint=stop_fingerprint)
+            reviews = []
+            # Without the sort the log holds the relevance-sorted batch too,
+            # so the reviews are read from the page instead
+            if self.capture_xhr and sorted_newest:
+                with self.metrics.phase('collect_xhr'):
+                    reviews = self.collect_review_payloads(name, category)
+            if not reviews:
+                with self.metrics.phase('expand'):
+                    self.expand_more_buttons()
+                with self.metrics.phase('extract'):
+                    reviews = self.extract_visible_reviews(name, category)
+
+            if stop_fingerprint:
+                reviews = drop_known_reviews(reviews, stop_fingerprint)
+        if incremental and reviews:
+            # Saved by _commit_place once these reviews are on disk, so a crash
+            # before the flush does not skip them on the next run
+            newest = reviews[0]
+            place_row['_high_water_mark'] = review_fingerprint(newest['reviewer_name'],
+                                                               newest['review_text'])
+        print(f"Extracted {len(reviews)} {'new ' if stop_fingerprint else ''}reviews for {name}")
+
+        place_row['page_bytes'], place_row['page_requests'] = self.page_weight()
+        if place_row['page_bytes'] is not None:
+            print(f"  Page: {place_row['page_bytes'] / 1e6:.2f} MB in {place_row['page_requests']} requests, "
+                  f"ready in {place_row['page_ready_seconds']:.1f}s")
+
+        timings = self.waiter.pop_timings()
+        place_row['wait_seconds'] = round(sum(t['seconds'] for t in timings), 3)
+        # Per-step wait times go into the run report (see metrics.py)
+        self.metrics.add_waits(timings)
+
+        if len(reviews) == 0 and not reached_known:
+            print("⚠ No reviews extracted! Saving page source for debugging...")
+            debug_file = os.path.join(self.output_dir, "debug_page_source.html")
+            with open(debug_file, "w", encoding="utf-8") as f:
+                f.write(self.driver.page_source)
+            print(f"✓ Saved page source to {debug_file}")
+
+        return reviews, place_row
+
+    def review_target(self, name):
+        """Number of reviews to load for a place"""
+        overrides = getattr(config, 'WEB_SCRAPE_MAX_REVIEWS_BY_PLACE', {})
+        return overrides.get(name, config.WEB_SCRAPE_MAX_REVIEWS)
+
+    def run_place_job(self, name, category):
+        """Scrape one place, retrying classified failures, and journal failures.
+
+        Retries follow self.retry_policy and reuse the live browser session;
+        only a crashed one is restarted (see retry_policy.py). Success is
+        journaled by _commit_place once the place's reviews have been flushed
+        to disk, so a crash never leaves a place marked done whose reviews
+        were not written.
+        """
+        start = time.perf_counter()
+        for attempt in range(1, self.retry_policy.max_attempts + 1):
+            self.state.mark_job(category, name, JOB_RUNNING)
+            try:
+                # Wait out an open circuit breaker, then make sure the session
+                # is alive and not due for recycling
+                self.breaker.before_place(self)
+                self.ensure_session()
+                self.places_on_session += 1
+                result = self.scrape_place(name, category)
+                error = None if result else PlaceFailure(self.failure_kind(), "reviews not found")
+            except Exception as e:
+                result, error = None, e
+            if error is None:
+                break
+
+            kind = classify_error(error)
+            print(f"⚠ Error scraping {name} ({kind}, attempt {attempt}/{self.retry_policy.max_attempts}): {error}")
+            self.state.mark_job(category, name, JOB_FAILED, error=f"{kind}: {str(error).strip()}")
+            if not self.retry_policy.should_retry(kind, attempt):
+                break
+            try:
+                self.recover(kind)
+            except Exception as e:
+                print(f"⚠ Could not recover the browser session: {e}")
+                break
+            delay = self.retry_policy.delay(attempt)
+            print(f"Retrying {name} in {delay:.1f}s...")
+            time.sleep(delay)
+
+        # One outcome per place, not per attempt; a place without reviews
+        # says nothing about Google blocking the scraper
+        self.breaker.record(result is not None or classify_error(error) == ERROR_NO_REVIEWS)
+        seconds = time.perf_counter() - start
+        reviews = len(result[0]) if result else 0
+        self.metrics.finish_place(name, category, reviews, seconds, ok=bool(result))
+        self.scheduler.record(category, name, bool(result), reviews, seconds)
+        return result
+
+    def _places_to_scrape(self, resume):
+        """Return the config places still to do, restoring finished ones on resume"""
+        if not resume:
+            self.state.reset_jobs(config.SPECIFIC_PLACES)
+            self.sink.reset()
+            return config.SPECIFIC_PLACES
+
+        jobs = self.state.get_jobs()
+        done = set()
+        pending = {}
+        for category, names in config.SPECIFIC_PLACES.items():
+            for name in names:
+                job = jobs.get((category, name))
+                if job and job['status'] == JOB_DONE:
+                    done.add((category, name))
+                    if job['place_row']:
+                        self.places_data.append(job['place_row'])
+                else:
+                    pending.setdefault(category, []).append(name)
+
+        # Reviews and place rows of finished places are already on disk and
+        # stay there; new ones are appended
+        remaining = sum(len(names) for names in pending.values())
+        print(f"Resuming: {len(done)} places already done, {remaining} to scrape")
+        return pending
+
+    def scrape_all_from_config(self, pool_size=None, resume=False, deadline_minutes=None):
+        """Iterate through config and scrape everything.
+
+        With resume=True, places the job journal marks as done are skipped and
+        only failed or pending places are scraped again. Places are scraped in
+        order of expected new reviews (see scheduler.py); with a deadline, places
+        that no longer fit stay pending for the next --resume.
+        """
+        places = self._places_to_scrape(resume)
+        order = self._schedule(places, deadline_minutes)
+        self.metrics.start_run(len(order))
+
+        if pool_size is None:
+            pool_size = getattr(config, 'WEB_SCRAPE_POOL_SIZE', 1)
+        if pool_size > 1:
+            return self._scrape_with_pool(pool_size, places, order)
+
         self.setup_driver()
+        # Streaming mode writes each harvested batch as soon as it is read;
+        # the interim save after the place skips them as duplicates
+        self.on_review_batch = self.sink.write_reviews
         
+        skipped = []
         try:
-            for category, names in config.SPECIFIC_PLACES.items():
-                print(f"\n--- Scraping Category: {category} ---")
-                for name in names:
-                    try:
-                        query = f"{name} Pokhara"
-                        if self.search_and_navigate(query):
-                            # Get place details if needed (simplified here)
-                            self.places_data.append({
-                                'name': name,
-                                'category': category,
-                                'query': query,
-                                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                            })
-                            
-                            # Sort by newest to get mixed languages
-                            self.sort_reviews_by_newest()
-                            
-                            self.scroll_reviews(max_reviews=config.WEB_SCRAPE_MAX_REVIEWS)
-                            self.expand_more_buttons()
-                            reviews = self.extract_visible_reviews(name, category)
-                            print(f"Extracted {len(reviews)} reviews for {name}")
-                            
-                            if len(reviews) == 0:
-                                print("⚠ No reviews extracted! Saving page source for debugging...")
-                                with open(os.path.join(self.output_dir, "debug_page_source.html"), "w", encoding="utf-8") as f:
-                                    f.write(self.driver.page_source)
-                                print(f"✓ Saved page source to {os.path.join(self.output_dir, 'debug_page_source.html')}")
-                            
-                            self.all_reviews.extend(reviews)
-                            
-                            # Interval save to prevent data loss
-                            self.save_data(interim=True)
-                        else:
-                            print(f"❌ Failed to find reviews for {name}")
-                    except Exception as e:
-                        print(f"⚠ Error scraping {name}: {e}")
-                        continue
+            current_category = None
+            for category, name in order:
+                if not self.scheduler.fits(category, name):
+                    skipped.append(name)
+                    continue
+                if category != current_category:
+                    print(f"\n--- Scraping Category: {category} ---")
+                    current_category = category
+                result = self.run_place_job(name, category)
+                if result:
+                    # Written and journaled done right away
+                    self._add_place_result(*result)
+            self._report_skipped(skipped)
         
         except KeyboardInterrupt:
             print("\n\n⚠ SCRAPING INTERRUPTED BY USER (Ctrl+C)")
             print("Saving collected data before exiting...")
             self.save_data(interim=True)
-            print("✓ Data saved safely.")
+            print("✓ Data saved safely. Run again with --resume to continue.")
             
         finally:
             if self.driver:
                 self.driver.quit()
             self.save_data()
+            self.write_run_report()
+
+    def _schedule(self, places, deadline_minutes=None):
+        """Start the scheduler's clock and return the (category, name) order to scrape in"""
+        if deadline_minutes is None:
+            deadline_minutes = getattr(config, 'WEB_SCRAPE_DEADLINE_MINUTES', None)
+        self.scheduler.start(deadline_minutes)
+        if deadline_minutes:
+            print(f"Deadline: {deadline_minutes} minutes")
+        if not getattr(config, 'WEB_SCRAPE_PRIORITY_ORDER', True):
+            return [(category, name) for category, names in places.items() for name in names]
+        order = self.scheduler.order(places)
+        self.scheduler.describe(order)
+        return order
+
+    def _report_skipped(self, skipped):
+        """Tell the user which places the deadline left for the next run"""
+        if skipped:
+            print(f"\n⚠ Deadline reached: {len(skipped)} places left pending "
+                  f"({', '.join(skipped)}). Run again with --resume to scrape them.")
+
+    def _scrape_with_pool(self, pool_size, places, order=None):
+        """Scrape the given places with several browser sessions in parallel"""
+        from parallel_scraper import ScraperPool
+
+        restored_places = list(self.places_data)
+        pool = ScraperPool(self.output_dir, pool_size=pool_size,
+                           driver_factory=self.driver_factory, metrics=self.metrics,
+                           on_review_batch=self.sink.write_reviews, scheduler=self.scheduler,
+                           breaker=self.breaker)
+        try:
+            pool.run(places, on_place_done=self._on_pool_place_done, order=order)
+            self._report_skipped(pool.skipped)
+        except KeyboardInterrupt:
+            print("\n\n⚠ SCRAPING INTERRUPTED BY USER (Ctrl+C)")
+            print("Waiting for workers to finish their current place...")
+            pool.stop()
+            pool.wait()
+        finally:
+            # Rebuild results in config order so output does not depend on
+            # which worker finished first
+            self.places_data = restored_places + pool.merged_results()
+            self.save_data()
+            self.write_run_report()
+
+    def _on_pool_place_done(self, reviews, place_row):
+        """Called by the pool (under its lock) each time a worker finishes a place"""
+        self._add_place_result(reviews, place_row)
+
+    def _add_place_result(self, reviews, place_row):
+        """Write a finished place's reviews; the place is committed once they are on disk"""
+        high_water_mark = place_row.pop('_high_water_mark', None)
+        self.places_data.append(place_row)
+        self.review_buffer.add(reviews,
+                               on_flushed=lambda: self._commit_place(place_row, high_water_mark))
+        # Flush at every place boundary, so a crash or kill loses at most the
+        # place in progress and --resume skips every place before it
+        self.review_buffer.flush()
+
+    def _commit_place(self, place_row, high_water_mark=None):
+        """Write a place row, move its high-water mark and journal it done (its reviews are on disk now)"""
+        self.sink.write_places([place_row])
+        if high_water_mark:
+            self.state.set_high_water_mark(place_row['category'], place_row['name'], high_water_mark)
+        self.state.mark_job(place_row['category'], place_row['name'], JOB_DONE, place_row=place_row)
+
+    def write_run_report(self):
+        """Write per-place and per-phase timings of this run as JSON"""
+        filename = getattr(config, 'RUN_REPORT_FILENAME', 'run_report.json')
+        return self.metrics.write_report(os.path.join(self.output_dir, filename),
+                                         extra={'selectors': self.selectors.summary()})
 
     def save_data(self, interim=False):
-        """Save reviews and places data to CSV"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        suffix = "_interim" if interim else ""
-        
-        if self.all_reviews:
-            df = pd.DataFrame(self.all_reviews)
-            # Save ALL reviews to main file
-            # Note: This includes English, Nepali, and Code-switched reviews
-            df = df.drop_duplicates(subset=['place_name', 'reviewer_name', 'review_text'])
-            reviews_file = os.path.join(self.output_dir, f"pokhara_reviews{suffix}.csv")
-            df.to_csv(reviews_file, index=False, encoding='utf-8-sig')
-            
-            # Save code-switched separately (as a subset, for convenience)
-            cs_df = df[df['is_code_switched'] == True]
-            if not cs_df.empty:
-                cs_file = os.path.join(self.output_dir, f"pokhara_reviews_code_switched{suffix}.csv")
-                cs_df.to_csv(cs_file, index=False, encoding='utf-8-sig')
+        """Write every pending review (and its place) through the output backend.
 
-        if self.places_data:
-            df_places = pd.DataFrame(self.places_data)
-            places_file = os.path.join(self.output_dir, f"pokhara_places{suffix}.csv")
-            df_places.to_csv(places_file, index=False, encoding='utf-8-sig')
+        The final save also compacts the interim files into the main CSVs once,
+        merging them with the rows earlier (incremental) runs left there.
+        """
+        self.review_buffer.flush()
+
+        if not interim:
+            place_order = [(category, name)
+                           for category, names in config.SPECIFIC_PLACES.items()
+                           for name in names]
+            self.sink.compact(place_order=place_order)
 
 def main():
+    parser = argparse.ArgumentParser(description="Scrape Google Maps reviews for the places in config.py")
+    parser.add_argument('--resume', action='store_true',
+                        help="Skip places finished by the previous run and retry failed/pending ones")
+    parser.add_argument('--pool-size', type=int, default=None,
+                        help="Parallel browser sessions (default: config.WEB_SCRAPE_POOL_SIZE)")
+    parser.add_argument('--deadline', type=float, default=None, metavar='MINUTES',
+                        help="Stop starting new places after this many minutes "
+                             "(default: config.WEB_SCRAPE_DEADLINE_MINUTES)")
+    parser.add_argument('--forget-seen', action='store_true',
+                        help="Forget already scraped reviews (high-water marks and the dedupe "
+                             "index) for a full re-scrape")
+    args = parser.parse_args()
+
     print("="*80)
     print("POKHARA GOOGLE REVIEWS SELENIUM SCRAPER")
     print("="*80)
     
     scraper = GoogleMapsSeleniumScraper(output_dir='D:\\Research work\\data\\output_reviews')
-    scraper.scrape_all_from_config()
+    if args.forget_seen:
+        scraper.state.clear_high_water_marks()
+        scraper.state.clear_review_keys()
+        print("✓ Forgot already scraped reviews; this run scrapes every place in full")
+    scraper.scrape_all_from_config(pool_size=args.pool_size, resume=args.resume,
+                                   deadline_minutes=args.deadline)
     
     print("\n✅ SCRAPING PROCESS COMPLETED!")
 
@@ -0,0 +1,122 @@
+"""
+Event-Driven Readiness Detection for the Pokhara Google Reviews Scraper
+=======================================================================
+Replaces fixed time.sleep() pauses with waits that return as soon as the
+DOM condition they are waiting for actually holds (result list present,
+review count grew, sort menu open, ...). Every wait has a per-step timeout
+from config.WEB_SCRAPE_WAIT_TIMEOUTS and records how long it really took.
+
+Author: AI Assistant
+Date: 2026-01-12
+"""
+
+import os
+import time
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+
+from page_scripts import COUNT_CARDS_SCRIPT, FIRST_CARD_REPLACED_SCRIPT
+
+try:
+    import config
+except ImportError:
+    # If running from within Scraper directory
+    import sys
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    import config
+
+
+DEFAULT_TIMEOUT = 10
+
+
+# =============================================================================
+# CONDITIONS
+# =============================================================================
+# Each condition is a callable taking the driver and returning a truthy value
+# once the page is ready. They must not raise for a simple "not yet".
+
+def elements_present(*selectors):
+    """Ready once any of the CSS selectors matches at least one element"""
+    def condition(driver):
+        for selector in selectors:
+            found = driver.find_elements(By.CSS_SELECTOR, selector)
+            if found:
+                return found
+        return False
+    return condition
+
+
+def elements_absent(selector):
+    """Ready once no element matches the CSS selector"""
+    def condition(driver):
+        return len(driver.find_elements(By.CSS_SELECTOR, selector)) == 0
+    return condition
+
+
+def count_greater_than(selector, count):
+    """Ready once more than `count` elements match the CSS selector"""
+    def condition(driver):
+        current = driver.execute_script(COUNT_CARDS_SCRIPT, selector)
+        return current if current > count else False
+    return condition
+
+
+def first_card_replaced(selector):
+    """Ready once the first card is not the one tagged by MARK_FIRST_CARD_SCRIPT"""
+    def condition(driver):
+        return driver.execute_script(FIRST_CARD_REPLACED_SCRIPT, selector)
+    return condition
+
+
+def all_of(*conditions):
+    """Ready once every condition holds; returns the last condition's value"""
+    def condition(driver):
+        result = True
+        for cond in conditions:
+            result = cond(driver)
+            if not result:
+                return False
+        return result
+    return condition
+
+
+# =============================================================================
+# WAITER
+# =============================================================================
+
+class ReadinessWaiter:
+    """Waits for DOM conditions with per-step timeouts and records wait times"""
+
+    def __init__(self, driver, timeouts=None, poll_interval=None):
+        self.driver = driver
+        self.timeouts = dict(getattr(config, 'WEB_SCRAPE_WAIT_TIMEOUTS', {}))
+        if timeouts:
+            self.timeouts.update(timeouts)
+        if poll_interval is None:
+            poll_interval = getattr(config, 'WEB_SCRAPE_POLL_INTERVAL', 0.1)
+        self.poll_interval = poll_interval
+        self.timings = []
+
+    def wait_for(self, step, condition, timeout=None):
+        """Wait until condition(driver) is truthy; returns its value or False on timeout"""
+        if timeout is None:
+            timeout = self.timeouts.get(step, DEFAULT_TIMEOUT)
+
+        start = time.perf_counter()
+        try:
+            result = WebDriverWait(self.driver, timeout,
+                                   poll_frequency=self.poll_interval).until(condition)
+            ok = True
+        except TimeoutException:
+            result = False
+            ok = False
+        elapsed = time.perf_counter() - start
+
+        self.timings.append({'step': step, 'seconds': round(elapsed, 3), 'ready': ok})
+        return result
+
+    def pop_timings(self):
+        """Return and clear the wait timings recorded so far"""
+        timings, self.timings = self.timings, []
+        return timings
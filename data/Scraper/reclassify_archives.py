@@ -0,0 +1,151 @@
+"""
+Re-classify Code-Switching in Historical Review Archives
+========================================================
+Re-runs code-switch detection over archived review CSVs (interim and final)
+after the keyword list in code_switch.py changes. Files are streamed in
+chunks, chunks are classified across a process pool, and each file is
+rewritten with the updated is_code_switched column together with a freshly
+generated _code_switched subset. Memory is bounded by the chunk size and the
+number of chunks in flight, not by the file size.
+
+Usage:
+    python reclassify_archives.py                       # every CSV in config.OUTPUT_DIRECTORY
+    python reclassify_archives.py ../output_reviews/*.csv --chunksize 50000 --workers 4
+
+Author: AI Assistant
+Date: 2026-01-16
+"""
+
+import argparse
+import glob
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+try:
+    import config
+except ImportError:
+    # If running from within Scraper directory
+    import sys
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    import config
+
+from code_switch import classify_code_switched
+
+CS_MARKER = '_code_switched'
+
+
+def subset_path(path):
+    """Path of the _code_switched subset belonging to a review CSV"""
+    directory, filename = os.path.split(path)
+    if filename.startswith('pokhara_reviews'):
+        # pokhara_reviews_interim.csv -> pokhara_reviews_code_switched_interim.csv
+        filename = filename.replace('pokhara_reviews', f'pokhara_reviews{CS_MARKER}', 1)
+    else:
+        stem, ext = os.path.splitext(filename)
+        filename = f"{stem}{CS_MARKER}{ext}"
+    return os.path.join(directory, filename)
+
+
+def find_archives(paths):
+    """Expand globs/directories to review CSVs, skipping existing subsets"""
+    found = []
+    for pattern in paths:
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, '*.csv')
+        for path in sorted(glob.glob(pattern)):
+            if CS_MARKER in os.path.basename(path):
+                continue
+            header = pd.read_csv(path, nrows=0, encoding='utf-8-sig').columns
+            if 'review_text' in header:
+                found.append(path)
+    return found
+
+
+def _classify_chunk(texts):
+    """Worker: classify one chunk of review texts"""
+    return classify_code_switched(texts)
+
+
+def reclassify_file(path, executor, chunksize, max_in_flight):
+    """Rewrite one archive and its subset; returns (rows, code_switched_rows)"""
+    tmp_path = path + '.tmp'
+    cs_path = subset_path(path)
+    tmp_cs_path = cs_path + '.tmp'
+    for p in (tmp_path, tmp_cs_path):
+        if os.path.exists(p):
+            os.remove(p)
+
+    rows = 0
+    cs_rows = 0
+    pending = deque()
+
+    def write_next():
+        """Write the oldest pending chunk once its classification is done"""
+        nonlocal rows, cs_rows
+        chunk, future = pending.popleft()
+        chunk['is_code_switched'] = future.result()
+        first = rows == 0
+        chunk.to_csv(tmp_path, mode='w' if first else 'a', header=first, index=False,
+                      encoding='utf-8-sig' if first else 'utf-8')
+        cs_chunk = chunk[chunk['is_code_switched']]
+        if not cs_chunk.empty:
+            first_cs = cs_rows == 0
+            cs_chunk.to_csv(tmp_cs_path, mode='w' if first_cs else 'a', header=first_cs,
+                            index=False, encoding='utf-8-sig' if first_cs else 'utf-8')
+        rows += len(chunk)
+        cs_rows += len(cs_chunk)
+
+    for chunk in pd.read_csv(path, chunksize=chunksize, encoding='utf-8-sig'):
+        # Only the text column is sent to the worker process
+        pending.append((chunk, executor.submit(_classify_chunk, chunk['review_text'].tolist())))
+        if len(pending) >= max_in_flight:
+            write_next()
+    while pending:
+        write_next()
+
+    if rows == 0:
+        return 0, 0
+
+    os.replace(tmp_path, path)
+    if cs_rows:
+        os.replace(tmp_cs_path, cs_path)
+    elif os.path.exists(cs_path):
+        # No code-switched reviews left under the new keyword list
+        os.remove(cs_path)
+    return rows, cs_rows
+
+
+def reclassify_archives(paths, chunksize=50000, workers=None):
+    """Re-classify every archive CSV matched by paths"""
+    archives = find_archives(paths)
+    if not archives:
+        print("⚠ No review CSVs found")
+        return
+
+    workers = workers or os.cpu_count() or 1
+    # Chunks waiting to be written; bounds memory to ~2 chunks per worker
+    max_in_flight = workers * 2
+    print(f"Re-classifying {len(archives)} files with {workers} processes "
+          f"(chunks of {chunksize:,} rows)...")
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for path in archives:
+            rows, cs_rows = reclassify_file(path, executor, chunksize, max_in_flight)
+            print(f"✓ {os.path.basename(path)}: {rows:,} reviews, {cs_rows:,} code-switched")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-run code-switch detection over archived review CSVs")
+    parser.add_argument('paths', nargs='*', default=[config.OUTPUT_DIRECTORY],
+                        help="CSV files, globs or directories (default: config.OUTPUT_DIRECTORY)")
+    parser.add_argument('--chunksize', type=int, default=50000, help="Rows per chunk")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+    reclassify_archives(args.paths, chunksize=args.chunksize, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Retry Policy and Circuit Breaker for the Pokhara Google Reviews Scraper
+=======================================================================
+Failed places are classified instead of being treated alike:
+
+* timeout          - the page answered but a readiness wait ran out
+* selector_missing - an element the scraper looks for is not on the page
+* consent_wall     - Google's cookie consent page is in the way
+* no_reviews       - the place header loaded and shows zero reviews (a
+                     property of the place; not retried)
+* crash            - the browser or chromedriver no longer answers
+* other            - anything else (not retried by default)
+
+RetryPolicy decides which kinds are retried and how long to wait first
+(exponential backoff with full jitter). Retries reuse the live browser;
+only a crashed session is restarted.
+
+CircuitBreaker watches the outcome of recent places across all workers (one
+outcome per place, after its retries). When too many fail (e.g. Google starts blocking), every worker pauses for a
+cooldown and then continues with a fresh browser session.
+
+Author: AI Assistant
+Date: 2026-01-25
+"""
+
+import os
+import random
+import threading
+import time
+from collections import deque
+
+from selenium.common.exceptions import (InvalidSessionIdException, NoSuchElementException,
+                                        NoSuchWindowException, StaleElementReferenceException,
+                                        TimeoutException, WebDriverException)
+
+try:
+    import config
+except ImportError:
+    # If running from within Scraper directory
+    import sys
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    import config
+
+ERROR_TIMEOUT = 'timeout'
+ERROR_SELECTOR_MISSING = 'selector_missing'
+ERROR_CONSENT_WALL = 'consent_wall'
+ERROR_NO_REVIEWS = 'no_reviews'
+ERROR_CRASH = 'crash'
+ERROR_OTHER = 'other'
+
+DEFAULT_RETRY = {
+    'max_attempts': 3,        # Tries per place, the first one included
+    'base_delay': 2.0,        # Backoff before the first retry (seconds, before jitter)
+    'max_delay': 30.0,
+    'retry_on': [ERROR_TIMEOUT, ERROR_SELECTOR_MISSING, ERROR_CONSENT_WALL, ERROR_CRASH],
+}
+
+DEFAULT_BREAKER = {
+    'window': 6,              # Recent places looked at
+    'threshold': 4,           # Failures among them that open the breaker
+    'cooldown': 120.0,        # Seconds every worker pauses once it opens
+}
+
+# WebDriverException messages of a browser that has gone away
+CRASH_MESSAGES = ('chrome not reachable', 'disconnected', 'session deleted', 'no such session',
+                  'target window already closed', 'tab crashed', 'failed to establish a new connection',
+                  'connection refused', 'max retries exceeded')
+
+
+class PlaceFailure(Exception):
+    """A place that could not be scraped, with its error kind"""
+
+    def __init__(self, kind, message):
+        super().__init__(message)
+        self.kind = kind
+
+
+def classify_error(error):
+    """Error kind (ERROR_*) of an exception raised while scraping a place"""
+    if isinstance(error, PlaceFailure):
+        return error.kind
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException, ConnectionError)):
+        return ERROR_CRASH
+    if isinstance(error, TimeoutException):
+        return ERROR_TIMEOUT
+    if isinstance(error, (NoSuchElementException, StaleElementReferenceException)):
+        return ERROR_SELECTOR_MISSING
+    message = str(error).lower()
+    if isinstance(error, WebDriverException) or 'urllib3' in type(error).__module__:
+        if any(text in message for text in CRASH_MESSAGES):
+            return ERROR_CRASH
+        if 'timed out' in message or 'timeout' in message:
+            return ERROR_TIMEOUT
+    return ERROR_OTHER
+
+
+class RetryPolicy:
+    """Which failures are retried, how often and after how long"""
+
+    def __init__(self, settings=None):
+        if settings is None:
+            settings = getattr(config, 'WEB_SCRAPE_RETRY', {})
+        self.settings = dict(DEFAULT_RETRY, **settings)
+        self.max_attempts = max(1, int(self.settings['max_attempts']))
+
+    def should_retry(self, kind, attempt):
+        """Whether to try again after attempt number `attempt` failed with kind"""
+        return attempt < self.max_attempts and kind in self.settings['retry_on']
+
+    def delay(self, attempt):
+        """Seconds to wait before the retry following attempt `attempt` (full jitter)"""
+        ceiling = min(self.settings['max_delay'], self.settings['base_delay'] * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """Pauses and rotates every browser session when failures spike"""
+
+    def __init__(self, settings=None):
+        if settings is None:
+            settings = getattr(config, 'WEB_SCRAPE_CIRCUIT_BREAKER', {})
+        self.settings = dict(DEFAULT_BREAKER, **settings)
+        self.outcomes = deque(maxlen=self.settings['window'])
+        # Bumped every time the breaker opens; sessions started under an
+        # older generation are replaced before their next place
+        self.generation = 0
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def record(self, ok):
+        """Record one place's outcome; returns True if this failure opened the breaker"""
+        with self.lock:
+            self.outcomes.append(ok)
+            failures = sum(1 for outcome in self.outcomes if not outcome)
+            if failures < self.settings['threshold']:
+                return False
+            self.outcomes.clear()
+            self.generation += 1
+            self.paused_until = time.monotonic() + self.settings['cooldown']
+        print(f"\n⚠ Circuit breaker open: {failures} of the last {self.settings['window']} places "
+              f"failed. Pausing {self.settings['cooldown']:.0f}s, then starting fresh browser sessions.")
+        return True
+
+    def before_place(self, scraper):
+        """Wait out an open breaker, then rotate the scraper's session if it predates it"""
+        remaining = self.paused_until - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        if scraper.session_generation < self.generation:
+            scraper.restart_driver()
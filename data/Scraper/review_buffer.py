@@ -0,0 +1,67 @@
+"""
+Bounded Review Buffer for the Pokhara Google Reviews Scraper
+============================================================
+Holds scraped reviews as compact ReviewRecords until they are flushed to the
+output sink and forgotten, so memory stays bounded however many reviews a run
+collects. The scraper flushes at every place boundary; REVIEW_FLUSH_SIZE
+pending reviews also trigger a flush.
+
+A place only counts as saved once its reviews are on disk: callbacks passed
+to add() (the scraper marks the place done in the job journal) run right
+after the flush that wrote that place's reviews.
+
+Author: AI Assistant
+Date: 2026-01-22
+"""
+
+import os
+
+try:
+    import config
+except ImportError:
+    # If running from within Scraper directory
+    import sys
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    import config
+
+from reviews import ReviewRecord
+
+
+class ReviewBuffer:
+    """Pending reviews, flushed to a sink in batches of flush_size"""
+
+    def __init__(self, sink, flush_size=None):
+        self.sink = sink
+        self.flush_size = flush_size or getattr(config, 'REVIEW_FLUSH_SIZE', 5000)
+        self.pending = []
+        self.on_flush = []
+        self.flushed = 0
+
+    def __len__(self):
+        """Reviews added so far, written or not"""
+        return self.flushed + len(self.pending)
+
+    def add(self, reviews, on_flushed=None):
+        """Queue one place's reviews; on_flushed runs once they are written"""
+        self.pending.extend(ReviewRecord.from_row(review) if isinstance(review, dict) else review
+                            for review in reviews)
+        if on_flushed:
+            self.on_flush.append(on_flushed)
+        if len(self.pending) >= self.flush_size:
+            self.flush()
+
+    def flush(self):
+        """Write every pending review to the sink; returns how many were written"""
+        pending, self.pending = self.pending, []
+        callbacks, self.on_flush = self.on_flush, []
+        try:
+            written = self.sink.write_reviews(pending) if pending else 0
+        except Exception:
+            # Keep the rows (and the places waiting on them) for the next flush
+            self.pending = pending + self.pending
+            self.on_flush = callbacks + self.on_flush
+            raise
+        self.flushed += len(pending)
+        for callback in callbacks:
+            callback()
+        return written
@@ -0,0 +1,238 @@
+"""
+Review XHR Payload Capture for the Pokhara Google Reviews Scraper
+=================================================================
+While the reviews panel scrolls, Maps fetches review batches with background
+requests (listugcposts / listentitiesreviews). This module finds those
+responses in Chrome's performance log, pulls their bodies over CDP and parses
+reviews straight from the JSON, which skips DOM rendering, the "More" button
+clicks and the truncated "…" text.
+
+Every captured body is cached on disk, so parsing can be replayed offline
+(and in tests) without the network:
+
+    python review_payloads.py pokhara_reviews/xhr_cache --output replayed_reviews.csv
+
+The payloads are undocumented nested arrays; the index paths below are the
+only place that needs updating when Google changes the layout.
+
+Author: AI Assistant
+Date: 2026-01-18
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import threading
+from datetime import datetime
+
+import pandas as pd
+
+try:
+    import config
+except ImportError:
+    # If running from within Scraper directory
+    import sys
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    import config
+
+from reviews import build_review
+
+# Index paths into each payload layout. 'list' leads to the array of reviews,
+# 'item' from one entry to the review record, the rest from that record.
+PAYLOAD_LAYOUTS = {
+    'listugcposts': {
+        'list': [2], 'item': [0],
+        'reviewer_name': [1, 4, 5, 0],
+        'review_date': [1, 6],
+        'rating': [2, 0, 0],
+        'review_text': [2, 15, 0, 0],
+    },
+    'listentitiesreviews': {
+        'list': [2], 'item': [],
+        'reviewer_name': [0, 1],
+        'review_date': [1],
+        'rating': [4],
+        'review_text': [3],
+    },
+}
+
+XSSI_PREFIX = ")]}'"
+
+# Guards the capture sequence numbers; every worker of a pool has its own
+# PayloadCache on the same directory
+_SEQUENCE_LOCK = threading.Lock()
+_next_sequence = {}
+
+
+def layout_for_url(url):
+    """Name of the payload layout a review XHR URL uses, or None"""
+    for name in PAYLOAD_LAYOUTS:
+        if name in (url or ''):
+            return name
+    return None
+
+
+def strip_xssi(body):
+    """Remove the )]}' anti-JSON-hijacking prefix Google puts before JSON"""
+    body = body.lstrip()
+    if body.startswith(XSSI_PREFIX):
+        body = body[len(XSSI_PREFIX):]
+    return body
+
+
+def _get(obj, path):
+    """Follow an index path into nested lists; None if any step is missing"""
+    for index in path:
+        if not isinstance(obj, list) or index >= len(obj):
+            return None
+        obj = obj[index]
+    return obj
+
+
+def parse_review_payload(body, url, place_name, category, extraction_date=None):
+    """Parse one review XHR body into output review rows"""
+    layout = PAYLOAD_LAYOUTS.get(layout_for_url(url))
+    if layout is None:
+        return []
+    try:
+        data = json.loads(strip_xssi(body))
+    except ValueError:
+        return []
+    if extraction_date is None:
+        extraction_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    extracted = []
+    for entry in _get(data, layout['list']) or []:
+        record = _get(entry, layout['item'])
+        if record is None:
+            continue
+        name = _get(record, layout['reviewer_name'])
+        rating = _get(record, layout['rating'])
+        date = _get(record, layout['review_date'])
+        text = _get(record, layout['review_text'])
+        if not isinstance(name, str) and not isinstance(text, str):
+            continue  # Not a review record (paging tokens, owner blocks, ...)
+        extracted.append(build_review(
+            place_name, category,
+            name if isinstance(name, str) else "Anonymous",
+            int(rating) if isinstance(rating, (int, float)) else 0,
+            date if isinstance(date, str) else "Unknown",
+            text if isinstance(text, str) else "",
+            extraction_date
+        ))
+    return extracted
+
+
+class PayloadCache:
+    """Captured review XHR bodies stored as one JSON file each.
+
+    Each body gets a sequence number, increasing across runs, in the order it
+    was saved (for a place: the order its requests were sent), so replay
+    order does not depend on file names or clock resolution.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _take_sequence(self):
+        """Next sequence number for this cache directory"""
+        key = os.path.abspath(self.cache_dir)
+        with _SEQUENCE_LOCK:
+            if key not in _next_sequence:
+                # Continue after the files earlier runs left
+                numbers = [int(match.group(1)) for match in
+                           (re.match(r'(\d+)_', os.path.basename(path))
+                            for path in glob.glob(os.path.join(self.cache_dir, '*.json')))
+                           if match]
+                _next_sequence[key] = max(numbers, default=-1) + 1
+            sequence = _next_sequence[key]
+            _next_sequence[key] += 1
+        return sequence
+
+    def save(self, url, body, place_name, category):
+        """Store one body; returns the file path"""
+        sequence = self._take_sequence()
+        digest = hashlib.sha1(body.encode('utf-8')).hexdigest()[:16]
+        slug = re.sub(r'[^0-9a-z]+', '_', place_name.lower()).strip('_')
+        path = os.path.join(self.cache_dir, f"{sequence:08d}_{slug}_{digest}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'sequence': sequence,
+                'url': url,
+                'place_name': place_name,
+                'category': category,
+                'captured_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'body': body,
+            }, f, ensure_ascii=False)
+        return path
+
+    def replay(self):
+        """Return every cached entry in capture order"""
+        entries = []
+        for path in glob.glob(os.path.join(self.cache_dir, '*.json')):
+            with open(path, 'r', encoding='utf-8') as f:
+                entries.append(json.load(f))
+        # Entries cached before sequence numbers existed come first, by time
+        entries.sort(key=lambda e: (e.get('sequence', -1), e['captured_at']))
+        return entries
+
+    def replay_reviews(self):
+        """Parse every cached payload again, without any browser or network"""
+        reviews = []
+        for entry in self.replay():
+            reviews.extend(parse_review_payload(entry['body'], entry['url'], entry['place_name'],
+                                                entry['category'], entry['captured_at']))
+        return reviews
+
+
+def review_responses(performance_log):
+    """(requestId, url, finished) of review XHR responses in a Chrome performance log.
+
+    Responses are returned in the order their requests were sent, which is
+    the order the batches appear in the reviews list. Responses to requests
+    sent before the log was last read (their request is not in it) are
+    skipped. finished is True once Network.loadingFinished arrived; only then
+    can the body be read with Network.getResponseBody.
+    """
+    sent = {}
+    finished = set()
+    found = []
+    for entry in performance_log:
+        try:
+            message = json.loads(entry['message'])['message']
+        except (KeyError, ValueError):
+            continue
+        params = message.get('params', {})
+        if message.get('method') == 'Network.requestWillBeSent':
+            sent.setdefault(params.get('requestId'), len(sent))
+        elif message.get('method') == 'Network.loadingFinished':
+            finished.add(params.get('requestId'))
+        elif message.get('method') == 'Network.responseReceived':
+            url = params.get('response', {}).get('url', '')
+            if layout_for_url(url) and params.get('requestId') in sent:
+                found.append((params.get('requestId'), url))
+    found.sort(key=lambda response: sent[response[0]])
+    return [(request_id, url, request_id in finished) for request_id, url in found]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-parse cached review XHR payloads offline")
+    parser.add_argument('cache_dir', help="Directory written by the capture mode (xhr_cache)")
+    parser.add_argument('--output', default='replayed_reviews.csv', help="CSV file to write")
+    args = parser.parse_args()
+
+    reviews = PayloadCache(args.cache_dir).replay_reviews()
+    if reviews:
+        df = pd.DataFrame(reviews).drop_duplicates(subset=['place_name', 'reviewer_name', 'review_text'])
+        df.to_csv(args.output, index=False, encoding='utf-8-sig')
+        print(f"✓ Saved {len(df)} reviews to {args.output}")
+    else:
+        print("⚠ No reviews found in the cached payloads")
+
+
+if __name__ == "__main__":
+    main()
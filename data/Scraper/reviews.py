@@ -0,0 +1,126 @@
+"""
+Review Row Helpers for the Pokhara Google Reviews Scraper
+=========================================================
+Builds the output review rows (same CSV schema for every extraction path:
+bulk script, per-element fallback and offline HTML parsing), and the compact
+ReviewRecord form rows are kept in while waiting to be written.
+
+Author: AI Assistant
+Date: 2026-01-13
+"""
+
+import hashlib
+import re
+import sys
+
+import pandas as pd
+
+from code_switch import is_code_switched
+
+# Output review columns, in CSV order
+REVIEW_FIELDS = (
+    'place_name', 'category', 'reviewer_name', 'rating', 'review_date',
+    'review_text', 'is_code_switched', 'extraction_date'
+)
+
+
+def parse_rating(rating_aria):
+    """Turn a rating aria-label such as '5 stars' into an int (0 if unknown)"""
+    rating_match = re.search(r'(\d+)', rating_aria or '')
+    return int(rating_match.group(1)) if rating_match else 0
+
+
+def build_review(place_name, category, name, rating, date, text, extraction_date):
+    """Build one output review row"""
+    return {
+        'place_name': place_name,
+        'category': category,
+        'reviewer_name': name,
+        'rating': rating,
+        'review_date': date,
+        'review_text': text,
+        'is_code_switched': is_code_switched(text),
+        'extraction_date': extraction_date
+    }
+
+
+def _normalise(value):
+    """Lower-cased, whitespace-collapsed text ('' for missing values)"""
+    return ' '.join(value.split()).lower() if isinstance(value, str) else ''
+
+
+def review_key(review):
+    """16-byte blake2b identifying a review row in the output.
+
+    Hashes the normalised place name, reviewer name and full review text
+    (the fields output rows have always been deduplicated on).
+    """
+    key = '\x1f'.join(_normalise(review.get(field))
+                       for field in ('place_name', 'reviewer_name', 'review_text'))
+    return hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+
+
+def review_fingerprint(reviewer_name, review_text):
+    """Stable short hash identifying a review across runs.
+
+    Only the first 80 characters of the text are used, so a card read before
+    and after "More" was expanded (or with a trailing "…") hashes the same.
+    """
+    text = ' '.join((review_text or '').rstrip('…').split()).lower()[:80]
+    name = ' '.join((reviewer_name or '').split()).lower()
+    key = f"{name}\x1f{text}".encode('utf-8')
+    return hashlib.blake2b(key, digest_size=16).hexdigest()
+
+
+def drop_known_reviews(reviews, stop_fingerprint):
+    """Keep only the newest-first reviews above the one with stop_fingerprint"""
+    for i, review in enumerate(reviews):
+        if review_fingerprint(review['reviewer_name'], review['review_text']) == stop_fingerprint:
+            return reviews[:i]
+    return reviews
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class ReviewRecord:
+    """Compact review row: slots instead of a dict per review.
+
+    Values repeated across many rows (place, category, relative date,
+    extraction timestamp) are interned so all rows share one string object.
+    Supports row['field'] and row.get('field') like the dict rows.
+    """
+
+    __slots__ = REVIEW_FIELDS
+
+    def __init__(self, place_name, category, reviewer_name, rating, review_date,
+                 review_text, is_code_switched, extraction_date):
+        self.place_name = _intern(place_name)
+        self.category = _intern(category)
+        self.reviewer_name = reviewer_name
+        self.rating = rating
+        self.review_date = _intern(review_date)
+        self.review_text = review_text
+        self.is_code_switched = is_code_switched
+        self.extraction_date = _intern(extraction_date)
+
+    @classmethod
+    def from_row(cls, row):
+        """Compact one build_review dict"""
+        return cls(*(row.get(field) for field in REVIEW_FIELDS))
+
+    def __getitem__(self, field):
+        return getattr(self, field)
+
+    def get(self, field, default=None):
+        return getattr(self, field, default)
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in REVIEW_FIELDS}
+
+
+def reviews_to_frame(reviews):
+    """DataFrame with the output columns from review dicts or ReviewRecords"""
+    return pd.DataFrame({field: [review.get(field) for review in reviews] for field in REVIEW_FIELDS},
+                        columns=list(REVIEW_FIELDS))
@@ -0,0 +1,154 @@
+"""
+Priority Scheduler for the Pokhara Google Reviews Scraper
+=========================================================
+Orders places by the number of new reviews each is expected to yield per
+second of scraping, using the history kept in the state database:
+
+* review rate - new reviews per day, measured between successful scrapes
+  (an exponentially weighted average, so it follows busy seasons);
+* last scrape - reviews pile up at that rate since the place was last done;
+* time per scrape - how long the place usually takes;
+* failures - every failure in a row halves a place's expected yield.
+
+Places never scraped before come first: their whole backlog is new.
+
+With a deadline (minutes of wall clock per run) places are only started if
+their usual scrape time still fits; the rest stay pending in the job journal
+for the next run (--resume).
+
+Author: AI Assistant
+Date: 2026-01-24
+"""
+
+import os
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+
+try:
+    import config
+except ImportError:
+    # If running from within Scraper directory
+    import sys
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    import config
+
+# Used until some place has history to take the median of
+DEFAULT_REVIEW_RATE = 1.0       # New reviews per day
+DEFAULT_PLACE_SECONDS = 60.0    # Seconds per place
+
+# Weight of the newest sample in the review rate / scrape time averages
+HISTORY_ALPHA = 0.5
+
+# Expected yield multiplier per failure in a row
+FAILURE_PENALTY = 0.5
+
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+class PlaceScheduler:
+    """Place order and deadline for one run, learned from past runs"""
+
+    def __init__(self, state, target=None):
+        self.state = state
+        # Reviews wanted per place (caps the expected yield)
+        self.target = target or (lambda name: config.WEB_SCRAPE_MAX_REVIEWS)
+        self.stats = None
+        self.deadline = None
+        self.default_rate = DEFAULT_REVIEW_RATE
+        self.default_seconds = DEFAULT_PLACE_SECONDS
+        self.lock = threading.Lock()
+
+    def _load(self):
+        """Read the stored history; medians stand in for places without one"""
+        self.stats = self.state.get_place_stats()
+        rates = [s['review_rate'] for s in self.stats.values() if s['review_rate'] is not None]
+        seconds = [s['mean_seconds'] for s in self.stats.values() if s['mean_seconds'] is not None]
+        if rates:
+            self.default_rate = float(np.median(rates))
+        if seconds:
+            self.default_seconds = float(np.median(seconds))
+
+    def start(self, deadline_minutes=None):
+        """Load the history and start the run's clock"""
+        self._load()
+        self.deadline = time.monotonic() + deadline_minutes * 60 if deadline_minutes else None
+
+    def expected_reviews(self, category, name, now=None):
+        """New reviews the place probably has waiting"""
+        if self.stats is None:
+            self._load()
+        target = self.target(name)
+        stats = self.stats.get((category, name))
+        if not stats or not stats['last_scraped_at']:
+            return float(target)
+        now = now or datetime.now()
+        days = (now - datetime.strptime(stats['last_scraped_at'], TIME_FORMAT)).total_seconds() / 86400
+        rate = stats['review_rate'] if stats['review_rate'] is not None else self.default_rate
+        expected = min(rate * max(days, 0.0), target)
+        return expected * FAILURE_PENALTY ** stats['failures']
+
+    def expected_seconds(self, category, name):
+        """How long scraping the place usually takes"""
+        if self.stats is None:
+            self._load()
+        stats = self.stats.get((category, name))
+        if stats and stats['mean_seconds'] is not None:
+            return stats['mean_seconds']
+        return self.default_seconds
+
+    def order(self, places):
+        """(category, name) pairs of places, highest expected yield per second first"""
+        if self.stats is None:
+            self._load()
+        now = datetime.now()
+        pairs = [(category, name) for category, names in places.items() for name in names]
+        # sorted() is stable, so ties keep config order
+        return sorted(pairs, key=lambda pair: -self.expected_reviews(*pair, now=now)
+                      / max(self.expected_seconds(*pair), 1.0))
+
+    def describe(self, order, limit=5):
+        """Print the first places of an order with their expected yield"""
+        print(f"Schedule: {len(order)} places, highest expected yield first")
+        for category, name in order[:limit]:
+            print(f"  {name} ({category}): ~{self.expected_reviews(category, name):.0f} new reviews "
+                  f"in ~{self.expected_seconds(category, name):.0f}s")
+
+    def time_left(self):
+        """Seconds until the deadline, or None without one"""
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    def fits(self, category, name):
+        """Whether the place can still be scraped before the deadline"""
+        left = self.time_left()
+        return left is None or self.expected_seconds(category, name) <= left
+
+    def record(self, category, name, ok, reviews, seconds):
+        """Update a place's history after scraping it"""
+        with self.lock:
+            if self.stats is None:
+                self._load()
+            stats = dict(self.stats.get((category, name)) or
+                         {'last_scraped_at': None, 'review_rate': None, 'mean_seconds': None,
+                          'failures': 0, 'runs': 0})
+            stats['runs'] += 1
+            if not ok:
+                stats['failures'] += 1
+            else:
+                now = datetime.now()
+                if stats['last_scraped_at']:
+                    days = (now - datetime.strptime(stats['last_scraped_at'], TIME_FORMAT)).total_seconds() / 86400
+                    if days > 0:
+                        rate = reviews / days
+                        stats['review_rate'] = rate if stats['review_rate'] is None else (
+                            HISTORY_ALPHA * rate + (1 - HISTORY_ALPHA) * stats['review_rate'])
+                stats['mean_seconds'] = seconds if stats['mean_seconds'] is None else (
+                    HISTORY_ALPHA * seconds + (1 - HISTORY_ALPHA) * stats['mean_seconds'])
+                stats['last_scraped_at'] = now.strftime(TIME_FORMAT)
+                stats['failures'] = 0
+            self.stats[(category, name)] = stats
+            self.state.save_place_stats(category, name, stats)
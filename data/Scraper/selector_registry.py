@@ -0,0 +1,117 @@
+"""
+Selector Registry for the Pokhara Google Reviews Scraper
+========================================================
+Maps UI elements the scraper clicks (the Reviews tab, the Sort button) to
+their candidate selectors and learns which one works:
+
+* all candidates are probed in a single script call (PROBE_SELECTORS_SCRIPT)
+  that clicks the first one on the page, instead of one find_element round
+  trip per selector;
+* candidates are ordered per page language: the selector that last worked
+  comes first, then the rest by success rate (clicks that did what they were
+  for), then in their original order;
+* probes, matches, clicks and successes are kept in the state database, so
+  the ordering carries over to later runs and the run report shows hit rates.
+
+Author: AI Assistant
+Date: 2026-01-26
+"""
+
+import threading
+
+from page_scripts import PROBE_SELECTORS_SCRIPT, REVIEW_TAB_SELECTORS, SORT_BUTTON_SELECTORS
+
+DEFAULT_GROUPS = {
+    'review_tab': REVIEW_TAB_SELECTORS,
+    'sort_button': SORT_BUTTON_SELECTORS,
+}
+
+EMPTY_STATS = {'probes': 0, 'matches': 0, 'clicks': 0, 'wins': 0, 'last_win_at': None}
+
+
+class SelectorRegistry:
+    """Candidate selectors per UI element, ordered by what worked before"""
+
+    def __init__(self, state=None, groups=None):
+        # ScrapeStateStore for persistent statistics (None keeps them in memory)
+        self.state = state
+        self.groups = dict(DEFAULT_GROUPS if groups is None else groups)
+        self.stats = state.get_selector_stats() if state is not None else {}
+        # (group, locale) -> selector that worked last
+        self.last_winner = {}
+        latest = {}
+        for (group, locale, selector), row in self.stats.items():
+            won_at = row['last_win_at']
+            if won_at and won_at >= latest.get((group, locale), ''):
+                latest[(group, locale)] = won_at
+                self.last_winner[(group, locale)] = selector
+        # Page language of the latest probe; the next probe is ordered for it.
+        # Until then, the language that last had a winner
+        self.locale = max(latest, key=latest.get)[1] if latest else ''
+        self.lock = threading.Lock()
+
+    def order(self, group, locale=None):
+        """The group's candidates, most likely to work first"""
+        locale = self.locale if locale is None else locale
+        winner = self.last_winner.get((group, locale))
+
+        def key(indexed):
+            index, selector = indexed
+            row = self.stats.get((group, locale, selector), EMPTY_STATS)
+            # Smoothed success rate; untried selectors sit at 0.5
+            rate = (row['wins'] + 1) / (row['clicks'] + 2)
+            return (selector != winner, -rate, index)
+
+        return [selector for _, selector in sorted(enumerate(self.groups[group]), key=key)]
+
+    def _add(self, rows):
+        """Add (group, locale, selector, probes, matches, clicks, wins) counts"""
+        with self.lock:
+            for group, locale, selector, probes, matches, clicks, wins in rows:
+                row = dict(self.stats.get((group, locale, selector), EMPTY_STATS))
+                row['probes'] += probes
+                row['matches'] += matches
+                row['clicks'] += clicks
+                row['wins'] += wins
+                self.stats[(group, locale, selector)] = row
+        if self.state is not None:
+            self.state.add_selector_stats(rows)
+
+    def record_probe(self, group, candidates, result):
+        """Record a PROBE_SELECTORS_SCRIPT result; returns the clicked selector or None"""
+        clicked, present, locale = result
+        self.locale = locale or ''
+        self._add([(group, self.locale, selector, 1, int(bool(found)), int(index == clicked), 0)
+                   for index, (selector, found) in enumerate(zip(candidates, present))])
+        return candidates[clicked] if clicked >= 0 else None
+
+    def click_first(self, driver, group, exclude=()):
+        """Click the best candidate on the page in one script call; returns it or None"""
+        candidates = [selector for selector in self.order(group) if selector not in exclude]
+        if not candidates:
+            return None
+        result = driver.execute_script(PROBE_SELECTORS_SCRIPT, candidates)
+        return self.record_probe(group, candidates, result)
+
+    def report(self, group, selector, worked):
+        """Feed back whether a clicked selector did what it was clicked for"""
+        key = (group, self.locale)
+        if worked:
+            self.last_winner[key] = selector
+            self._add([(group, self.locale, selector, 0, 0, 0, 1)])
+        elif self.last_winner.get(key) == selector:
+            del self.last_winner[key]
+
+    def summary(self):
+        """{group: {locale: {selector: counts and hit rate}}}, from the database when there is one"""
+        stats = self.state.get_selector_stats() if self.state is not None else dict(self.stats)
+        summary = {}
+        for (group, locale, selector), row in sorted(stats.items()):
+            summary.setdefault(group, {}).setdefault(locale or 'unknown', {})[selector] = {
+                'probes': row['probes'],
+                'matches': row['matches'],
+                'clicks': row['clicks'],
+                'wins': row['wins'],
+                'hit_rate': round(row['wins'] / row['clicks'], 3) if row['clicks'] else None,
+            }
+        return summary
@@ -0,0 +1,317 @@
+"""
+Persistent Scrape State for the Pokhara Google Reviews Scraper
+==============================================================
+A small SQLite database kept in the output directory. It remembers, for every
+place, the fingerprint of the newest review already collected (the place's
+"high-water mark"), so the next run can stop scrolling as soon as it reaches
+reviews it has seen before.
+
+It also holds the job journal: one row per (category, place) with its status
+in the current run, so an interrupted run can be resumed. Every update is a
+single SQLite transaction, so the journal is never left half-written.
+
+Finally, seen_reviews holds a 16-byte hash of every review ever written to
+the output, so repeated scrapes of a place never produce duplicate rows, in
+this run or any later one.
+
+place_urls caches the Maps URL each place resolved to, so later runs can
+open it directly instead of searching; a URL that stops working is dropped
+and the place is searched for again.
+
+place_stats keeps a short history per place (new reviews per day, time per
+scrape, failures in a row) that scheduler.py uses to order places.
+
+selector_stats counts, per page language, how often each UI selector was on
+the page, clicked and successful, for selector_registry.py.
+
+Author: AI Assistant
+Date: 2026-01-14
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+try:
+    import config
+except ImportError:
+    # If running from within Scraper directory
+    import sys
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    import config
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS place_state (
+    category            TEXT NOT NULL,
+    name                TEXT NOT NULL,
+    newest_fingerprint  TEXT,
+    updated_at          TEXT,
+    PRIMARY KEY (category, name)
+);
+
+CREATE TABLE IF NOT EXISTS place_jobs (
+    category    TEXT NOT NULL,
+    name        TEXT NOT NULL,
+    status      TEXT NOT NULL,
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    last_error  TEXT,
+    place_row   TEXT,
+    updated_at  TEXT,
+    PRIMARY KEY (category, name)
+);
+
+CREATE TABLE IF NOT EXISTS seen_reviews (
+    review_key  BLOB PRIMARY KEY,
+    category    TEXT,
+    place_name  TEXT,
+    first_seen  TEXT
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS place_urls (
+    category    TEXT NOT NULL,
+    name        TEXT NOT NULL,
+    url         TEXT NOT NULL,
+    place_id    TEXT,
+    resolved_at TEXT,
+    PRIMARY KEY (category, name)
+);
+
+CREATE TABLE IF NOT EXISTS selector_stats (
+    grp         TEXT NOT NULL,
+    locale      TEXT NOT NULL,
+    selector    TEXT NOT NULL,
+    probes      INTEGER NOT NULL DEFAULT 0,
+    matches     INTEGER NOT NULL DEFAULT 0,
+    clicks      INTEGER NOT NULL DEFAULT 0,
+    wins        INTEGER NOT NULL DEFAULT 0,
+    last_win_at TEXT,
+    PRIMARY KEY (grp, locale, selector)
+);
+
+CREATE TABLE IF NOT EXISTS place_stats (
+    category        TEXT NOT NULL,
+    name            TEXT NOT NULL,
+    last_scraped_at TEXT,
+    review_rate     REAL,
+    mean_seconds    REAL,
+    failures        INTEGER NOT NULL DEFAULT 0,
+    runs            INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (category, name)
+);
+"""
+
+# Keys per SELECT ... IN (...) query (below SQLite's parameter limit)
+KEY_QUERY_CHUNK = 500
+
+# Job journal statuses
+JOB_PENDING = 'pending'
+JOB_RUNNING = 'running'
+JOB_DONE = 'done'
+JOB_FAILED = 'failed'
+
+
+class ScrapeStateStore:
+    """SQLite-backed per-place state shared across runs"""
+
+    def __init__(self, path):
+        self.path = path
+        # One connection per store; the lock makes it safe to share between
+        # threads, and SQLite's own locking covers several pool workers
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock, self.conn:
+            self.conn.executescript(SCHEMA)
+
+    @classmethod
+    def for_output_dir(cls, output_dir):
+        """Open the state database that lives in output_dir"""
+        filename = getattr(config, 'STATE_DB_FILENAME', 'scrape_state.sqlite')
+        return cls(os.path.join(output_dir, filename))
+
+    def get_high_water_mark(self, category, name):
+        """Fingerprint of the newest review collected for a place, or None"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT newest_fingerprint FROM place_state WHERE category = ? AND name = ?",
+                (category, name)).fetchone()
+        return row[0] if row else None
+
+    def set_high_water_mark(self, category, name, fingerprint):
+        """Record the newest review fingerprint for a place"""
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO place_state (category, name, newest_fingerprint, updated_at) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(category, name) DO UPDATE SET "
+                "newest_fingerprint = excluded.newest_fingerprint, updated_at = excluded.updated_at",
+                (category, name, fingerprint, now))
+
+    def clear_high_water_marks(self):
+        """Forget every place's newest review (the next run scrapes in full)"""
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM place_state")
+
+    def reset_jobs(self, places):
+        """Start a fresh journal with every (category -> names) place pending"""
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        rows = [(category, name, JOB_PENDING, now)
+                for category, names in places.items() for name in names]
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM place_jobs")
+            self.conn.executemany(
+                "INSERT INTO place_jobs (category, name, status, updated_at) VALUES (?, ?, ?, ?)",
+                rows)
+
+    def mark_job(self, category, name, status, error=None, place_row=None):
+        """Record a status change for one place"""
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        attempt = 1 if status == JOB_RUNNING else 0
+        row_json = json.dumps(place_row, ensure_ascii=False) if place_row is not None else None
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO place_jobs (category, name, status, attempts, last_error, place_row, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(category, name) DO UPDATE SET "
+                "status = excluded.status, "
+                "attempts = place_jobs.attempts + excluded.attempts, "
+                "last_error = excluded.last_error, "
+                "place_row = COALESCE(excluded.place_row, place_jobs.place_row), "
+                "updated_at = excluded.updated_at",
+                (category, name, status, attempt, error, row_json, now))
+
+    def get_jobs(self):
+        """Return {(category, name): {'status', 'attempts', 'last_error', 'place_row'}}"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT category, name, status, attempts, last_error, place_row FROM place_jobs").fetchall()
+        return {
+            (category, name): {
+                'status': status,
+                'attempts': attempts,
+                'last_error': last_error,
+                'place_row': json.loads(place_row) if place_row else None,
+            }
+            for category, name, status, attempts, last_error, place_row in rows
+        }
+
+    def known_review_keys(self, keys):
+        """The subset of keys already recorded in seen_reviews"""
+        keys = list(keys)
+        known = set()
+        with self.lock:
+            for start in range(0, len(keys), KEY_QUERY_CHUNK):
+                chunk = keys[start:start + KEY_QUERY_CHUNK]
+                placeholders = ','.join('?' * len(chunk))
+                known.update(row[0] for row in self.conn.execute(
+                    f"SELECT review_key FROM seen_reviews WHERE review_key IN ({placeholders})", chunk))
+        return known
+
+    def add_review_keys(self, rows):
+        """Record (review_key, category, place_name) rows as written"""
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO seen_reviews (review_key, category, place_name, first_seen) "
+                "VALUES (?, ?, ?, ?)",
+                [(key, category, place_name, now) for key, category, place_name in rows])
+
+    def clear_review_keys(self):
+        """Forget every written review (the next run may write them again)"""
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM seen_reviews")
+
+    def get_place_url(self, category, name):
+        """Cached Maps URL of a place, or None"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT url FROM place_urls WHERE category = ? AND name = ?",
+                (category, name)).fetchone()
+        return row[0] if row else None
+
+    def set_place_url(self, category, name, url, place_id=None):
+        """Remember the Maps URL (and feature ID) a place resolved to"""
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO place_urls (category, name, url, place_id, resolved_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(category, name) DO UPDATE SET "
+                "url = excluded.url, place_id = excluded.place_id, resolved_at = excluded.resolved_at",
+                (category, name, url, place_id, now))
+
+    def forget_place_url(self, category, name):
+        """Drop a place's cached URL (it will be searched for again)"""
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM place_urls WHERE category = ? AND name = ?",
+                              (category, name))
+
+    def get_place_stats(self):
+        """Return {(category, name): {'last_scraped_at', 'review_rate', 'mean_seconds', 'failures', 'runs'}}"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT category, name, last_scraped_at, review_rate, mean_seconds, failures, runs "
+                "FROM place_stats").fetchall()
+        return {
+            (category, name): {
+                'last_scraped_at': last_scraped_at,
+                'review_rate': review_rate,
+                'mean_seconds': mean_seconds,
+                'failures': failures,
+                'runs': runs,
+            }
+            for category, name, last_scraped_at, review_rate, mean_seconds, failures, runs in rows
+        }
+
+    def save_place_stats(self, category, name, stats):
+        """Store one place's history (a dict shaped like get_place_stats' values)"""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO place_stats "
+                "(category, name, last_scraped_at, review_rate, mean_seconds, failures, runs) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (category, name, stats.get('last_scraped_at'), stats.get('review_rate'),
+                 stats.get('mean_seconds'), stats.get('failures', 0), stats.get('runs', 0)))
+
+    def get_selector_stats(self):
+        """Return {(group, locale, selector): {'probes', 'matches', 'clicks', 'wins', 'last_win_at'}}"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT grp, locale, selector, probes, matches, clicks, wins, last_win_at "
+                "FROM selector_stats").fetchall()
+        return {
+            (group, locale, selector): {
+                'probes': probes,
+                'matches': matches,
+                'clicks': clicks,
+                'wins': wins,
+                'last_win_at': last_win_at,
+            }
+            for group, locale, selector, probes, matches, clicks, wins, last_win_at in rows
+        }
+
+    def add_selector_stats(self, rows):
+        """Add (group, locale, selector, probes, matches, clicks, wins) counts.
+
+        Counts are added to the stored ones, so several pool workers can
+        report at once; a row with wins also becomes the latest winner.
+        """
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT INTO selector_stats (grp, locale, selector, probes, matches, clicks, wins, last_win_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(grp, locale, selector) DO UPDATE SET "
+                "probes = probes + excluded.probes, matches = matches + excluded.matches, "
+                "clicks = clicks + excluded.clicks, wins = wins + excluded.wins, "
+                "last_win_at = COALESCE(excluded.last_win_at, selector_stats.last_win_at)",
+                [(group, locale, selector, probes, matches, clicks, wins, now if wins else None)
+                 for group, locale, selector, probes, matches, clicks, wins in rows])
+
+    def close(self):
+        """Close the database connection"""
+        with self.lock:
+            self.conn.close()
@@ -0,0 +1,30 @@
+import os
+import sys
+
+import pytest
+
+# The scraper modules import each other as top-level modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config  # noqa: E402
+from fake_maps import scrape_settings  # noqa: E402
+from local_maps_server import start_server  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+@pytest.fixture
+def scrape_config(monkeypatch):
+    """Two small places and short waits for scraper runs against FakeMapsDriver"""
+    for name, value in scrape_settings(config).items():
+        monkeypatch.setattr(config, name, value)
+
+
+@pytest.fixture
+def local_maps_server():
+    """Base URL of a local_maps_server.py answering every place with fixtures/captured_place.html"""
+    server, base_url = start_server(FIXTURES_DIR,
+                                    default_page=os.path.join(FIXTURES_DIR, 'captured_place.html'))
+    yield base_url
+    server.shutdown()
+    server.server_close()
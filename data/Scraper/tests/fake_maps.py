@@ -0,0 +1,229 @@
+"""Minimal stand-in for a Chrome WebDriver showing Google Maps review pages.
+
+Scripts are recognised by identity with the constants in page_scripts.py.
+Each place has a list of (reviewer, text) reviews, newest first; before the
+"Newest" sort is applied the cards are shown in a different (relevance) order.
+Like Maps, the re-sorted list replaces the cards sort_delay seconds after
+"Newest" is clicked, and a card's text is cut short ("…") until its "More"
+button has been clicked.
+
+`faults` maps a place name to the faults of its next visits, one per visit
+(None for a normal visit); the list is shared by every session:
+  'blank' - the page shows nothing (blocked, captcha or stuck page)
+  'slow'  - the Reviews tab opens but no cards show up
+  'crash' - the browser dies on driver.get and stays dead
+  'hang'  - driver.get never returns (for killing a run midway)
+"""
+
+import re
+import time
+from urllib.parse import unquote
+
+from selenium.common.exceptions import WebDriverException
+
+import page_scripts as ps
+from pokhara_google_reviews_scraper import GoogleMapsSeleniumScraper
+
+
+class FakeElement:
+    def __init__(self, on_click=None, key=None):
+        self.on_click = on_click
+        self.key = key
+
+    def click(self):
+        if self.on_click:
+            self.on_click()
+
+
+class FakeMapsDriver:
+    """One browser session; `places` maps place name -> [(reviewer, text), ...] newest first"""
+
+    def __init__(self, places, batch=10, base_url='https://www.google.com/maps', sort_delay=0.0,
+                 faults=None):
+        self.places = places
+        self.faults = faults if faults is not None else {}
+        self.fault = None
+        self.crashed = False
+        self.batch = batch
+        self.base_url = base_url
+        self.sort_delay = sort_delay
+        self.place = None
+        self.loaded = 0
+        self.expanded = 0
+        self.harvested = 0
+        self.sorted_at = None
+        self.first_card_marked = False
+        self.menu_open = False
+        self.quit_called = False
+
+    # --------------------------------------------------------------- page state
+
+    def get(self, url):
+        self._check_alive()
+        match = re.search(r'/(?:search|place)/([^/?]+)', url)
+        name = unquote(match.group(1)) if match else ''
+        self.place = name[:-len(' Pokhara')] if name.endswith(' Pokhara') else name
+        pending = self.faults.get(self.place)
+        self.fault = pending.pop(0) if pending else None
+        if self.fault == 'crash':
+            self.crashed = True
+            self._check_alive()
+        if self.fault == 'hang':
+            time.sleep(3600)
+        self.loaded = 0
+        self.expanded = 0
+        self.harvested = 0
+        self.sorted_at = None
+        self.first_card_marked = False
+        self.menu_open = False
+
+    @property
+    def sorted_newest(self):
+        return self.sorted_at is not None and time.monotonic() >= self.sorted_at
+
+    @property
+    def current_url(self):
+        return f"{self.base_url}/place/{self.place}/data=!4m2!1s0x1:0x2!9m1!1b1"
+
+    def cards(self):
+        reviews = self.places.get(self.place, [])
+        if not self.sorted_newest:
+            # Relevance order: oldest first
+            reviews = list(reversed(reviews))
+        return reviews[:self.loaded]
+
+    def _check_alive(self):
+        if self.crashed:
+            raise WebDriverException("chrome not reachable")
+
+    def _open_reviews(self):
+        if self.fault == 'slow':
+            return
+        self.loaded = min(self.batch, len(self.places.get(self.place, [])))
+
+    def _pick_menu_item(self, index):
+        self.menu_open = False
+        if index == 1:
+            self.sorted_at = time.monotonic() + self.sort_delay
+
+    # ------------------------------------------------------------ driver API
+
+    def quit(self):
+        self.quit_called = True
+
+    def get_log(self, kind):
+        return []
+
+    def set_script_timeout(self, seconds):
+        pass
+
+    def set_page_load_timeout(self, seconds):
+        pass
+
+    def execute_async_script(self, script, *args):
+        raise WebDriverException("async scripts not supported")
+
+    def find_elements(self, by, selector):
+        self._check_alive()
+        if self.fault == 'blank':
+            return []
+        if selector in ("a.hfpxzc", "h1.DUwDvf", "div[role='tablist'] button"):
+            return [FakeElement()]
+        if selector == "div[role='menuitemradio']":
+            if not self.menu_open:
+                return []
+            return [FakeElement(lambda i=i: self._pick_menu_item(i)) for i in range(3)]
+        if selector == "div.jftiEf":
+            return [FakeElement(key=card) for card in self.cards()]
+        return []
+
+    def execute_script(self, script, *args):
+        self._check_alive()
+        if self.fault == 'blank':
+            return [-1, [False] * len(args[0]), ''] if script == ps.PROBE_SELECTORS_SCRIPT else None
+        if script == "arguments[0].click();":
+            args[0].click()
+            return None
+        if script == ps.PROBE_SELECTORS_SCRIPT:
+            present = ["Reviews" in s or "Sort reviews" in s for s in args[0]]
+            clicked = present.index(True) if True in present else -1
+            if clicked >= 0:
+                if "Reviews" in args[0][clicked]:
+                    self._open_reviews()
+                else:
+                    self.menu_open = True
+            return [clicked, present, 'en']
+        if script == ps.COUNT_CARDS_SCRIPT:
+            return self.loaded if args[0] == "div.jftiEf" else 0
+        if script == ps.COUNT_SEEN_CARDS_SCRIPT:
+            return self.loaded if args[1] == "div.jftiEf" else 0
+        if script == ps.PLACE_REVIEW_COUNT_SCRIPT:
+            return len(self.places.get(self.place, []))
+        if script == ps.MARK_FIRST_CARD_SCRIPT:
+            self.first_card_marked = self.loaded > 0
+            return self.first_card_marked
+        if script == ps.FIRST_CARD_REPLACED_SCRIPT:
+            # Re-sorting renders new cards
+            return self.loaded > 0 and (self.sorted_newest or not self.first_card_marked)
+        if script == ps.FIND_SCROLL_CONTAINER_SCRIPT:
+            return FakeElement()
+        if script == ps.SCROLL_CONTAINER_SCRIPT:
+            self.loaded = min(self.loaded + self.batch, len(self.places.get(self.place, [])))
+            return [1000, self.loaded]
+        if script == ps.CARD_KEYS_SCRIPT:
+            return [list(card) for card in self.cards()[args[1]:]]
+        if script == ps.EXTRACT_REVIEWS_SCRIPT:
+            return [[name, '5 stars', 'a week ago', text if i < self.expanded else text[:5] + '…']
+                    for i, (name, text) in enumerate(self.cards())]
+        if script == ps.PAGE_WEIGHT_SCRIPT:
+            return [1000, 10]
+        if script == ps.EXPAND_MORE_SCRIPT:
+            self.expanded = self.loaded
+            return None
+        if script == ps.EXPAND_FRESH_CARDS_SCRIPT:
+            clicked = self.loaded - max(self.expanded, self.harvested)
+            self.expanded = self.loaded
+            return max(clicked, 0)
+        if script == ps.HARVEST_CARDS_SCRIPT:
+            fresh = self.cards()[self.harvested:]
+            rows = [[name, '5 stars', 'a week ago', text if self.harvested + i < self.expanded else text[:5] + '…']
+                    for i, (name, text) in enumerate(fresh)]
+            self.harvested = self.loaded
+            return rows
+        return None
+
+
+def scrape_settings(config):
+    """config overrides for scraper runs against FakeMapsDriver: two small places, short waits"""
+    return {
+        'SPECIFIC_PLACES': {'hotels': ['A'], 'lakes': ['D']},
+        'WEB_SCRAPE_MAX_REVIEWS': 30,
+        'WEB_SCRAPE_POOL_SIZE': 1,
+        'WEB_SCRAPE_WAIT_TIMEOUTS': dict(config.WEB_SCRAPE_WAIT_TIMEOUTS, search_results=0.1,
+                                         place_details=0.1, reviews_loaded=0.2,
+                                         scroll_growth=0.05, expand_more=0.05),
+        'WEB_SCRAPE_SCROLL_TUNING': {'patience': 2, 'initial_wait': 0.05},
+        'WEB_SCRAPE_RETRY': dict(config.WEB_SCRAPE_RETRY, base_delay=0.01),
+        'WEB_SCRAPE_CIRCUIT_BREAKER': dict(config.WEB_SCRAPE_CIRCUIT_BREAKER, cooldown=0.05),
+    }
+
+
+def reviews(prefix, count):
+    """count (reviewer, text) pairs, newest first"""
+    return [(f'{prefix}user{i}', f'{prefix}ramro {i}') for i in range(count)]
+
+
+def make_scraper(output_dir, places, **driver_options):
+    """A scraper whose browser sessions are FakeMapsDrivers over places.
+
+    Every session started is appended to scraper.fake_drivers.
+    """
+    drivers = []
+
+    def factory():
+        drivers.append(FakeMapsDriver(places, **driver_options))
+        return drivers[-1]
+
+    scraper = GoogleMapsSeleniumScraper(output_dir=str(output_dir), driver_factory=factory)
+    scraper.fake_drivers = drivers
+    return scraper
@@ -0,0 +1,152 @@
+import asyncio
+import os
+from urllib.request import urlopen
+
+import pandas as pd
+import pytest
+
+import config
+from async_cdp_scraper import COUNT_ABOVE_SCRIPT, AsyncMapsScraper, CDPConnection, CDPTab, ElementHandle
+from browser_pool import find_chrome_binary
+from fake_maps import reviews
+from page_scripts import PROBE_SELECTORS_SCRIPT, SCROLL_AND_WAIT_SCRIPT
+from reviews import build_review
+from state_store import ScrapeStateStore
+
+
+class SilentSocket:
+    """A DevTools socket that never answers"""
+
+    async def send(self, message):
+        pass
+
+
+def test_timed_out_command_is_not_left_pending():
+    conn = CDPConnection('ws://unused')
+    conn.ws = SilentSocket()
+
+    async def send():
+        with pytest.raises(asyncio.TimeoutError):
+            await conn.send('Runtime.evaluate', timeout=0.01)
+
+    asyncio.run(send())
+    assert conn._pending == {}
+
+
+class FakeTab(CDPTab):
+    """Reviews show up only after the second review tab candidate is clicked"""
+
+    def __init__(self):
+        super().__init__(None, 'target', 'session', 'context')
+        self.clicked = []
+
+    async def navigate(self, url):
+        pass
+
+    async def run_script(self, script, *args):
+        if script == PROBE_SELECTORS_SCRIPT:
+            self.clicked.append(args[0][0])
+            return [0, [True] * len(args[0]), 'en']
+        if script == COUNT_ABOVE_SCRIPT:
+            return 10 if len(self.clicked) >= 2 else 0
+        return True
+
+
+def test_open_reviews_tries_the_other_tab_candidates(tmp_path, monkeypatch):
+    scraper = AsyncMapsScraper(output_dir=str(tmp_path))
+    monkeypatch.setattr(scraper, 'timeouts', dict(scraper.timeouts, reviews_loaded=0.05))
+    tab = FakeTab()
+
+    assert asyncio.run(scraper._open_reviews(tab, 'A'))
+    assert len(tab.clicked) == 2 and tab.clicked[0] != tab.clicked[1]
+    assert tab.wait_seconds > 0
+
+
+class ScrollingTab(CDPTab):
+    """A reviews pane holding 10 cards that grows by 10 per scroll up to 25"""
+
+    def __init__(self):
+        super().__init__(None, 'target', 'session', 'context')
+        self.pane_lookups = 0
+        self.cards = 10
+
+    async def find_element(self, script, *args):
+        self.pane_lookups += 1
+        return ElementHandle('pane')
+
+    async def run_script(self, script, *args):
+        return self.cards
+
+    async def run_async_script(self, script, *args):
+        assert script == SCROLL_AND_WAIT_SCRIPT and isinstance(args[0], ElementHandle)
+        self.cards = min(self.cards + 10, 25)
+        return [0, self.cards, 5 if self.cards > args[2] else -1]
+
+
+def test_scroll_reuses_the_pane_until_the_list_stops_growing(tmp_path, scrape_config):
+    scraper = AsyncMapsScraper(output_dir=str(tmp_path))
+    tab = ScrollingTab()
+
+    assert asyncio.run(scraper._scroll(tab, 100)) is False
+    assert tab.cards == 25
+    assert tab.pane_lookups == 1
+
+
+def test_run_journals_places_and_moves_the_high_water_mark(tmp_path, scrape_config, monkeypatch):
+    async def no_connection(self):
+        pass
+
+    monkeypatch.setattr(CDPConnection, 'connect', no_connection)
+    monkeypatch.setattr(CDPConnection, 'close', no_connection)
+    scraper = AsyncMapsScraper(output_dir=str(tmp_path), debugger_url='ws://unused')
+
+    async def scrape_place(conn, name, category):
+        if name == 'D':
+            return None
+        rows = [build_review(name, category, reviewer, 5, 'a day ago', text, '2026-01-17 10:00:00')
+                for reviewer, text in reviews('a', 3)]
+        return rows, {'name': name, 'category': category, '_high_water_mark': 'abc'}
+
+    monkeypatch.setattr(scraper, 'scrape_place', scrape_place)
+    scraper.scrape_all_from_config()
+    jobs = scraper.state.get_jobs()
+
+    assert jobs[('hotels', 'A')]['status'] == 'done'
+    assert jobs[('lakes', 'D')]['status'] == 'failed'
+    assert jobs[('lakes', 'D')]['last_error'].startswith('selector_missing')
+    assert scraper.state.get_high_water_mark('hotels', 'A') == 'abc'
+    assert len(pd.read_csv(os.path.join(tmp_path, 'pokhara_reviews.csv'), encoding='utf-8-sig')) == 3
+    scraper.state.close()
+
+
+def test_local_server_answers_a_place_search(local_maps_server):
+    with urlopen(f"{local_maps_server}/search/Fish%20Tail%20Lodge%20Pokhara?hl=en") as response:
+        assert b'class="DUwDvf"' in response.read()
+
+
+def test_async_engine_scrapes_the_local_server(tmp_path, scrape_config, local_maps_server, monkeypatch):
+    try:
+        find_chrome_binary()
+    except RuntimeError:
+        pytest.skip("Chrome is not installed")
+    monkeypatch.setattr(config, 'SPECIFIC_PLACES', {'hotels': ['Fish Tail Lodge']})
+    monkeypatch.setattr(config, 'CHROME_OPTIONS', ['--headless=new', '--no-sandbox', '--disable-gpu'])
+    monkeypatch.setattr(config, 'WEB_SCRAPE_WAIT_TIMEOUTS',
+                        dict(config.WEB_SCRAPE_WAIT_TIMEOUTS, search_results=10, sort_menu=5, sort_applied=5))
+    monkeypatch.setattr(config, 'WEB_SCRAPE_SCROLL_TUNING', {'patience': 2, 'initial_wait': 1.0})
+
+    def run(resume=False):
+        AsyncMapsScraper(output_dir=str(tmp_path), base_url=local_maps_server).scrape_all_from_config(resume)
+        return pd.read_csv(os.path.join(tmp_path, 'pokhara_reviews.csv'), encoding='utf-8-sig')
+
+    df = run()
+    # Sorted newest first, and the whole scrolled list was read
+    assert len(df) == 15
+    assert df['reviewer_name'].iloc[0] == 'Reviewer 1'
+    state = ScrapeStateStore.for_output_dir(str(tmp_path))
+    assert state.get_jobs()[('hotels', 'Fish Tail Lodge')]['status'] == 'done'
+    assert state.get_high_water_mark('hotels', 'Fish Tail Lodge')
+    state.close()
+
+    # Nothing new above the high-water mark: the next run adds no rows
+    assert len(run()) == 15
@@ -0,0 +1,40 @@
+import json
+import threading
+import time
+
+import browser_pool
+from browser_pool import BrowserPool
+
+
+class FakeProcess:
+    pid = 4242
+
+    def __init__(self, args, **kwargs):
+        time.sleep(0.05)  # Chrome takes a while to start
+
+    def poll(self):
+        return None
+
+
+def test_parallel_workers_keep_each_others_slots(tmp_path, monkeypatch):
+    monkeypatch.setattr(browser_pool.subprocess, 'Popen', FakeProcess)
+    monkeypatch.setattr(browser_pool, 'find_chrome_binary', lambda: 'chrome')
+    monkeypatch.setattr(browser_pool, 'debugger_alive', lambda address, timeout=0.5: True)
+    killed = []
+    monkeypatch.setattr(browser_pool.os, 'kill', lambda pid, sig: killed.append(pid))
+
+    # Every session makes its own BrowserPool, as setup_driver does
+    workers = [threading.Thread(target=BrowserPool(str(tmp_path)).acquire, args=(slot,))
+               for slot in range(6)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    with open(tmp_path / 'browser_pool.json', encoding='utf-8') as f:
+        assert sorted(json.load(f)) == [str(slot) for slot in range(6)]
+
+    BrowserPool(str(tmp_path)).release(3)
+    assert killed == [FakeProcess.pid]
+    with open(tmp_path / 'browser_pool.json', encoding='utf-8') as f:
+        assert sorted(json.load(f)) == ['0', '1', '2', '4', '5']
@@ -0,0 +1,18 @@
+import random
+
+import numpy as np
+
+from code_switch import NEPALI_KEYWORDS, classify_code_switched, is_code_switched
+
+
+def test_batch_classifier_matches_is_code_switched():
+    rng = random.Random(7)
+    pieces = sorted(NEPALI_KEYWORDS) + ['Ramro', 'HO', 'good', 'hotel', 'ramroo', 'xma', 'राम्रो',
+                                        'छ', '5', '!', '\n', 'İstanbul', '\u212aati', 'ma_', 'ho2', 'ΣΑΣ', 'Ⅻ', '\ud800', '']
+    texts = [''.join(rng.choice(pieces) + rng.choice(' ,.\t') for _ in range(rng.randint(0, 6)))
+             for _ in range(3000)]
+    texts += [None, float('nan'), '', 'ramro', 'ramro छ', 'राम्रो छ']
+
+    expected = np.array([is_code_switched(t) if isinstance(t, str) else False for t in texts])
+    assert (classify_code_switched(texts) == expected).all()
+    assert expected.any() and not expected.all()
@@ -0,0 +1,100 @@
+import os
+import subprocess
+import sys
+import time
+
+import pandas as pd
+import pytest
+
+from fake_maps import make_scraper, reviews
+from state_store import ScrapeStateStore
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# A run whose second place never loads, started in its own process so it can
+# be killed like a crashed or stopped scraper
+HANGING_RUN = """
+import sys
+sys.path[:0] = [{scraper_dir!r}, {tests_dir!r}]
+import config
+from fake_maps import make_scraper, reviews, scrape_settings
+for name, value in scrape_settings(config).items():
+    setattr(config, name, value)
+config.WEB_SCRAPE_PRIORITY_ORDER = False
+places = {{'A': reviews('a', 30), 'D': reviews('d', 20)}}
+make_scraper({output_dir!r}, places, faults={{'D': ['hang']}}).scrape_all_from_config()
+"""
+
+
+def run(output_dir, places, **kwargs):
+    scraper = make_scraper(output_dir, places)
+    scraper.scrape_all_from_config(**kwargs)
+    scraper.state.close()
+    return pd.read_csv(os.path.join(output_dir, 'pokhara_reviews.csv'), encoding='utf-8-sig')
+
+
+def test_incremental_run_adds_to_previous_output(tmp_path, scrape_config):
+    places = {'A': reviews('a', 30), 'D': reviews('d', 20)}
+    assert len(run(tmp_path, places)) == 50
+
+    # Two days later A has 5 new reviews on top; only those are scraped
+    places['A'] = reviews('new', 5) + places['A']
+    df = run(tmp_path, places)
+    assert len(df) == 55
+    assert df['review_text'].str.startswith('newramro').sum() == 5
+
+
+def test_failed_write_does_not_move_the_high_water_mark(tmp_path, scrape_config):
+    places = {'A': reviews('a', 30), 'D': reviews('d', 20)}
+    assert len(run(tmp_path, places)) == 50
+
+    places['A'] = reviews('new', 5) + places['A']
+    scraper = make_scraper(tmp_path, places)
+
+    def disk_full(rows):
+        raise OSError("No space left on device")
+
+    scraper.sink.write_reviews = disk_full
+    with pytest.raises(OSError):
+        scraper.scrape_all_from_config()
+    scraper.state.close()
+
+    # The new reviews never reached disk, so --resume must scrape them again
+    df = run(tmp_path, places, resume=True)
+    assert len(df) == 55
+
+
+def test_killed_run_keeps_finished_places(tmp_path, scrape_config):
+    script = HANGING_RUN.format(scraper_dir=os.path.dirname(TESTS_DIR), tests_dir=TESTS_DIR,
+                                output_dir=str(tmp_path))
+    child = subprocess.Popen([sys.executable, '-c', script],
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        # Wait until the run is stuck on D, then kill it
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            state = ScrapeStateStore.for_output_dir(str(tmp_path))
+            jobs = state.get_jobs()
+            state.close()
+            if jobs.get(('lakes', 'D'), {}).get('status') == 'running':
+                break
+            time.sleep(0.1)
+    finally:
+        child.kill()
+        child.wait()
+
+    # A is on disk and journaled done although the run never finished
+    interim = pd.read_csv(os.path.join(tmp_path, 'pokhara_reviews_interim.csv'), encoding='utf-8-sig')
+    assert len(interim) == 30
+    assert jobs[('hotels', 'A')]['status'] == 'done'
+    assert jobs[('lakes', 'D')]['status'] == 'running'
+
+    # --resume only scrapes D
+    places = {'A': reviews('a', 30), 'D': reviews('d', 20)}
+    scraper = make_scraper(tmp_path, places)
+    scraper.scrape_all_from_config(resume=True)
+    scraper.state.close()
+    assert len(scraper.fake_drivers) == 1
+    assert [place.place for place in scraper.fake_drivers] == ['D']
+    df = pd.read_csv(os.path.join(tmp_path, 'pokhara_reviews.csv'), encoding='utf-8-sig')
+    assert len(df) == 50
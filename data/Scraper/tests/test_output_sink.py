@@ -0,0 +1,59 @@
+import os
+
+import pandas as pd
+
+from output_sink import CsvStreamingSink
+from state_store import ScrapeStateStore
+
+
+def make_reviews(place, count, start=0):
+    return [{
+        'place_name': place,
+        'category': 'hotels',
+        'reviewer_name': f'user{i}',
+        'rating': 5,
+        'review_date': 'a week ago',
+        'review_text': f'ramro hotel {i}',
+        'is_code_switched': False,
+        'extraction_date': '2026-01-01 10:00:00',
+    } for i in range(start, start + count)]
+
+
+def final_rows(output_dir):
+    return len(pd.read_csv(os.path.join(output_dir, 'pokhara_reviews.csv'), encoding='utf-8-sig'))
+
+
+def run(output_dir, reviews):
+    """One scraper run: fresh interim files, append, compact"""
+    state = ScrapeStateStore.for_output_dir(str(output_dir))
+    sink = CsvStreamingSink(str(output_dir), state=state)
+    sink.reset()
+    written = sink.write_reviews(reviews)
+    sink.write_places([{'name': 'A', 'category': 'hotels'}])
+    sink.compact()
+    state.close()
+    return written
+
+
+def test_second_run_adds_to_the_final_csv(tmp_path):
+    assert run(tmp_path, make_reviews('A', 5)) == 5
+    assert final_rows(tmp_path) == 5
+
+    # The second run sees the old reviews again plus two new ones
+    assert run(tmp_path, make_reviews('A', 7)) == 2
+    assert final_rows(tmp_path) == 7
+
+    places = pd.read_csv(os.path.join(tmp_path, 'pokhara_places.csv'), encoding='utf-8-sig')
+    assert len(places) == 1
+
+
+def test_reset_keeps_rows_of_an_unfinished_run(tmp_path):
+    state = ScrapeStateStore.for_output_dir(str(tmp_path))
+    sink = CsvStreamingSink(str(tmp_path), state=state)
+    sink.reset()
+    sink.write_reviews(make_reviews('A', 3))
+    state.close()
+    # Crashed before compact(); the next fresh run starts with reset()
+
+    assert run(tmp_path, make_reviews('A', 2, start=3)) == 2
+    assert final_rows(tmp_path) == 5
@@ -0,0 +1,76 @@
+import os
+
+import pandas as pd
+import pytest
+
+import config
+from fake_maps import FakeMapsDriver, make_scraper, reviews
+from parallel_scraper import ScraperPool
+
+PLACES = {'A': reviews('a', 30), 'D': reviews('d', 20)}
+
+
+def final_reviews(output_dir):
+    df = pd.read_csv(os.path.join(output_dir, 'pokhara_reviews.csv'), encoding='utf-8-sig')
+    return sorted(df['review_text'])
+
+
+def test_pool_writes_the_same_reviews_as_one_browser(tmp_path, scrape_config):
+    single = make_scraper(tmp_path / 'single', PLACES)
+    single.scrape_all_from_config()
+    single.state.close()
+
+    pooled = make_scraper(tmp_path / 'pooled', PLACES)
+    pooled.scrape_all_from_config(pool_size=2)
+    jobs = pooled.state.get_jobs()
+    pooled.state.close()
+
+    assert len(pooled.fake_drivers) == 2
+    assert final_reviews(tmp_path / 'pooled') == final_reviews(tmp_path / 'single')
+    assert all(job['status'] == 'done' for job in jobs.values())
+
+
+def test_places_of_a_worker_without_browser_go_to_the_others(tmp_path, scrape_config):
+    scraper = make_scraper(tmp_path, PLACES)
+    drivers = []
+
+    def factory():
+        # The first session never starts, as when Chrome fails to launch
+        if not drivers:
+            drivers.append(None)
+            raise RuntimeError("chrome failed to start")
+        drivers.append(FakeMapsDriver(PLACES))
+        return drivers[-1]
+
+    scraper.driver_factory = factory
+    scraper.scrape_all_from_config(pool_size=2)
+    jobs = scraper.state.get_jobs()
+    scraper.state.close()
+
+    assert len(final_reviews(tmp_path)) == 50
+    assert all(job['status'] == 'done' for job in jobs.values())
+
+
+def test_places_are_journaled_failed_when_no_browser_starts(tmp_path, scrape_config):
+    scraper = make_scraper(tmp_path, PLACES)
+
+    def factory():
+        raise RuntimeError("chrome failed to start")
+
+    scraper.driver_factory = factory
+    scraper.scrape_all_from_config(pool_size=2)
+    jobs = scraper.state.get_jobs()
+    scraper.state.close()
+
+    assert set(jobs) == {('hotels', 'A'), ('lakes', 'D')}
+    for job in jobs.values():
+        assert job['status'] == 'failed'
+        assert job['last_error'].startswith('crash')
+
+
+def test_pool_refuses_a_shared_debugger_address(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'CHROME_DEBUGGER_ADDRESS', '127.0.0.1:9222')
+    pool = ScraperPool(str(tmp_path), pool_size=2)
+
+    with pytest.raises(ValueError):
+        pool.run({'hotels': ['A'], 'lakes': ['D']})
@@ -0,0 +1,53 @@
+import config
+from fake_maps import make_scraper, reviews
+
+
+def scrape(tmp_path, places, faults):
+    scraper = make_scraper(tmp_path, places, faults=faults)
+    scraper.scrape_all_from_config()
+    jobs = scraper.state.get_jobs()
+    scraper.state.close()
+    return scraper, jobs
+
+
+def test_place_without_reviews_is_not_retried(tmp_path, scrape_config):
+    scraper, jobs = scrape(tmp_path, {'A': reviews('a', 30), 'D': []}, {})
+
+    assert jobs[('lakes', 'D')]['attempts'] == 1
+    assert jobs[('lakes', 'D')]['last_error'].startswith('no_reviews')
+    # One outcome per place, and an empty place is not a blocking signal
+    assert list(scraper.breaker.outcomes) == [True, True]
+
+
+def test_slow_reviews_are_retried_as_a_timeout(tmp_path, scrape_config):
+    scraper, jobs = scrape(tmp_path, {'A': reviews('a', 30), 'D': reviews('d', 20)}, {'A': ['slow']})
+
+    assert jobs[('hotels', 'A')]['attempts'] == 2
+    assert jobs[('hotels', 'A')]['status'] == 'done'
+    assert len(scraper.fake_drivers) == 1
+
+
+def test_crashed_browser_is_restarted(tmp_path, scrape_config):
+    scraper, jobs = scrape(tmp_path, {'A': reviews('a', 30), 'D': reviews('d', 20)}, {'A': ['crash']})
+
+    assert jobs[('hotels', 'A')]['attempts'] == 2
+    assert jobs[('hotels', 'A')]['status'] == 'done'
+    assert len(scraper.fake_drivers) == 2
+
+
+def test_blocked_pages_are_retried_and_open_the_breaker(tmp_path, scrape_config, monkeypatch):
+    names = ['A', 'B', 'C', 'D', 'E']
+    monkeypatch.setattr(config, 'SPECIFIC_PLACES', {'hotels': names})
+    monkeypatch.setattr(config, 'WEB_SCRAPE_PRIORITY_ORDER', False)
+    # Every page of the first four places comes back empty, as when Google
+    # blocks the scraper
+    faults = {name: ['blank'] * 3 for name in names[:4]}
+    scraper, jobs = scrape(tmp_path, {name: reviews(name, 10) for name in names}, faults)
+
+    for name in names[:4]:
+        assert jobs[('hotels', name)]['attempts'] == 3
+        assert jobs[('hotels', name)]['last_error'].startswith('selector_missing')
+    assert scraper.breaker.generation == 1
+    # The breaker replaced the session before the last place, which worked
+    assert len(scraper.fake_drivers) == 2
+    assert jobs[('hotels', 'E')]['status'] == 'done'
@@ -0,0 +1,36 @@
+import pytest
+
+from review_buffer import ReviewBuffer
+from test_output_sink import make_reviews
+
+
+class FlakySink:
+    """Fails the first write, then records what it is given"""
+
+    def __init__(self):
+        self.failed = False
+        self.rows = []
+
+    def write_reviews(self, rows):
+        if not self.failed:
+            self.failed = True
+            raise OSError("No space left on device")
+        self.rows.extend(rows)
+        return len(rows)
+
+
+def test_failed_flush_keeps_rows_and_callbacks():
+    sink = FlakySink()
+    buffer = ReviewBuffer(sink, flush_size=100)
+    committed = []
+    buffer.add(make_reviews('A', 3), on_flushed=lambda: committed.append('A'))
+
+    with pytest.raises(OSError):
+        buffer.flush()
+    assert committed == []
+    assert len(buffer.pending) == 3
+
+    buffer.add(make_reviews('B', 2), on_flushed=lambda: committed.append('B'))
+    assert buffer.flush() == 5
+    assert committed == ['A', 'B']
+    assert [row.place_name for row in sink.rows] == ['A', 'A', 'A', 'B', 'B']
@@ -0,0 +1,114 @@
+import json
+import os
+
+import review_payloads
+from fake_maps import make_scraper
+from review_payloads import PayloadCache, parse_review_payload, review_responses
+
+URL = 'https://www.google.com/maps/rpc/listugcposts?page={}'
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def fixture_body(name):
+    with open(os.path.join(FIXTURES, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def entry(method, request_id, url=None):
+    params = {'requestId': request_id}
+    if url:
+        params['response'] = {'url': url}
+    return {'message': json.dumps({'message': {'method': method, 'params': params}})}
+
+
+def test_responses_in_request_order_after_the_log_was_read():
+    log = [
+        # Relevance batch: requested before the log was drained for the sort
+        entry('Network.responseReceived', '1', URL.format(0)),
+        entry('Network.requestWillBeSent', '2'),
+        entry('Network.requestWillBeSent', '3'),
+        # Second page answers first
+        entry('Network.responseReceived', '3', URL.format(2)),
+        entry('Network.loadingFinished', '3'),
+        entry('Network.responseReceived', '2', URL.format(1)),
+        entry('Network.loadingFinished', '2'),
+        entry('Network.requestWillBeSent', '4'),
+        entry('Network.responseReceived', '4', 'https://www.google.com/maps/vt/tile.png'),
+        # Headers are in, the body is still loading
+        entry('Network.requestWillBeSent', '5'),
+        entry('Network.responseReceived', '5', URL.format(3)),
+    ]
+    assert review_responses(log) == [('2', URL.format(1), True), ('3', URL.format(2), True),
+                                     ('5', URL.format(3), False)]
+
+
+def test_parse_listugcposts_body():
+    body = fixture_body('listugcposts_newest.txt')
+    rows = parse_review_payload(body, URL.format(1), 'Hotel Barahi', 'hotels', '2026-01-14 10:00:00')
+
+    assert [(r['reviewer_name'], r['rating'], r['review_date']) for r in rows] == [
+        ('Sujan Gurung', 5, '2 days ago'),
+        ('Emily Carter', 4, '4 days ago'),
+        ('राम बहादुर थापा', 5, 'a week ago'),
+        ('Anil Shrestha', 3, 'a week ago'),
+    ]
+    assert rows[0]['review_text'].startswith('Ekdam ramro hotel')
+    assert rows[0]['is_code_switched']
+    assert rows[2]['review_text'] == 'धेरै राम्रो ठाउँ, खाना पनि मिठो थियो।'
+    # A rating without text
+    assert rows[3]['review_text'] == ''
+    assert all(r['place_name'] == 'Hotel Barahi' and r['category'] == 'hotels' for r in rows)
+
+
+def test_replay_cached_payloads(tmp_path):
+    body = fixture_body('listugcposts_newest.txt')
+    cache = PayloadCache(str(tmp_path))
+    cache.save(URL.format(1), body, 'Hotel Barahi', 'hotels')
+
+    replayed = cache.replay_reviews()
+    assert [r['reviewer_name'] for r in replayed] == [
+        r['reviewer_name'] for r in parse_review_payload(body, URL.format(1), 'Hotel Barahi', 'hotels')]
+
+
+class LogDriver:
+    """Performance log with one finished and one still loading review batch"""
+
+    def __init__(self, body):
+        self.body = body
+
+    def get_log(self, kind):
+        return [
+            entry('Network.requestWillBeSent', '1'),
+            entry('Network.responseReceived', '1', URL.format(1)),
+            entry('Network.loadingFinished', '1'),
+            entry('Network.requestWillBeSent', '2'),
+            entry('Network.responseReceived', '2', URL.format(2)),
+        ]
+
+    def execute_cdp_cmd(self, command, params):
+        return {'body': self.body, 'base64Encoded': False}
+
+
+def test_unfinished_batch_falls_back_to_the_page(tmp_path, scrape_config):
+    scraper = make_scraper(tmp_path, {})
+    scraper.driver = LogDriver(fixture_body('listugcposts_newest.txt'))
+    scraper.payload_cache = PayloadCache(str(tmp_path / 'xhr_cache'))
+
+    assert scraper.collect_review_payloads('Hotel Barahi', 'hotels') == []
+    scraper.state.close()
+
+
+def test_replay_keeps_capture_order_within_one_second(tmp_path):
+    body = fixture_body('listugcposts_newest.txt')
+    data = json.loads(body[len(")]}'"):])
+    cache = PayloadCache(str(tmp_path))
+    # Pages of one place, saved in request order within the same second
+    for page in range(5):
+        data[2] = data[2][1:] + data[2][:1]
+        cache.save(URL.format(page), ")]}'\n" + json.dumps(data), 'Hotel Barahi', 'hotels')
+    assert [entry['url'] for entry in cache.replay()] == [URL.format(page) for page in range(5)]
+
+    # A later run continues the sequence
+    review_payloads._next_sequence.clear()
+    PayloadCache(str(tmp_path)).save(URL.format(9), body, 'Hotel Barahi', 'hotels')
+    assert cache.replay()[-1]['url'] == URL.format(9)
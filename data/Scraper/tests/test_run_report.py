@@ -0,0 +1,35 @@
+import json
+import os
+
+from fake_maps import FakeMapsDriver, make_scraper, reviews
+
+
+def test_run_report_has_wait_timings(tmp_path, scrape_config):
+    scraper = make_scraper(tmp_path, {'A': reviews('a', 30), 'D': reviews('d', 20)})
+    scraper.scrape_all_from_config()
+    scraper.state.close()
+
+    with open(os.path.join(tmp_path, 'run_report.json'), encoding='utf-8') as f:
+        report = json.load(f)
+    assert report['waits']['reviews_loaded']['count'] == 2
+    assert all(place['waits'] for place in report['places'])
+
+
+class NetworkLogDriver(FakeMapsDriver):
+    """Each read of the performance log holds one finished 5000-byte cross-origin response"""
+
+    def get_log(self, kind):
+        message = {'message': {'method': 'Network.loadingFinished',
+                               'params': {'requestId': '1', 'encodedDataLength': 5000}}}
+        return [{'message': json.dumps(message)}]
+
+
+def test_page_weight_counts_network_log_bytes(tmp_path, scrape_config):
+    places = {'A': reviews('a', 30), 'D': reviews('d', 20)}
+    scraper = make_scraper(tmp_path, places)
+    scraper.driver_factory = lambda: NetworkLogDriver(places)
+    scraper.scrape_all_from_config()
+    scraper.state.close()
+
+    # Resource timings would report 0 bytes for cross-origin responses
+    assert [(row['page_bytes'], row['page_requests']) for row in scraper.places_data] == [(5000, 1)] * 2
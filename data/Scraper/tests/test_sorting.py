@@ -0,0 +1,16 @@
+from fake_maps import FakeMapsDriver, make_scraper, reviews
+
+
+def test_sort_waits_for_the_resorted_list(tmp_path, scrape_config):
+    places = {'A': reviews('a', 30)}
+    driver = FakeMapsDriver(places, sort_delay=0.3)
+    scraper = make_scraper(tmp_path, places)
+    scraper.driver_factory = lambda: driver
+    scraper.setup_driver()
+    driver.get('https://www.google.com/maps/search/A Pokhara')
+    assert scraper.open_reviews_tab()
+
+    assert scraper.sort_reviews_by_newest()
+    # The newest review is on top as soon as the sort returns
+    assert driver.cards()[0] == places['A'][0]
+    scraper.state.close()
@@ -0,0 +1,19 @@
+import os
+
+import pandas as pd
+
+import config
+from fake_maps import make_scraper, reviews
+
+
+def test_harvest_reads_expanded_cards_up_to_the_target(tmp_path, scrape_config, monkeypatch):
+    monkeypatch.setattr(config, 'WEB_SCRAPE_STREAMING', True)
+    monkeypatch.setattr(config, 'WEB_SCRAPE_MAX_REVIEWS', 25)
+    scraper = make_scraper(tmp_path, {'A': reviews('a', 40), 'D': reviews('d', 8)})
+    scraper.scrape_all_from_config()
+    scraper.state.close()
+
+    df = pd.read_csv(os.path.join(tmp_path, 'pokhara_reviews.csv'), encoding='utf-8-sig')
+    # Scrolling loads 30 cards of A, but only the 25 newest are kept
+    assert df['place_name'].value_counts().to_dict() == {'A': 25, 'D': 8}
+    assert not df['review_text'].str.endswith('…').any()